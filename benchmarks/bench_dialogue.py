@@ -0,0 +1,68 @@
+"""Benchmark: drawing a long NPC message in the dialogue box.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_dialogue
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE
+from zelda_miloutte.ui.dialogue_box import DialogueBox
+
+FRAMES = 600
+MESSAGE = ("Long ago the three crystals kept the valley safe, but the Phantom Lord "
+           "shattered the temple seals and scattered them across the land. Find them, "
+           "and the forest temple will open under the full moon once more.")
+
+
+def legacy_wrapped(surface, font, text, x, y, max_width):
+    """The previous wrap: a render per word prefix, then a render per line."""
+    lines = []
+    current_line = ""
+    for word in text.split(' '):
+        test_line = current_line + word + " " if current_line else word + " "
+        if font.render(test_line, True, WHITE).get_width() <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line.rstrip())
+            current_line = word + " "
+    if current_line:
+        lines.append(current_line.rstrip())
+    for i, line in enumerate(lines):
+        surface.blit(font.render(line, True, WHITE), (x, y + i * font.get_height()))
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    box = DialogueBox()
+    box.show("Hermit", [MESSAGE])
+    box.advance()   # fully revealed
+    width = box.width - 2 * box.padding
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        legacy_wrapped(screen, box.font, MESSAGE, box.x + box.padding, box.y, width)
+    legacy_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        box._draw_wrapped_text(screen, MESSAGE, box.x + box.padding, box.y, width)
+    cached_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    print(f"legacy wrap: {legacy_ms:6.3f} ms")
+    print(f"cached wrap: {cached_ms:6.3f} ms  ({legacy_ms / cached_ms:.0f}x)  "
+          f"budget={1000.0 / FPS:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark: headless PlayState soak run driven by scripted input.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_gameplay [--frames N] [--area AREA] [--seed S] [--no-render]
+"""
+
+import argparse
+import time
+
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput, random_script
+from zelda_miloutte.settings import FPS
+
+
+def run(frames, area="overworld", seed=0, render=True):
+    """Simulate *frames* frames; return (wall seconds, sorted per-frame CPU times)."""
+    from zelda_miloutte.states.play_state import PlayState
+    game = Game(headless=True, input_script=ScriptedInput(random_script(frames, seed=seed)))
+    game.push_state(PlayState(game, area_id=area))
+    start = time.perf_counter()
+    frame_times = sorted(game.simulate(frames, render=render))
+    return time.perf_counter() - start, frame_times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=FPS * 60)
+    parser.add_argument("--area", default="overworld")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-render", action="store_true")
+    args = parser.parse_args(argv)
+
+    wall, frame_times = run(args.frames, args.area, args.seed, not args.no_render)
+    simulated = len(frame_times) / FPS
+
+    def pct(p):
+        return frame_times[min(len(frame_times) - 1, int(len(frame_times) * p))] * 1000
+
+    print(f"area={args.area} frames={len(frame_times)} simulated={simulated:.1f}s "
+          f"wall={wall:.2f}s ({simulated / wall:.1f}x real time)")
+    print(f"frame cpu: median={pct(0.5):.2f} ms p95={pct(0.95):.2f} ms "
+          f"p99={pct(0.99):.2f} ms max={frame_times[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark: HUD cost per frame, idle and with a value changing every frame.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_hud
+
+"full redraw" invalidates the HUD every frame, which is what the previous
+immediate-mode HUD paid on every frame.
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte.entities.player import Player
+from zelda_miloutte.hud import HUD
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+
+FRAMES = 1200
+
+
+class _Boss:
+    alive = True
+    dying = False
+    max_hp = 400
+    hp = 400
+    phase = 1
+
+
+def _time(step, frames):
+    start = time.perf_counter()
+    for i in range(frames):
+        step(i)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    player = Player(100, 100)
+    player.status_effects["poison"] = {"timer": 30.0}
+    boss = _Boss()
+    hud = HUD()
+
+    def full(i):
+        hud.invalidate()
+        hud.draw(screen, player, boss)
+
+    def idle(i):
+        hud.draw(screen, player, boss)
+
+    def stamina(i):
+        player.stamina = (i % 100) / 100 * player.max_stamina
+        hud.draw(screen, player, boss)
+
+    full_ms = _time(full, frames)
+    idle_ms = _time(idle, frames)
+    stamina_ms = _time(stamina, frames)
+    print(f"full redraw:      {full_ms:6.3f} ms")
+    print(f"idle:             {idle_ms:6.3f} ms  ({full_ms / idle_ms:.1f}x)")
+    print(f"stamina changing: {stamina_ms:6.3f} ms  budget={1000.0 / FPS:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: night overlay with the player lantern and many world lights.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_lighting
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte.lighting import CAMPFIRE_LIGHT, TORCH_LIGHT, FIRE_PROJECTILE_LIGHT
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from zelda_miloutte.time_system import TimeSystem, LIGHT_RADIUS_LANTERN
+
+FRAMES = 300
+
+
+def legacy_night_overlay(overlay, px, py, color):
+    """The previous lantern pass: 40 circles and a full-screen glow surface per frame."""
+    overlay.fill(color)
+    radius = LIGHT_RADIUS_LANTERN
+    light_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    steps = 20
+    for i in range(steps):
+        t = i / steps
+        r = int(radius * (1.0 - t))
+        if r > 0:
+            pygame.draw.circle(light_surf, (0, 0, 0, int(color[3] * (1.0 - t * t))),
+                               (radius, radius), r)
+    overlay.fill(color)
+    for i in range(steps, 0, -1):
+        t = i / steps
+        r = int(radius * t)
+        if r > 0:
+            pygame.draw.circle(overlay, (*color[:3], int(color[3] * (1.0 - t * t))),
+                               (int(px), int(py)), r)
+    glow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    for i in range(5):
+        t = i / 5
+        pygame.draw.circle(glow_surf, (255, 180, 80, int(15 * (1.0 - t))),
+                           (int(px), int(py)), int((radius + 20) * (1.0 - t)))
+    overlay.blit(glow_surf, (0, 0))
+
+
+def _time(fn, frames):
+    start = time.perf_counter()
+    for i in range(frames):
+        fn(i)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    ts = TimeSystem(game_hour=23.0)
+    px, py = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
+    # Two campfires, four lit torches and six fireballs in view
+    lights = [(120, 140, *CAMPFIRE_LIGHT), (620, 420, *CAMPFIRE_LIGHT)]
+    lights += [(100 + 180 * i, 80, *TORCH_LIGHT) for i in range(4)]
+    lights += [(px + 40 * i, py - 60, *FIRE_PROJECTILE_LIGHT) for i in range(6)]
+
+    def legacy(i):
+        legacy_night_overlay(overlay, px + i % 7, py, (10, 10, 60, 120))
+        screen.blit(overlay, (0, 0))
+
+    legacy_ms = _time(legacy, frames)
+    one_ms = _time(lambda i: ts.draw_overlay(screen, px + i % 7, py, True), frames)
+    many_ms = _time(lambda i: ts.draw_overlay(screen, px + i % 7, py, True, lights), frames)
+
+    print(f"legacy lantern: {legacy_ms:6.2f} ms")
+    print(f"lantern:        {one_ms:6.2f} ms  ({legacy_ms / one_ms:.1f}x)")
+    print(f"+{len(lights)} lights:     {many_ms:6.2f} ms  budget={1000.0 / FPS:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: minimap reveal + draw while walking across a large area.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_minimap
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, FPS
+from zelda_miloutte.ui.minimap import Minimap, TILE_COLORS, MINIMAP_FOG_COLOR
+
+FRAMES = 1200
+COLS, ROWS = 120, 90
+
+
+class _TileMap:
+    cols = COLS
+    rows = ROWS
+    data = [[(c * 7 + r * 3) % 19 for c in range(COLS)] for r in range(ROWS)]
+
+
+class _Player:
+    center_x = 0.0
+    center_y = 0.0
+
+
+def legacy_frame(state, surface, tilemap, px, py):
+    """The previous minimap: a set of tuples and a full fog rebuild per reveal."""
+    visited = state.setdefault("visited", set())
+    old = len(visited)
+    pc, pr = int(px) // TILE_SIZE, int(py) // TILE_SIZE
+    for row in range(max(0, pr - 5), min(tilemap.rows, pr + 6)):
+        for col in range(max(0, pc - 5), min(tilemap.cols, pc + 6)):
+            visited.add((col, row))
+    size = (tilemap.cols + 4, tilemap.rows + 4)
+    if "tiles" not in state:
+        tiles = pygame.Surface(size, pygame.SRCALPHA)
+        for row in range(tilemap.rows):
+            for col in range(tilemap.cols):
+                color = TILE_COLORS.get(tilemap.data[row][col], (60, 60, 60))
+                tiles.set_at((col + 2, row + 2), (*color, 255))
+        state["tiles"] = tiles
+    if len(visited) != old or "fog" not in state:
+        fog = pygame.Surface(size, pygame.SRCALPHA)
+        for row in range(tilemap.rows):
+            for col in range(tilemap.cols):
+                if (col, row) not in visited:
+                    fog.set_at((col + 2, row + 2), (*MINIMAP_FOG_COLOR, 255))
+        state["fog"] = fog
+    frame = state["tiles"].copy()
+    frame.blit(state["fog"], (0, 0))
+    surface.blit(frame, (SCREEN_WIDTH - size[0] - 8, 44))
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    tilemap = _TileMap()
+    player = _Player()
+    speed = COLS * TILE_SIZE / frames    # cross the map once
+
+    def path(i):
+        return i * speed, (ROWS // 2 + (i // 60) % 10) * TILE_SIZE
+
+    state = {}
+    start = time.perf_counter()
+    for i in range(frames):
+        legacy_frame(state, screen, tilemap, *path(i))
+    legacy_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    minimap = Minimap()
+    start = time.perf_counter()
+    for i in range(frames):
+        player.center_x, player.center_y = path(i)
+        minimap.reveal_tiles("bench", player.center_x, player.center_y, tilemap)
+        minimap.draw(screen, tilemap, player, [], [], [], "bench")
+    bitmap_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    saved = minimap.get_save_data()["bench"]
+    print(f"legacy minimap: {legacy_ms:6.3f} ms")
+    print(f"bitmap minimap: {bitmap_ms:6.3f} ms  ({legacy_ms / bitmap_ms:.0f}x)  "
+          f"budget={1000.0 / FPS:.2f} ms")
+    print(f"save data: {len(saved['runs'])} runs vs {len(state['visited'])} coordinate pairs")
+
+
+if __name__ == "__main__":
+    main()
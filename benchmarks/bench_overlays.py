@@ -0,0 +1,66 @@
+"""Benchmark: a combat frame's stacked overlays (vignette + flash + dim).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_overlays
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte import overlays
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+
+FRAMES = 600
+
+
+def legacy_frame(surface, alpha):
+    """The previous passes: three new full-screen surfaces per frame."""
+    vig_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    edge = 40
+    for i in range(edge):
+        a = int(alpha * (1 - i / edge))
+        vig_surf.fill((200, 0, 0, a), (0, i, SCREEN_WIDTH, 1))
+        vig_surf.fill((200, 0, 0, a), (0, SCREEN_HEIGHT - 1 - i, SCREEN_WIDTH, 1))
+        vig_surf.fill((200, 0, 0, a), (i, 0, 1, SCREEN_HEIGHT))
+        vig_surf.fill((200, 0, 0, a), (SCREEN_WIDTH - 1 - i, 0, 1, SCREEN_HEIGHT))
+    surface.blit(vig_surf, (0, 0))
+    flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    flash_surf.fill((255, 255, 255, alpha))
+    surface.blit(flash_surf, (0, 0))
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, alpha))
+    surface.blit(overlay, (0, 0))
+
+
+def cached_frame(surface, alpha):
+    overlays.draw_vignette(surface, (200, 0, 0), alpha)
+    overlays.draw_fill(surface, (255, 255, 255), alpha)
+    overlays.draw_fill(surface, (0, 0, 0), alpha)
+
+
+def _time(fn, screen, frames):
+    start = time.perf_counter()
+    for i in range(frames):
+        fn(screen, 20 + i % 60)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    legacy_ms = _time(legacy_frame, screen, frames)
+    cached_ms = _time(cached_frame, screen, frames)
+    print(f"legacy overlays: {legacy_ms:6.2f} ms")
+    print(f"cached overlays: {cached_ms:6.2f} ms  ({legacy_ms / cached_ms:.1f}x)  "
+          f"budget={1000.0 / FPS:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
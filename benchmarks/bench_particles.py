@@ -0,0 +1,69 @@
+"""Benchmark: sustain 5,000 particles through ParticleSystem update + draw.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_particles
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte import particles as particles_mod
+from zelda_miloutte.particles import ParticleSystem
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+
+TARGET_PARTICLES = 5000
+FRAMES = 600
+LIFETIME = (1.0, 2.0)
+
+
+class _Camera:
+    x = 0.0
+    y = 0.0
+
+
+def run(frames=FRAMES):
+    """Keep TARGET_PARTICLES alive for *frames* frames; return ms per frame."""
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    ps = ParticleSystem()
+    camera = _Camera()
+    dt = 1.0 / FPS
+    colors = [(255, 120, 30), (255, 200, 50), (120, 220, 100), (255, 255, 255)]
+
+    def top_up():
+        missing = TARGET_PARTICLES - len(ps)
+        while missing > 0:
+            burst = min(missing, 40)
+            ps.emit(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, count=burst, color=colors,
+                    speed_range=(20, 200), lifetime_range=LIFETIME,
+                    size_range=(1, 6), gravity=60)
+            missing -= burst
+
+    top_up()
+    start = time.perf_counter()
+    for _ in range(frames):
+        top_up()
+        ps.update(dt)
+        screen.fill((0, 0, 0))
+        ps.draw(screen, camera)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    backend = "numpy" if particles_mod.np is not None else "python"
+    ms = run()
+    budget = 1000.0 / FPS
+    print(f"backend={backend} particles={TARGET_PARTICLES} "
+          f"frame={ms:.2f} ms budget={budget:.2f} ms "
+          f"-> {'OK' if ms <= budget else 'OVER BUDGET'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark: 3D dungeon ray casting, wall passes and sprites.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_raycaster
+"""
+
+import math
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte import raycaster as raycaster_mod
+from zelda_miloutte.raycaster import (
+    Raycaster, WALL_COLORS, FOG_COLOR, CEILING_COLOR, FLOOR_COLOR, MAX_DEPTH,
+)
+from zelda_miloutte.settings import FPS
+from zelda_miloutte.states.dungeon3d_state import (
+    DUNGEON_3D_MAP, PLAYER_START, PLAYER_START_ANGLE,
+)
+
+FRAMES = 300
+
+
+def legacy_wall_pass(rc, dists, wall_types, sides, wall_xs):
+    """The previous renderer: 600 gradient lines plus one draw.rect per strip."""
+    surf = rc.surface
+    surf.fill(FOG_COLOR)
+    half_h = rc.height // 2
+    for y in range(half_h):
+        t = y / half_h
+        color = tuple(int(CEILING_COLOR[i] * t + FOG_COLOR[i] * (1 - t)) for i in range(3))
+        pygame.draw.line(surf, color, (0, y), (rc.width, y))
+    for y in range(half_h, rc.height):
+        t = (y - half_h) / half_h
+        color = tuple(int(FLOOR_COLOR[i] * t + FOG_COLOR[i] * (1 - t)) for i in range(3))
+        pygame.draw.line(surf, color, (0, y), (rc.width, y))
+    for i, (dist, wall_type, side) in enumerate(zip(dists, wall_types, sides)):
+        if dist >= MAX_DEPTH:
+            continue
+        wall_height = min(int(rc.height / dist), rc.height * 4)
+        draw_start = half_h - wall_height // 2
+        draw_end = half_h + wall_height // 2
+        color = WALL_COLORS.get(wall_type, WALL_COLORS[1])
+        if side == 1:
+            color = tuple(max(0, c - 35) for c in color)
+        fog = min(1.0, dist / MAX_DEPTH)
+        color = tuple(int(c * (1 - fog) + FOG_COLOR[ci] * fog) for ci, c in enumerate(color))
+        pygame.draw.rect(surf, color, (i * rc.strip_width, draw_start,
+                                       rc.strip_width, draw_end - draw_start))
+
+
+def batched_wall_pass(rc, dists, wall_types, sides, wall_xs):
+    rc.surface.blit(raycaster_mod.get_background(rc.width, rc.height), (0, 0))
+    rc._draw_walls(dists, wall_types, sides)
+
+
+def textured_wall_pass(rc, dists, wall_types, sides, wall_xs):
+    rc.surface.blit(raycaster_mod.get_background(rc.width, rc.height), (0, 0))
+    rc._draw_textured_walls(dists, wall_types, sides, wall_xs)
+
+
+def _time(fn, frames):
+    start = time.perf_counter()
+    for i in range(frames):
+        fn(i)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    screen = pygame.display.set_mode((1, 1))
+    rc = Raycaster(DUNGEON_3D_MAP)
+    # Walk forward while turning, so wall heights keep changing
+    path = [(PLAYER_START[0] + 0.01 * i, PLAYER_START[1] + 0.005 * i) for i in range(frames)]
+    px, py = PLAYER_START
+    angles = [PLAYER_START_ANGLE + i * 0.02 for i in range(frames)]
+    casts = [rc.cast_ray_arrays(*path[i], a) for i, a in enumerate(angles)]
+    casts = [tuple(list(c) for c in cast) for cast in casts]
+
+    backend = "numpy" if raycaster_mod.np is not None else "python"
+    cast_ms = _time(lambda i: rc.cast_ray_arrays(px, py, angles[i]), frames)
+    py_cast_ms = _time(lambda i: rc._cast_rays_py(px, py, angles[i]), frames)
+    legacy_ms = _time(lambda i: legacy_wall_pass(rc, *casts[i]), frames)
+    batched_ms = _time(lambda i: batched_wall_pass(rc, *casts[i]), frames)
+    textured_ms = _time(lambda i: textured_wall_pass(rc, *casts[i]), frames)
+    target = pygame.Surface((rc.width, rc.height))
+    render_ms = _time(lambda i: rc.render(target, *path[i], angles[i]), frames)
+
+    # A close-up textured boss plus a few colored enemies, with health bars
+    boss = pygame.Surface((32, 32), pygame.SRCALPHA)
+    pygame.draw.circle(boss, (150, 40, 200), (16, 16), 15)
+
+    def sprites(i):
+        a = angles[i]
+        x, y = path[i]
+        ahead = (x + 1.3 * math.cos(a), y + 1.3 * math.sin(a))
+        return [(ahead[0], ahead[1], (0, 0, 0), 1.2, boss, 0.6)] + [
+            (x + d * math.cos(a + 0.2), y + d * math.sin(a + 0.2), (200, 60, 60), 0.6, None, 0.5)
+            for d in (2.0, 3.0, 4.5)]
+
+    sprite_ms = _time(lambda i: rc.render(target, *path[i], angles[i], sprites(i)), frames)
+
+    print(f"backend={backend} rays={rc.num_rays} strip={rc.strip_width}px")
+    print(f"cast:      {cast_ms:6.2f} ms  (python DDA {py_cast_ms:6.2f} ms)")
+    print(f"wall pass: {batched_ms:6.2f} ms  (per-strip draw calls {legacy_ms:6.2f} ms, "
+          f"{legacy_ms / batched_ms:.1f}x)")
+    print(f"textured:  {textured_ms:6.2f} ms  (strip cache {len(rc._strip_cache)} entries, "
+          f"{rc._strip_cache_bytes / 1024 / 1024:.1f} MB)")
+    print(f"render:    {render_ms:6.2f} ms  budget={1000.0 / FPS:.2f} ms")
+    print(f"+sprites:  {sprite_ms:6.2f} ms  (close-up boss and 3 enemies)")
+    del screen
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark: synthesize each music track with the NumPy and pure-Python backends.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_synthesis
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte import sounds as sounds_mod
+from zelda_miloutte.sounds import SoundManager
+
+TRACKS = ("title", "overworld", "dungeon", "forest", "desert", "volcano", "boss")
+
+
+def _synth_manager():
+    """A SoundManager that skips startup synthesis and the audio cache."""
+    sm = SoundManager.__new__(SoundManager)
+    sm.sample_rate = 22050
+    sm._audio_cache = None
+    return sm
+
+
+def time_track(sm, track):
+    """Return (seconds, raw PCM) for one synthesis of *track*."""
+    build = getattr(sm, f"_generate_{track}_music")
+    start = time.perf_counter()
+    sound = build()
+    return time.perf_counter() - start, sound.get_raw()
+
+
+def main():
+    pygame.mixer.init(frequency=22050, size=-16, channels=1)
+    numpy = sounds_mod.np
+    if numpy is None:
+        print("NumPy not installed: only the pure-Python backend is available")
+        return
+    sm = _synth_manager()
+    total_np = total_py = 0.0
+    for track in TRACKS:
+        np_time, np_pcm = time_track(sm, track)
+        sounds_mod.np = None
+        try:
+            py_time, py_pcm = time_track(sm, track)
+        finally:
+            sounds_mod.np = numpy
+        total_np += np_time
+        total_py += py_time
+        diff = numpy.abs(numpy.frombuffer(np_pcm, numpy.int16).astype(int)
+                         - numpy.frombuffer(py_pcm, numpy.int16).astype(int))
+        print(f"{track:<10} python={py_time * 1000:8.1f} ms numpy={np_time * 1000:7.1f} ms "
+              f"speedup={py_time / np_time:6.1f}x max_diff={diff.max()}")
+    print(f"{'total':<10} python={total_py * 1000:8.1f} ms numpy={total_np * 1000:7.1f} ms "
+          f"speedup={total_py / total_np:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
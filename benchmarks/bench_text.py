@@ -0,0 +1,77 @@
+"""Benchmark: drawing floating damage numbers during heavy combat.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_text
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from zelda_miloutte.ui.floating_text import FloatingText
+
+FRAMES = 600
+TEXTS = 48
+
+
+class _Camera:
+    x = 0.0
+    y = 0.0
+
+
+def legacy_draw(ft, surface, fonts):
+    """The previous FloatingText.draw: a render and an alpha change per frame."""
+    font = fonts.get(ft.size)
+    if font is None:
+        font = fonts[ft.size] = pygame.font.Font(None, ft.size)
+    alpha = max(0, int(255 * (1.0 - ft.timer / ft.duration)))
+    text_surf = font.render(ft.text, True, ft.color)
+    text_surf.set_alpha(alpha)
+    surface.blit(text_surf, (int(ft.x) - text_surf.get_width() // 2, int(ft.y)))
+
+
+def _texts(rng):
+    texts = []
+    for _ in range(TEXTS):
+        x, y = rng.uniform(50, SCREEN_WIDTH - 50), rng.uniform(50, SCREEN_HEIGHT - 50)
+        if rng.random() < 0.8:
+            texts.append(FloatingText(str(rng.randint(1, 40)), x, y, duration=10.0))
+        else:
+            texts.append(FloatingText(f"+{rng.randint(5, 50)} XP", x, y,
+                                      (100, 200, 255), duration=10.0))
+    return texts
+
+
+def _time(draw, frames):
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    texts = _texts(random.Random(1))
+    dt = 1.0 / FPS
+    start = time.perf_counter()
+    for _ in range(frames):
+        for ft in texts:
+            ft.update(dt / 10)
+            draw(ft, screen)
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main(frames=FRAMES):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    camera = _Camera()
+    fonts = {}
+    legacy_ms = _time(lambda ft, s: legacy_draw(ft, s, fonts), frames)
+    cached_ms = _time(lambda ft, s: ft.draw(s, camera), frames)
+    print(f"legacy {TEXTS} texts: {legacy_ms:6.2f} ms")
+    print(f"cached {TEXTS} texts: {cached_ms:6.2f} ms  ({legacy_ms / cached_ms:.1f}x)  "
+          f"budget={1000.0 / FPS:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark: A* and cover search on the TileMap flag grids vs per-tile lookups.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tilemap_grids
+
+"tile lookups" patches in the pre-grid walkability checks, which rebuilt
+TileType.solid's tuple for every tile visited.
+"""
+
+import random
+import time
+
+from zelda_miloutte import pathfinding
+from zelda_miloutte.pathfinding import (
+    find_path, find_cover_position, reset_pathfind_budget, tile_to_pixel,
+)
+from zelda_miloutte.world.tile import TileType, HAZARD_TILES
+from zelda_miloutte.world.tilemap import TileMap
+
+REPEATS = 5
+PAIRS = 40
+
+
+def _legacy_solid(tile):
+    return tile in (
+        TileType.WALL, TileType.TREE, TileType.ROCK, TileType.WATER, TileType.PIT,
+        TileType.BARRIER_RED, TileType.BARRIER_BLUE, TileType.FROZEN_WALL,
+        TileType.CRACKED_WALL,
+    )
+
+
+def legacy_is_solid(tilemap, col, row):
+    return _legacy_solid(tilemap.get_tile(col, row))
+
+
+def legacy_is_walkable(tilemap, col, row, avoid_hazards=True):
+    if col < 0 or row < 0 or row >= tilemap.rows or col >= tilemap.cols:
+        return False
+    tile = tilemap.get_tile(col, row)
+    if _legacy_solid(tile):
+        return False
+    if avoid_hazards and tile in HAZARD_TILES:
+        return False
+    return True
+
+
+def maze(cols=60, rows=45, seed=3):
+    rng = random.Random(seed)
+    tiles = [0, 0, 0, 0, 0, 1, 2, 9, 18]  # grass-heavy with walls, trees, spikes, lava
+    data = [[rng.choice(tiles) for _ in range(cols)] for _ in range(rows)]
+    for row in data:
+        row[0] = row[-1] = 1
+    data[0] = [1] * cols
+    data[-1] = [1] * cols
+    return data
+
+
+def _workload():
+    tm = TileMap(maze())
+    rng = random.Random(11)
+    walkable = [(c, r) for r in range(tm.rows) for c in range(tm.cols) if tm.is_walkable(c, r)]
+    pairs = [(rng.choice(walkable), rng.choice(walkable)) for _ in range(PAIRS)]
+
+    def run():
+        out = []
+        for (sc, sr), (gc, gr) in pairs:
+            reset_pathfind_budget()
+            out.append(find_path(tm, *tile_to_pixel(sc, sr), *tile_to_pixel(gc, gr)))
+            out.append(find_cover_position(tm, *tile_to_pixel(sc, sr), *tile_to_pixel(gc, gr)))
+        return out
+    return run
+
+
+def _best_of(fn, repeats=REPEATS):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    run = _workload()
+    fast_time, fast = _best_of(run)
+    saved = pathfinding._is_walkable, TileMap.is_solid
+    pathfinding._is_walkable, TileMap.is_solid = legacy_is_walkable, legacy_is_solid
+    try:
+        slow_time, slow = _best_of(run)
+    finally:
+        pathfinding._is_walkable, TileMap.is_solid = saved
+    assert fast == slow, "grid and tile-lookup searches disagree"
+    print(f"A* + cover search: grids {fast_time * 1000:.1f} ms, "
+          f"tile lookups {slow_time * 1000:.1f} ms ({slow_time / fast_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark: weather update + draw at full intensity, per weather type.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_weather
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from zelda_miloutte.weather import WeatherManager, WeatherType
+
+FRAMES = 600
+
+
+class _Camera:
+    x = 0.0
+    y = 0.0
+
+
+def legacy_fog(surface, intensity):
+    """The previous fog pass: a new full-screen surface and ~20 circles per frame."""
+    fog = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    fog_alpha = int(160 * intensity)
+    fog.fill((200, 200, 210, fog_alpha))
+    clear_radius = int(150 * (1.0 - intensity * 0.3))
+    fade_radius = clear_radius + 80
+    for r in range(fade_radius, clear_radius, -4):
+        t = (r - clear_radius) / (fade_radius - clear_radius)
+        pygame.draw.circle(fog, (200, 200, 210, int(fog_alpha * (1.0 - t))),
+                           (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), r)
+    pygame.draw.circle(fog, (0, 0, 0, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), clear_radius)
+    surface.blit(fog, (0, 0))
+
+
+def run(weather_type, frames=FRAMES):
+    """Return (ms per frame, live particles at the end) for *weather_type*."""
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    wm = WeatherManager()
+    wm.current_weather = wm.target_weather = weather_type
+    wm.intensity = wm.target_intensity = 1.0
+    wm._change_timer = float("inf")
+    camera = _Camera()
+    dt = 1.0 / FPS
+    for _ in range(FPS * 3):    # reach a steady particle count first
+        wm.update(dt)
+    start = time.perf_counter()
+    for i in range(frames):
+        if weather_type == WeatherType.STORM and i % 20 == 0:
+            wm._lightning_flash_alpha = 200
+        wm.update(dt)
+        wm.draw(screen, camera)
+    return (time.perf_counter() - start) * 1000.0 / frames, len(wm._particles)
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    for weather_type in (WeatherType.RAIN, WeatherType.STORM, WeatherType.FOG,
+                         WeatherType.SANDSTORM, WeatherType.ASH_FALL, WeatherType.BLIZZARD):
+        ms, live = run(weather_type)
+        print(f"{weather_type.value:10s} {ms:6.2f} ms  ({live} particles)")
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        legacy_fog(screen, 1.0 - (i % 2) * 0.001)
+    legacy_ms = (time.perf_counter() - start) * 1000.0 / FRAMES
+    print(f"legacy fog {legacy_ms:6.2f} ms  budget={1000.0 / FPS:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
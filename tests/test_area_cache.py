@@ -0,0 +1,114 @@
+"""Tests for the suspended-area LRU cache and area re-entry."""
+
+import pygame
+import pytest
+from zelda_miloutte import area_cache as area_cache_mod
+from zelda_miloutte.area_cache import AreaCache, estimate_area_bytes
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput
+from zelda_miloutte.states import play_state as play_state_mod
+from zelda_miloutte.states.play_state import PlayState
+
+
+class _FakeTileMap:
+    def __init__(self, nbytes):
+        surf = pygame.Surface((nbytes // 4, 1), pygame.SRCALPHA)
+        self._chunk_cache = {(0, 0): surf}
+
+
+class _FakeArea:
+    def __init__(self, area_id, nbytes=400):
+        self.area_id = area_id
+        self.tilemap = _FakeTileMap(nbytes)
+
+
+@pytest.fixture
+def game():
+    game = Game(headless=True, input_script=ScriptedInput())
+    game.push_state(PlayState(game))
+    return game
+
+
+def _travel(state, area_id):
+    load_data, minimap_data = state._carry_over_data()
+    new_state = state._area_state(area_id, load_data, minimap_data)
+    state._switch_to(new_state)
+    return new_state
+
+
+class TestAreaCache:
+    def test_lru_eviction_by_count(self):
+        cache = AreaCache(max_areas=2, max_bytes=1 << 30)
+        a, b, c = _FakeArea("a"), _FakeArea("b"), _FakeArea("c")
+        cache.suspend(a)
+        cache.suspend(b)
+        cache.suspend(a)      # refresh a
+        cache.suspend(c)      # evicts b
+        assert cache.area_ids == ["a", "c"]
+        assert cache.resume("b") is None
+        assert cache.resume("a") is a
+        assert "a" not in cache and len(cache) == 1
+
+    def test_byte_cap(self):
+        cache = AreaCache(max_areas=10, max_bytes=1000)
+        cache.suspend(_FakeArea("a", 400))
+        cache.suspend(_FakeArea("b", 400))
+        assert cache.total_bytes == 800
+        cache.suspend(_FakeArea("c", 400))
+        assert cache.area_ids == ["b", "c"]
+        assert cache.total_bytes == 800
+        cache.resume("b")
+        assert cache.total_bytes == 400
+        cache.clear()
+        assert cache.total_bytes == 0 and len(cache) == 0
+
+    def test_oversized_area_is_not_kept(self):
+        cache = AreaCache(max_areas=4, max_bytes=100)
+        cache.suspend(_FakeArea("a", 400))
+        assert len(cache) == 0 and cache.total_bytes == 0
+
+    def test_estimate_counts_chunk_surfaces(self):
+        assert estimate_area_bytes(_FakeArea("a", 400)) == 400
+
+
+class TestAreaReentry:
+    def test_resume_keeps_area_state(self, game):
+        overworld = game.current_state
+        overworld.chests[0].opened = True
+        overworld.items.pop()
+        forest = _travel(overworld, "forest")
+        assert game.current_state is forest
+        assert "overworld" in game.area_cache
+        forest.player.gold = 42
+        back = _travel(forest, "overworld")
+        assert back is overworld
+        assert back.chests[0].opened
+        assert len(back.items) == len(play_state_mod.AREAS["overworld"]["spawns"]["items"]) - 1
+        assert back.player.gold == 42
+        assert back.area_banner_timer == 2.0
+        assert game.area_cache.area_ids == ["forest"]
+
+    def test_enemies_respawn_on_reentry(self, game):
+        overworld = game.current_state
+        overworld.enemies.clear()
+        back = _travel(_travel(overworld, "forest"), "overworld")
+        assert len(back.enemies) == len(play_state_mod.AREAS["overworld"]["spawns"]["enemies"])
+
+    def test_enemies_stay_defeated(self, game, monkeypatch):
+        monkeypatch.setattr(play_state_mod, "AREA_ENEMY_RESPAWN", "never")
+        overworld = game.current_state
+        overworld.enemies.clear()
+        back = _travel(_travel(overworld, "forest"), "overworld")
+        assert back.enemies == []
+
+    def test_evicted_area_is_rebuilt(self, game):
+        game.area_cache.max_areas = 0
+        overworld = game.current_state
+        back = _travel(_travel(overworld, "forest"), "overworld")
+        assert back is not overworld
+        assert len(game.area_cache) == 0
+
+    def test_default_caps_from_settings(self):
+        cache = AreaCache()
+        assert cache.max_areas == area_cache_mod.AREA_CACHE_SIZE
+        assert cache.max_bytes == area_cache_mod.AREA_CACHE_MAX_BYTES
@@ -0,0 +1,123 @@
+"""Tests for sliced area construction and predictive area preloading."""
+
+import pytest
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput
+from zelda_miloutte.settings import TILE_SIZE
+from zelda_miloutte.states.play_state import PlayState
+from zelda_miloutte.world.maps import AREAS
+from zelda_miloutte.world.tile import TileType
+from zelda_miloutte.world.tilemap import TileMap
+
+
+@pytest.fixture
+def game():
+    game = Game(headless=True, input_script=ScriptedInput())
+    game.push_state(PlayState(game))
+    return game
+
+
+def _stand_near_exit(state, tile_type, offset):
+    col, row = state.tilemap.find_tiles([tile_type])[tile_type][0]
+    state.player.x = (col - offset) * TILE_SIZE
+    state.player.y = row * TILE_SIZE
+
+
+def _preload_all(game):
+    for _ in range(500):
+        game.preloader.update()
+        if game.preloader.target is None:
+            return
+    raise AssertionError("preload did not finish")
+
+
+class TestSlicedBuild:
+    def test_deferred_tilemap_matches_eager(self):
+        data = AREAS["forest"]["map"]
+        eager = TileMap(data)
+        deferred = TileMap(data, deferred=True)
+        assert deferred.tiles == []
+        steps = sum(1 for _ in deferred.build_steps())
+        assert steps == eager.rows
+        assert deferred.tiles == eager.tiles
+        assert deferred.solid_grid == eager.solid_grid
+        assert deferred.walkable_grid == eager.walkable_grid
+        assert deferred._tile_surface_grid == eager._tile_surface_grid
+
+    def test_bake_steps_build_every_chunk_once(self):
+        tilemap = TileMap(AREAS["forest"]["map"])
+        tilemap._build_chunk(0, 0)
+        baked = sum(1 for _ in tilemap.bake_steps())
+        assert len(tilemap._chunk_cache) == baked + 1
+        assert list(tilemap.bake_steps()) == []
+
+    def test_deferred_play_state(self, game):
+        state = PlayState(game, area_id="frozen_peaks", deferred=True)
+        assert not state.built
+        steps = 0
+        while not state.build_step():
+            steps += 1
+        assert steps > len(AREAS["frozen_peaks"]["spawns"]["enemies"])
+        assert len(state.enemies) == len(AREAS["frozen_peaks"]["spawns"]["enemies"])
+        assert state.built and state.build_step()
+
+
+class TestAreaPreloader:
+    def test_predicts_area_behind_nearest_exit(self, game):
+        state = game.current_state
+        _stand_near_exit(state, TileType.TRANSITION_E, 3)
+        assert game.preloader.predict(state) == "forest"
+        _stand_near_exit(state, TileType.TRANSITION_E, game.preloader.distance + 2)
+        assert game.preloader.predict(state) is None
+
+    def test_preloads_in_slices_into_area_cache(self, game):
+        state = game.current_state
+        _stand_near_exit(state, TileType.TRANSITION_E, 3)
+        game.preloader.update()
+        assert game.preloader.target == "forest"
+        assert "forest" not in game.area_cache
+        _preload_all(game)
+        assert "forest" in game.area_cache
+        forest = game.area_cache._states["forest"][0]
+        assert forest.built and forest.tilemap._chunk_cache
+
+        # The transition resumes the preloaded area instead of building one
+        load_data, minimap_data = state._carry_over_data()
+        assert state._area_state("forest", load_data, minimap_data) is forest
+
+    def test_walking_away_cancels(self, game):
+        state = game.current_state
+        _stand_near_exit(state, TileType.TRANSITION_E, 3)
+        game.preloader.update()
+        _stand_near_exit(state, TileType.TRANSITION_E, game.preloader.distance + 2)
+        game.preloader.update()
+        assert game.preloader.target is None
+        assert "forest" not in game.area_cache
+
+    def test_transition_finishes_in_progress_preload(self, game):
+        state = game.current_state
+        _stand_near_exit(state, TileType.TRANSITION_E, 3)
+        game.preloader.update()
+        preloading = game.preloader._state
+        load_data, minimap_data = state._carry_over_data()
+        assert state._area_state("forest", load_data, minimap_data) is preloading
+        assert preloading.built
+
+    def test_preloaded_area_is_evicted_first(self, game):
+        game.area_cache.max_areas = 1
+        state = game.current_state
+        _stand_near_exit(state, TileType.TRANSITION_E, 3)
+        _preload_all(game)
+        game.area_cache.suspend(state)
+        assert game.area_cache.area_ids == ["overworld"]
+
+    def test_deadline_bounds_slices(self, game):
+        _stand_near_exit(game.current_state, TileType.TRANSITION_E, 3)
+        game.preloader.update(deadline=0.0)
+        assert game.preloader._state is not None and not game.preloader._state.built
+
+    def test_forget_areas_cancels(self, game):
+        _stand_near_exit(game.current_state, TileType.TRANSITION_E, 3)
+        game.preloader.update()
+        game.forget_areas()
+        assert game.preloader.target is None
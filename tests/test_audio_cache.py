@@ -0,0 +1,113 @@
+"""Tests for the on-disk synthesized audio cache."""
+
+import pygame
+import zelda_miloutte.sounds as sounds
+from zelda_miloutte.audio_cache import AudioCache, bake
+from zelda_miloutte.settings import AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS
+from zelda_miloutte.sounds import SoundManager
+
+
+FORMAT = (22050, -16, 1)
+
+
+def _manager_with_cache(cache):
+    """Build a SoundManager without running the (slow) synthesis in __init__."""
+    sm = SoundManager.__new__(SoundManager)
+    sm._audio_cache = cache
+    return sm
+
+
+class TestAudioCache:
+    def test_roundtrip(self, tmp_path):
+        cache = AudioCache(FORMAT, read_dirs=[tmp_path])
+        assert cache.load("blip") is None
+        cache.store("blip", b"\x01\x02\x03\x04", 0.25)
+        volume, pcm = cache.load("blip")
+        assert volume == 0.25
+        assert bytes(pcm) == b"\x01\x02\x03\x04"
+
+    def test_mixer_format_changes_key(self, tmp_path):
+        mono = AudioCache(FORMAT, read_dirs=[tmp_path])
+        stereo = AudioCache((22050, -16, 2), read_dirs=[tmp_path])
+        mono.store("blip", b"\x00\x00", 1.0)
+        assert mono.key != stereo.key
+        assert stereo.load("blip") is None
+
+    def test_store_replaces_stale_entries(self, tmp_path):
+        (tmp_path / "blip-0123456789abcdef.pcm").write_bytes(b"old")
+        cache = AudioCache(FORMAT, read_dirs=[tmp_path])
+        cache.store("blip", b"\x00\x00", 1.0)
+        assert [p.name for p in tmp_path.glob("blip-*.pcm")] == [f"blip-{cache.key}.pcm"]
+
+    def test_read_dirs_searched_in_order(self, tmp_path):
+        bundled, user = tmp_path / "bundled", tmp_path / "user"
+        AudioCache(FORMAT, read_dirs=[bundled]).store("blip", b"\x01\x00", 0.5)
+        AudioCache(FORMAT, read_dirs=[user]).store("blip", b"\x02\x00", 0.9)
+        volume, pcm = AudioCache(FORMAT, read_dirs=[bundled, user]).load("blip")
+        assert (volume, bytes(pcm)) == (0.5, b"\x01\x00")
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = AudioCache(FORMAT, read_dirs=[tmp_path])
+        (tmp_path / f"blip-{cache.key}.pcm").write_bytes(b"junk-data")
+        assert cache.load("blip") is None
+
+
+class TestCachedSound:
+    def test_builds_once_then_loads_from_cache(self, tmp_path):
+        calls = []
+
+        def build():
+            calls.append(1)
+            sound = pygame.mixer.Sound(buffer=b"\x10\x00" * 64)
+            sound.set_volume(0.5)
+            return sound
+
+        cache = AudioCache(pygame.mixer.get_init() or FORMAT, read_dirs=[tmp_path])
+        first = _manager_with_cache(cache)._cached_sound("blip", build)
+        second = _manager_with_cache(cache)._cached_sound("blip", build)
+        assert len(calls) == 1
+        assert second.get_raw() == first.get_raw()
+        assert abs(second.get_volume() - 0.5) < 0.01
+
+    def test_no_cache_always_builds(self):
+        sm = _manager_with_cache(None)
+        assert sm._cached_sound("blip", lambda: None) is None
+
+
+class _StubSoundManager:
+    """Writes one entry instead of synthesizing the whole soundtrack."""
+
+    def __init__(self, audio_cache):
+        self._audio_cache = audio_cache
+
+    def _generate_music(self):
+        self._audio_cache.store("blip", b"\x00\x00", 1.0)
+
+
+class TestBake:
+    def _bake(self, monkeypatch, tmp_path, **fmt):
+        monkeypatch.setattr(sounds, "SoundManager", _StubSoundManager)
+        previous = pygame.mixer.get_init()
+        try:
+            count = bake(tmp_path, **fmt)
+            opened = pygame.mixer.get_init()
+        finally:
+            pygame.mixer.quit()
+            if previous:
+                pygame.mixer.init(*previous)
+        return count, opened
+
+    def test_defaults_to_game_format(self, monkeypatch, tmp_path):
+        count, opened = self._bake(monkeypatch, tmp_path)
+        game_format = (AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS)
+        assert count == 1
+        assert opened == game_format
+        assert AudioCache(game_format, read_dirs=[tmp_path]).load("blip") is not None
+
+    def test_keys_entries_on_requested_format(self, monkeypatch, tmp_path):
+        count, opened = self._bake(monkeypatch, tmp_path, frequency=44100, channels=2)
+        assert count == 1
+        assert opened == (44100, AUDIO_SIZE, 2)
+        assert AudioCache((44100, AUDIO_SIZE, 2), read_dirs=[tmp_path]).load("blip") is not None
+        game_format = (AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS)
+        assert AudioCache(game_format, read_dirs=[tmp_path]).load("blip") is None
@@ -0,0 +1,58 @@
+"""Tests for sprite effect helpers and the shared sprite-variant cache."""
+
+import pygame
+from zelda_miloutte.sprites.effects import (
+    flash_white, get_variant, get_frame_variants, get_white_frames,
+    get_overlay_frame, OVERLAY_ALPHA_STEP,
+)
+
+
+def _sample_surface():
+    surf = pygame.Surface((6, 4), pygame.SRCALPHA)
+    for x in range(6):
+        for y in range(4):
+            surf.set_at((x, y), (x * 40, y * 60, 90, (x * 50 + y * 20) % 256))
+    return surf
+
+
+class TestFlashWhite:
+    def test_matches_per_pixel_reference(self):
+        surf = _sample_surface()
+        mask = pygame.mask.from_surface(surf)
+        white = flash_white(surf)
+        for x in range(6):
+            for y in range(4):
+                if mask.get_at((x, y)):
+                    expected = (255, 255, 255, surf.get_at((x, y))[3])
+                else:
+                    expected = (0, 0, 0, 0)
+                assert tuple(white.get_at((x, y))) == expected
+
+    def test_keeps_per_pixel_alpha(self):
+        white = flash_white(_sample_surface())
+        assert white.get_flags() & pygame.SRCALPHA
+
+
+class TestVariantCache:
+    def test_variant_is_built_once(self):
+        surf = _sample_surface()
+        assert get_variant(surf, "white") is get_variant(surf, "white")
+        assert get_variant(surf, "tint", (200, 80, 120)) is not get_variant(surf, "white")
+
+    def test_frame_variants_shared_across_instances(self):
+        frames = {"down": [_sample_surface(), _sample_surface()], "up": [_sample_surface()]}
+        first = get_white_frames(frames)
+        assert get_white_frames(frames) is first
+        assert set(first) == {"down", "up"}
+        assert len(first["down"]) == 2
+
+    def test_distinct_frame_sets_do_not_collide(self):
+        a = {"down": [_sample_surface()]}
+        b = {"down": [_sample_surface()]}
+        assert get_frame_variants(a, "white") is not get_frame_variants(b, "white")
+
+    def test_overlay_alpha_is_quantized(self):
+        surf = _sample_surface()
+        low = get_overlay_frame(surf, (255, 40, 40), 17)
+        assert get_overlay_frame(surf, (255, 40, 40), 17 + OVERLAY_ALPHA_STEP - 2) is low
+        assert get_overlay_frame(surf, (255, 40, 40), 17 + OVERLAY_ALPHA_STEP) is not low
@@ -0,0 +1,64 @@
+"""Tests for headless Game simulation driven by scripted input."""
+
+import pygame
+import pytest
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import (
+    ScriptedInput, InputRecorder, hold, tap, random_script,
+)
+from zelda_miloutte.states.play_state import PlayState
+
+
+def _headless_game(script):
+    game = Game(headless=True, input_script=ScriptedInput(script))
+    game.push_state(PlayState(game))
+    return game
+
+
+class TestScriptedInput:
+    def test_events_and_held_keys(self):
+        si = ScriptedInput(hold(pygame.K_RIGHT, 1, 2) + tap(pygame.K_SPACE, 2))
+        assert si.next_frame() == []
+        assert not si.get_pressed()[pygame.K_RIGHT]
+        (down,) = si.next_frame()
+        assert down.type == pygame.KEYDOWN and down.key == pygame.K_RIGHT
+        assert si.get_pressed()[pygame.K_RIGHT]
+        assert [e.key for e in si.next_frame()] == [pygame.K_SPACE]
+        assert sorted((e.type, e.key) for e in si.next_frame()) == sorted(
+            [(pygame.KEYUP, pygame.K_RIGHT), (pygame.KEYUP, pygame.K_SPACE)])
+        assert si.finished
+
+    def test_save_load_roundtrip(self, tmp_path):
+        script = random_script(300, seed=4)
+        path = tmp_path / "script.json"
+        ScriptedInput(script).save(path)
+        assert ScriptedInput.load(path).script == ScriptedInput(script).script
+
+    def test_recorder_captures_key_events(self):
+        rec = InputRecorder()
+        rec.record(3, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        rec.record(5, pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)))
+        rec.record(7, pygame.event.Event(pygame.KEYUP, key=pygame.K_a))
+        assert rec.script == [(3, "down", pygame.K_a), (7, "up", pygame.K_a)]
+
+
+class TestHeadlessGame:
+    def test_fixed_timestep_simulation(self):
+        game = _headless_game([])
+        frame_times = game.simulate(30)
+        assert len(frame_times) == 30
+        assert game.frame == 30
+        assert game.sim_time == pytest.approx(30 / 60)
+
+    def test_scripted_movement_moves_player(self):
+        game = _headless_game(hold(pygame.K_RIGHT, 0, 30))
+        player = game.current_state.player
+        start_x = player.x
+        game.simulate(30, render=False)
+        assert player.x > start_x
+
+    def test_quit_event_stops_simulation(self):
+        game = _headless_game([])
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        assert game.simulate(10) == []
+        assert not game.running
@@ -0,0 +1,97 @@
+"""Tests for the retained-mode HUD."""
+
+import pygame
+import pytest
+from zelda_miloutte.entities.player import Player
+from zelda_miloutte.hud import HUD, HUD_BG_COLOR
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT, BOSS_BAR_WIDTH
+
+
+class _Boss:
+    alive = True
+    dying = False
+    max_hp = 40
+
+    def __init__(self, hp=40, phase=1):
+        self.hp = hp
+        self.phase = phase
+
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@pytest.fixture
+def hud(screen):
+    hud = HUD()
+    hud.draw(screen, Player(100, 100))
+    return hud
+
+
+def _settle(hud, screen, player, boss=None):
+    """Draw until the XP bar animation has settled."""
+    for _ in range(60):
+        hud.draw(screen, player, boss)
+
+
+class TestRetainedHUD:
+    def test_idle_frames_redraw_nothing(self, hud, screen):
+        player = Player(100, 100)
+        _settle(hud, screen, player)
+        redraws = hud.redraws
+        for _ in range(10):
+            hud.draw(screen, player)
+        assert hud.redraws == redraws
+
+    def test_only_changed_widget_is_redrawn(self, hud, screen):
+        player = Player(100, 100)
+        _settle(hud, screen, player)
+        before = dict(hud._rects)
+        player.gold += 25
+        hud.draw(screen, player)
+        assert hud._keys["counters"][2] == player.gold
+        assert hud._rects["hearts"] == before["hearts"]
+        redraws = hud.redraws
+        player.hp -= 1
+        hud.draw(screen, player)
+        assert hud.redraws - redraws == 1
+
+    def test_matches_full_redraw(self, hud, screen):
+        player = Player(100, 100)
+        _settle(hud, screen, player)
+        player.hp -= 3
+        player.keys = 2
+        player.mp = player.max_mp // 2
+        player.status_effects["poison"] = {"timer": 3.0}
+        _settle(hud, screen, player)
+        fresh_screen = pygame.Surface(screen.get_size())
+        fresh = HUD()
+        _settle(fresh, fresh_screen, player)
+        assert pygame.image.tobytes(hud._surface, "RGBA") == \
+            pygame.image.tobytes(fresh._surface, "RGBA")
+
+    def test_background_restored_when_widget_hidden(self, hud, screen):
+        player = Player(100, 100)
+        player.status_effects["burn"] = {"timer": 2.0}
+        hud.draw(screen, player)
+        rect = hud._rects["status"]
+        assert rect.width > 0
+        player.status_effects.clear()
+        hud.draw(screen, player)
+        assert tuple(hud._surface.get_at(rect.topleft)) == HUD_BG_COLOR
+
+
+class TestBossBar:
+    def test_boss_bar_tracks_hp_and_hides(self, hud, screen):
+        player = Player(100, 100)
+        boss = _Boss()
+        hud.draw(screen, player, boss)
+        assert hud._keys["boss"] == (BOSS_BAR_WIDTH, 1)
+        boss.hp = 20
+        boss.phase = 2
+        hud.draw(screen, player, boss)
+        assert hud._keys["boss"] == (BOSS_BAR_WIDTH // 2, 2)
+        boss.dying = True
+        hud.draw(screen, player, boss)
+        assert hud._keys["boss"] is None and hud._rects["boss"].width == 0
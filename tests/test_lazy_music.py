@@ -0,0 +1,95 @@
+"""Tests for lazy, background music generation in SoundManager."""
+
+import array
+import threading
+import time
+import pygame
+import pytest
+from zelda_miloutte.sounds import SoundManager
+
+
+def _tone():
+    return pygame.mixer.Sound(buffer=array.array('h', [1000, -1000] * 2000))
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    """Build SoundManagers with fast fake tracks and no SFX synthesis."""
+    built = []
+    gate = threading.Event()
+    gate.set()
+
+    def builders(self):
+        def build(name):
+            def _build():
+                gate.wait(5)
+                built.append(name)
+                return _tone()
+            return _build
+        return {name: build(name) for name in ('title', 'overworld', 'forest', 'boss')}
+
+    monkeypatch.setattr(SoundManager, "_generate_sounds", lambda self: None)
+    monkeypatch.setattr(SoundManager, "_music_builders", builders)
+
+    def factory(threaded=True):
+        if not threaded:
+            monkeypatch.setattr(SoundManager, "_start_music_worker", lambda self: None)
+        sm = SoundManager(audio_cache=None)
+        sm._audio_cache = None
+        return sm
+
+    factory.built = built
+    factory.gate = gate
+    return factory
+
+
+def _wait_ready(sm, name, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not sm.is_music_ready(name):
+        assert time.monotonic() < deadline, f"{name} was never generated"
+        time.sleep(0.005)
+
+
+class TestLazyMusic:
+    def test_no_music_generated_at_startup(self, make_manager):
+        sm = make_manager()
+        assert sm._music_worker is not None
+        assert not sm.is_music_ready('title')
+        assert make_manager.built == []
+
+    def test_play_music_starts_when_track_is_ready(self, make_manager):
+        make_manager.gate.clear()
+        sm = make_manager()
+        sm.play_music('title')
+        # Silent placeholder while the worker is still synthesizing
+        assert sm._current_track == 'title'
+        assert not sm.is_music_ready('title')
+        make_manager.gate.set()
+        _wait_ready(sm, 'title')
+        assert sm._music_channel.get_sound() is sm._music_tracks['title']
+
+    def test_prefetch_generates_in_background(self, make_manager):
+        sm = make_manager()
+        sm.prefetch_music(['forest', 'unknown_track', 'forest'])
+        _wait_ready(sm, 'forest')
+        assert make_manager.built == ['forest']
+        assert not sm.is_music_ready('unknown_track')
+
+    def test_played_track_jumps_the_prefetch_queue(self, make_manager):
+        make_manager.gate.clear()
+        sm = make_manager()
+        with sm._music_lock:
+            sm._queue_music('overworld')
+            sm._queue_music('forest')
+        sm.play_music('boss')
+        assert list(sm._music_queue)[0] == 'boss'
+        make_manager.gate.set()
+        _wait_ready(sm, 'forest')
+
+    def test_without_threads_generates_on_first_play(self, make_manager):
+        sm = make_manager(threaded=False)
+        sm.prefetch_music(['forest'])
+        assert make_manager.built == []
+        sm.play_music('title')
+        assert make_manager.built == ['title']
+        assert sm._music_channel.get_sound() is sm._music_tracks['title']
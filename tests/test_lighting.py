@@ -0,0 +1,80 @@
+"""Tests for pre-rendered light masks and night light compositing."""
+
+import pygame
+from zelda_miloutte import lighting
+from zelda_miloutte.entities.projectile import Projectile
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput
+from zelda_miloutte.states.play_state import PlayState
+from zelda_miloutte.time_system import TimeSystem, NIGHT_COLOR, LIGHT_RADIUS_DEFAULT
+
+DARK = NIGHT_COLOR
+
+
+def _night_overlay(lights):
+    overlay = pygame.Surface((200, 200), pygame.SRCALPHA)
+    overlay.fill(DARK)
+    lighting.composite_lights(overlay, lights)
+    return overlay
+
+
+class TestLightMasks:
+    def test_masks_are_cached(self):
+        mask = lighting.get_light_mask(40)
+        assert lighting.get_light_mask(40) is mask
+        assert lighting.get_light_mask(40, falloff=1.0) is not mask
+        assert mask.get_size() == (80, 80)
+
+    def test_mask_falls_off_from_center(self):
+        mask = lighting.get_light_mask(40)
+        alphas = [mask.get_at((40 + d, 40))[3] for d in (0, 10, 20, 30, 39)]
+        assert alphas[0] == 0
+        assert alphas == sorted(alphas)
+        assert mask.get_at((0, 0))[3] == 255
+
+    def test_glow_is_tinted(self):
+        glow = lighting.get_glow(30, (255, 150, 50))
+        assert lighting.get_glow(30, (255, 150, 50)) is glow
+        r, g, b, a = glow.get_at((30, 30))
+        assert (r, g, b) == (255, 150, 50) and a > 0
+
+
+class TestCompositing:
+    def test_light_clears_darkness_at_its_center(self):
+        overlay = _night_overlay([(100, 100, 40, None)])
+        assert tuple(overlay.get_at((100, 100))) == (*DARK[:3], 0)
+        assert tuple(overlay.get_at((5, 5))) == DARK
+        assert 0 < overlay.get_at((125, 100))[3] < DARK[3]
+
+    def test_overlapping_lights_combine(self):
+        one = _night_overlay([(80, 100, 40, None)])
+        two = _night_overlay([(80, 100, 40, None), (120, 100, 40, None)])
+        assert two.get_at((100, 100))[3] < one.get_at((100, 100))[3]
+
+    def test_offscreen_lights_are_skipped(self):
+        overlay = _night_overlay([(-100, -100, 40, None), (400, 50, 40, (255, 0, 0))])
+        assert tuple(overlay.get_at((0, 0))) == DARK
+
+    def test_night_overlay_lights_the_player(self):
+        ts = TimeSystem(game_hour=23.0)
+        screen = pygame.Surface((800, 600))
+        screen.fill((255, 255, 255))
+        ts.draw_overlay(screen, 400, 300)
+        assert screen.get_at((400, 300))[:3] == (255, 255, 255)
+        assert screen.get_at((400 + LIGHT_RADIUS_DEFAULT + 10, 300))[:3] != (255, 255, 255)
+
+
+class TestLightSources:
+    def test_gameplay_collects_world_lights(self):
+        game = Game(headless=True, input_script=ScriptedInput())
+        state = PlayState(game)
+        game.push_state(state)
+        state.projectiles.append(Projectile(10, 10, 100, 10, 1))
+        fireball = Projectile(20, 20, 100, 20, 1)
+        fireball.light = lighting.FIRE_PROJECTILE_LIGHT
+        state.projectiles.append(fireball)
+        lights = state._night_lights()
+        assert len(lights) == 1
+        x, y, radius, color = lights[0]
+        assert (radius, color) == lighting.FIRE_PROJECTILE_LIGHT
+        assert x == fireball.center_x - state.camera.x
@@ -0,0 +1,98 @@
+"""Tests for the bitmap fog of war and incremental minimap."""
+
+import json
+
+import pygame
+from zelda_miloutte.settings import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
+from zelda_miloutte.ui.minimap import Minimap, VisitedMap, MINIMAP_FOG_COLOR, TILE_COLORS
+
+
+class _TileMap:
+    def __init__(self, cols, rows, tile=0):
+        self.cols = cols
+        self.rows = rows
+        self.data = [[tile] * cols for _ in range(rows)]
+
+
+class _Player:
+    def __init__(self, col, row):
+        self.center_x = col * TILE_SIZE + TILE_SIZE // 2
+        self.center_y = row * TILE_SIZE + TILE_SIZE // 2
+
+
+class TestVisitedMap:
+    def test_reveal_returns_only_new_cells(self):
+        visited = VisitedMap(20, 10)
+        first = visited.reveal_rect(0, 0, 3, 2)
+        assert sorted(first) == [(c, r) for c in range(3) for r in range(2)]
+        again = visited.reveal_rect(1, 1, 4, 3)
+        assert sorted(again) == sorted([(3, 1), (1, 2), (2, 2), (3, 2)])
+        assert len(visited) == 10
+        assert (3, 2) in visited and (4, 2) not in visited and (-1, 0) not in visited
+
+    def test_reveal_is_clamped_to_the_map(self):
+        visited = VisitedMap(5, 5)
+        assert len(visited.reveal_rect(-3, -3, 2, 2)) == 4
+        assert visited.reveal_rect(7, 0, 9, 5) == []
+
+    def test_encode_round_trip(self):
+        visited = VisitedMap(40, 30)
+        visited.reveal_rect(5, 5, 16, 16)
+        visited.reveal_rect(0, 29, 40, 30)
+        data = visited.encode()
+        assert data["runs"][0] == 5 * 40 + 5
+        assert sum(data["runs"]) == 40 * 30
+        restored = VisitedMap.decode(json.loads(json.dumps(data)))
+        assert restored.bits == visited.bits and len(restored) == len(visited)
+        assert sorted(restored.cells()) == sorted(visited.cells())
+
+
+class TestMinimap:
+    def test_save_data_is_compact_and_round_trips(self):
+        minimap = Minimap()
+        tilemap = _TileMap(100, 80)
+        for col in range(5, 90, 3):
+            minimap.reveal_tiles("forest", col * TILE_SIZE, 40 * TILE_SIZE, tilemap)
+        data = minimap.get_save_data()
+        assert len(data["forest"]["runs"]) < 30
+        other = Minimap()
+        other.load_save_data(json.loads(json.dumps(data)))
+        assert other.visited_tiles["forest"].bits == minimap.visited_tiles["forest"].bits
+
+    def test_legacy_save_data_is_converted(self):
+        minimap = Minimap()
+        minimap.load_save_data({"forest": [[1, 2], [3, 4]], "desert": [[0, 0]]})
+        assert minimap.get_save_data()["desert"] == [[0, 0]]
+        minimap.reveal_tiles("forest", 50 * TILE_SIZE, 50 * TILE_SIZE, _TileMap(60, 60))
+        visited = minimap.visited_tiles["forest"]
+        assert (1, 2) in visited and (3, 4) in visited and (50, 50) in visited
+        assert isinstance(minimap.get_save_data()["forest"], dict)
+
+    def test_reveal_patches_the_persistent_surface(self):
+        minimap = Minimap()
+        tilemap = _TileMap(60, 45, tile=4)
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        minimap.reveal_tiles("lake", 5 * TILE_SIZE, 5 * TILE_SIZE, tilemap)
+        minimap.draw(screen, tilemap, _Player(5, 5), [], [], [], "lake")
+        base = minimap._cached_surface
+        cell = minimap._cell_rect(30, 30)
+        assert base.get_at(cell[:2])[:3] == MINIMAP_FOG_COLOR
+        new_cells = minimap.reveal_tiles("lake", 30 * TILE_SIZE, 30 * TILE_SIZE, tilemap)
+        assert len(new_cells) == 11 * 11
+        assert minimap._cached_surface is base
+        assert base.get_at(cell[:2])[:3] == TILE_COLORS[4]
+        assert minimap.reveal_tiles("lake", 30 * TILE_SIZE, 30 * TILE_SIZE, tilemap) == []
+
+    def test_patched_surface_matches_full_rebuild(self):
+        minimap = Minimap()
+        tilemap = _TileMap(100, 75, tile=0)
+        tilemap.data[20][20] = 1
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for step in range(30):
+            minimap.reveal_tiles("field", (step * 3) * TILE_SIZE, 20 * TILE_SIZE, tilemap)
+            minimap.draw(screen, tilemap, _Player(step * 3, 20), [], [], [], "field")
+        fresh = Minimap()
+        fresh.load_save_data(minimap.get_save_data())
+        fresh.draw(screen, tilemap, _Player(0, 0), [], [], [], "field")
+        assert pygame.image.tobytes(minimap._cached_surface, "RGBA") == \
+            pygame.image.tobytes(fresh._cached_surface, "RGBA")
@@ -0,0 +1,86 @@
+"""Tests for the shared full-screen effect overlay cache."""
+
+import pygame
+import pytest
+from zelda_miloutte import overlays
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from zelda_miloutte.states.play_state import PlayState
+
+
+@pytest.fixture
+def screen():
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surface.fill((0, 0, 0))
+    return surface
+
+
+class TestFill:
+    def test_fill_matches_per_pixel_alpha_blend(self, screen):
+        reference = screen.copy()
+        flash = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        flash.fill((255, 255, 255, 100))
+        reference.blit(flash, (0, 0))
+        overlays.draw_fill(screen, (255, 255, 255), 100)
+        assert screen.get_at((10, 10))[:3] == pytest.approx(reference.get_at((10, 10))[:3], abs=1)
+
+    def test_fill_surface_is_shared_across_alphas(self, screen):
+        overlays.draw_fill(screen, (0, 0, 0), 180)
+        dim = overlays.get_fill((0, 0, 0), screen.get_size())
+        overlays.draw_fill(screen, (0, 0, 0), 60.7)
+        assert overlays.get_fill((0, 0, 0), screen.get_size()) is dim
+        assert dim.get_alpha() == 60
+
+    def test_zero_alpha_draws_nothing(self, screen):
+        overlays.draw_fill(screen, (255, 255, 255), 0)
+        overlays.draw_vignette(screen, (255, 255, 255), -5)
+        assert screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+    def test_fill_rect(self, screen):
+        overlays.draw_fill(screen, (255, 255, 255), 255, (0, 0, SCREEN_WIDTH, 40))
+        assert screen.get_at((5, 39))[:3] == (255, 255, 255)
+        assert screen.get_at((5, 40))[:3] == (0, 0, 0)
+
+
+class TestVignette:
+    def test_vignette_fades_towards_centre(self, screen):
+        overlays.draw_vignette(screen, (200, 0, 0), 80)
+        reds = [screen.get_at((SCREEN_WIDTH // 2, y))[0] for y in (0, 10, 20, 39, 40)]
+        assert reds[0] == pytest.approx(200 * 80 / 255, abs=2)
+        assert reds == sorted(reds, reverse=True)
+        assert reds[-1] == 0
+        assert screen.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))[:3] == (0, 0, 0)
+
+    def test_vignette_is_cached_per_size(self):
+        small = pygame.Surface((100, 100))
+        a = overlays.get_vignette((200, 0, 0), small.get_size())
+        assert overlays.get_vignette((200, 0, 0), (100, 100)) is a
+        assert overlays.get_vignette((200, 0, 0), (SCREEN_WIDTH, SCREEN_HEIGHT)) is not a
+
+
+class TestLine:
+    def test_line_is_blended_and_scratch_cleared(self, screen):
+        overlays.draw_line(screen, (255, 255, 180), 100, (100, 100), (200, 100), 8)
+        assert screen.get_at((150, 100))[:3] == pytest.approx((100, 100, 70), abs=2)
+        assert screen.get_at((150, 150))[:3] == (0, 0, 0)
+        scratch = overlays._scratch_cache[screen.get_size()]
+        assert scratch.get_bounding_rect().size == (0, 0)
+
+
+class TestStates:
+    def test_damage_vignette_and_flash_reuse_cached_overlays(self, screen):
+        game = Game(headless=True, input_script=ScriptedInput())
+        state = PlayState(game)
+        game.push_state(state)
+        state._damage_vignette_timer = 0.3
+        state._screen_flash_alpha = 120
+        state.draw(screen)
+        vignette = overlays.get_vignette((200, 0, 0), screen.get_size())
+        flash = overlays.get_fill((255, 255, 255), screen.get_size())
+        state._damage_vignette_timer = 0.15
+        state._screen_flash_alpha = 60
+        state.draw(screen)
+        assert overlays.get_vignette((200, 0, 0), screen.get_size()) is vignette
+        assert overlays.get_fill((255, 255, 255), screen.get_size()) is flash
+        assert (vignette.get_alpha(), flash.get_alpha()) == (40, 60)
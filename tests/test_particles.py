@@ -0,0 +1,71 @@
+"""Tests for the pooled ParticleSystem (NumPy and pure-Python backends)."""
+
+import pygame
+import pytest
+from zelda_miloutte import particles as particles_mod
+from zelda_miloutte.particles import ParticleSystem, get_particle_sprite
+
+
+class _Camera:
+    x = 0.0
+    y = 0.0
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if particles_mod.np is None:
+            pytest.skip("NumPy not installed")
+    else:
+        monkeypatch.setattr(particles_mod, "np", None)
+    return request.param
+
+
+def _emit(ps, count, lifetime, gravity=0):
+    ps.emit(100, 100, count=count, color=(255, 0, 0), speed_range=(10, 10),
+            lifetime_range=(lifetime, lifetime), size_range=(2, 2), gravity=gravity)
+
+
+class TestParticleSystem:
+    def test_emit_adds_particles(self, backend):
+        ps = ParticleSystem()
+        _emit(ps, 25, 1.0)
+        assert len(ps) == 25
+
+    def test_update_compacts_dead_particles(self, backend):
+        ps = ParticleSystem()
+        _emit(ps, 10, 0.1)
+        _emit(ps, 5, 1.0)
+        ps.update(0.2)
+        assert len(ps) == 5
+        assert all(ps._life[i] == pytest.approx(0.8) for i in range(5))
+
+    def test_update_moves_and_applies_gravity(self, backend):
+        ps = ParticleSystem()
+        ps._spawn(0, 0, [10.0], [0.0], [1.0], [2.0], [(1, 2, 3)], gravity=100)
+        ps.update(0.1)
+        assert ps._x[0] == pytest.approx(1.0)
+        assert ps._y[0] == pytest.approx(0.0)
+        assert ps._vy[0] == pytest.approx(10.0)
+
+    def test_capacity_is_fixed(self, backend):
+        ps = ParticleSystem(capacity=32)
+        _emit(ps, 20, 1.0)
+        _emit(ps, 20, 1.0)
+        assert len(ps) == 32
+
+    def test_multi_color_emit(self, backend):
+        ps = ParticleSystem()
+        ps.emit(0, 0, count=30, color=[(255, 0, 0), (0, 255, 0)], speed_range=(1, 2),
+                lifetime_range=(1, 1), size_range=(1, 2))
+        assert set(ps._palette) <= {(255, 0, 0), (0, 255, 0)}
+
+    def test_draw_renders_particles(self, backend):
+        ps = ParticleSystem()
+        _emit(ps, 5, 1.0)
+        surf = pygame.Surface((200, 200))
+        ps.draw(surf, _Camera())
+        assert surf.get_at((100, 100))[0] > 0
+
+    def test_sprite_cache_reuses_surfaces(self):
+        assert get_particle_sprite(3, (1, 2, 3), 127) is get_particle_sprite(3, (1, 2, 3), 127)
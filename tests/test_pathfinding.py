@@ -1,4 +1,4 @@
-"""Tests for the A* pathfinding module."""
+"""Tests for the pathfinding module (A* and flow fields)."""
 
 import pytest
 from zelda_miloutte.world.tilemap import TileMap
@@ -13,8 +13,12 @@ from zelda_miloutte.pathfinding import (
     _is_walkable,
     find_cover_position,
     find_flanking_position,
+    get_flow_field,
+    FlowField,
+    FLOW_FIELD_RADIUS,
     HAZARD_TILES,
 )
+from zelda_miloutte.world.tile import TileType
 from zelda_miloutte.settings import TILE_SIZE
 
 
@@ -247,3 +251,86 @@ class TestFlankingPosition:
         # Ally and target at same position
         result = find_flanking_position(tm, 48, 48, 48, 48)
         assert result is None
+
+
+class TestFlowField:
+    def test_distances_route_around_walls(self, corridor_map_data):
+        tm = TileMap(corridor_map_data)
+        field = FlowField(tm, (5, 1))
+        assert field.distance(*tile_to_pixel(5, 1)) == 0
+        # (1, 1) must detour through the gap at row 3
+        assert field.distance(*tile_to_pixel(1, 1)) == 8
+        assert field.distance(*tile_to_pixel(3, 1)) is None  # wall
+
+    def test_next_step_reaches_goal(self, corridor_map_data):
+        tm = TileMap(corridor_map_data)
+        field = FlowField(tm, (5, 5))
+        pos = tile_to_pixel(1, 1)
+        visited = [pixel_to_tile(*pos)]
+        while True:
+            step = field.next_step(*pos)
+            if step is None:
+                break
+            pos = step
+            visited.append(pixel_to_tile(*pos))
+        assert visited[-1] == (5, 5)
+        assert len(visited) - 1 == field.distance(*tile_to_pixel(1, 1))
+        assert all(_is_walkable(tm, c, r) for c, r in visited)
+
+    def test_hazards_are_avoided(self):
+        map_data = [
+            [0, 0, 0, 0, 0],
+            [0, 9, 9, 9, 0],  # 9 = SPIKES
+            [0, 0, 0, 0, 0],
+        ]
+        tm = TileMap(map_data)
+        field = FlowField(tm, (2, 2))
+        assert field.distance(*tile_to_pixel(2, 1)) is None
+        assert field.distance(*tile_to_pixel(2, 0)) == 6
+        # Standing on a hazard steps to the nearest reachable neighbor
+        assert field.next_step(*tile_to_pixel(2, 1)) == tile_to_pixel(2, 2)
+
+    def test_field_cached_per_goal_tile(self, open_map_data):
+        tm = TileMap(open_map_data)
+        field = get_flow_field(tm, 48, 48)
+        assert get_flow_field(tm, 40, 60) is field  # same tile
+        assert get_flow_field(tm, 48 + TILE_SIZE, 48) is not field
+
+    def test_field_rebuilt_after_tile_change(self, open_map_data):
+        tm = TileMap(open_map_data)
+        field = get_flow_field(tm, 48, 48)
+        tm.set_tile(2, 1, TileType.WALL)
+        rebuilt = get_flow_field(tm, 48, 48)
+        assert rebuilt is not field
+        assert rebuilt.distance(*tile_to_pixel(2, 1)) is None
+
+    def test_search_stops_at_chase_radius(self):
+        from zelda_miloutte.entities.enemy import Enemy
+        from zelda_miloutte.entities.entity import Entity
+        tm = TileMap([[0] * 60 for _ in range(5)])
+        field = FlowField(tm, (0, 2))
+        assert field.distance(*tile_to_pixel(FLOW_FIELD_RADIUS, 2)) == FLOW_FIELD_RADIUS
+        assert field.distance(*tile_to_pixel(FLOW_FIELD_RADIUS + 1, 2)) is None
+        assert sum(d >= 0 for d in field._dist) < tm.cols * tm.rows // 2
+        # An enemy outside the radius gets no field and moves on its own
+        player = Entity(*tile_to_pixel(0, 2), 1, 1, (0, 0, 0))
+        far = Enemy(*tile_to_pixel(40, 2))
+        assert far._follow_path(tm, player, 90.0) is None
+        near = Enemy(*tile_to_pixel(10, 2))
+        assert near._follow_path(tm, player, 90.0)[:2] == tile_to_pixel(9, 2)
+
+    def test_enemy_chase_uses_field_without_budget(self, corridor_map_data):
+        from zelda_miloutte.entities.enemy import Enemy
+        from zelda_miloutte.entities.entity import Entity
+        tm = TileMap(corridor_map_data)
+        player = Entity(*tile_to_pixel(5, 1), 1, 1, (0, 0, 0))
+        # Exhaust the A* budget: flow-field chasing must not depend on it
+        for _ in range(3):
+            find_path(tm, 48, 48, 48, 48)
+        field = get_flow_field(tm, player.center_x, player.center_y)
+        for row in (1, 2, 4, 5):
+            enemy = Enemy(*tile_to_pixel(1, row))
+            step = enemy._follow_path(tm, player, 90.0)
+            assert step is not None
+            assert field.distance(*step[:2]) < field.distance(enemy.center_x, enemy.center_y)
+
@@ -0,0 +1,121 @@
+"""Tests for the frame profiler (scopes, stats, overlay and CSV export)."""
+
+import csv
+import pygame
+import pytest
+from zelda_miloutte import profiler as profiler_mod
+from zelda_miloutte.profiler import FrameProfiler, SCOPES, COUNTERS, profiler
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput, random_script, tap
+from zelda_miloutte.entities.entity import Entity
+from zelda_miloutte.states.gameplay_state import count_on_screen
+from zelda_miloutte.states.play_state import PlayState
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_profiler():
+    yield
+    profiler.close_csv()
+    if profiler.overlay_visible:
+        profiler.toggle_overlay()
+
+
+class TestFrameProfiler:
+    def test_disabled_records_nothing(self):
+        prof = FrameProfiler()
+        prof.begin_frame()
+        with prof.scope("update"):
+            pass
+        prof.count("blits", 3)
+        prof.end_frame()
+        assert prof.frames == 0
+        assert prof.scope_names() == []
+
+    def test_scopes_accumulate_per_frame(self):
+        prof = FrameProfiler()
+        prof.toggle_overlay()
+        prof.begin_frame()
+        for _ in range(2):
+            prof.add_time("update.enemies", 0.002)
+        prof.count("blits", 3)
+        prof.count("blits", 4)
+        prof.end_frame()
+        avg, p99 = prof.stats("update.enemies")
+        assert avg == pytest.approx(4.0)
+        assert p99 == pytest.approx(4.0)
+        assert prof.counters == {"blits": 7}
+
+    def test_missing_scope_counts_as_zero(self):
+        prof = FrameProfiler()
+        prof.toggle_overlay()
+        prof.begin_frame()
+        prof.add_time("draw", 0.010)
+        prof.end_frame()
+        prof.begin_frame()
+        prof.end_frame()
+        assert prof.stats("draw")[0] == pytest.approx(5.0)
+
+    def test_p99_over_history_window(self):
+        prof = FrameProfiler(history=100)
+        prof.toggle_overlay()
+        for i in range(150):
+            prof.begin_frame()
+            prof.add_time("update", 0.001 * (50 if i == 149 else 1))
+            prof.end_frame()
+        avg, p99 = prof.stats("update")
+        assert p99 == pytest.approx(50.0)
+        assert avg == pytest.approx((99 * 1.0 + 50.0) / 100)
+
+    def test_profiled_decorator(self):
+        calls = []
+
+        @profiler_mod.profiled("update.items")
+        def work(x):
+            calls.append(x)
+            return x * 2
+
+        assert work(2) == 4
+        profiler.toggle_overlay()
+        profiler.begin_frame()
+        assert work(3) == 6
+        profiler.end_frame()
+        assert calls == [2, 3]
+        assert "update.items" in profiler.scope_names()
+
+
+class TestGameIntegration:
+    def test_f3_toggles_overlay_and_times_subsystems(self):
+        script = tap(pygame.K_F3, 0) + random_script(120, seed=1)
+        game = Game(headless=True, input_script=ScriptedInput(script))
+        game.push_state(PlayState(game))
+        game.simulate(120)
+        assert profiler.overlay_visible
+        names = profiler.scope_names()
+        for name in ("update", "update.movement", "update.enemies", "draw",
+                     "draw.tilemap", "draw.entities", "draw.hud", "draw.minimap"):
+            assert name in names
+        assert profiler.counters["blits"] > 0
+        assert profiler.counters["enemies"] > 0
+        assert profiler.counters["entities_drawn"] > 0
+
+    def test_entities_drawn_skips_offscreen(self):
+        camera = type("Camera", (), {"x": 0.0, "y": 0.0})()
+        on = Entity(10, 10, 16, 16, (0, 0, 0))
+        off = Entity(5000, 5000, 16, 16, (0, 0, 0))
+        assert count_on_screen(camera, [on, off], (off,)) == 1
+
+    def test_csv_export_from_env(self, tmp_path, monkeypatch):
+        path = tmp_path / "frames.csv"
+        monkeypatch.setenv(profiler_mod.PROFILE_CSV_ENV, str(path))
+        game = Game(headless=True, input_script=ScriptedInput(random_script(30, seed=2)))
+        game.push_state(PlayState(game))
+        game.simulate(30)
+        profiler.close_csv()
+        assert not profiler.enabled
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 30
+        expected = ["frame", "frame_ms"] + [f"{s}_ms" for s in SCOPES] + list(COUNTERS)
+        assert list(rows[0]) == expected
+        assert float(rows[-1]["draw.tilemap_ms"]) > 0
+        assert int(rows[-1]["blits"]) > 0
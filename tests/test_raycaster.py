@@ -0,0 +1,181 @@
+"""Tests for the vectorized raycaster against the pure-Python DDA."""
+
+import math
+import random
+import pygame
+import pytest
+from zelda_miloutte import raycaster as raycaster_mod
+from zelda_miloutte.raycaster import Raycaster, MAX_DEPTH
+from zelda_miloutte.states.dungeon3d_state import DUNGEON_3D_MAP
+
+needs_numpy = pytest.mark.skipif(raycaster_mod.np is None, reason="NumPy not installed")
+
+
+def _viewpoints(map_data, count, seed=0):
+    rng = random.Random(seed)
+    free = [(c + 0.5, r + 0.5) for r, row in enumerate(map_data)
+            for c, v in enumerate(row) if v == 0]
+    for _ in range(count):
+        x, y = rng.choice(free)
+        yield x + rng.uniform(-0.4, 0.4), y + rng.uniform(-0.4, 0.4), rng.uniform(-7, 7)
+
+
+@needs_numpy
+class TestVectorizedCaster:
+    def test_matches_python_dda(self):
+        rc = Raycaster(DUNGEON_3D_MAP)
+        for px, py, angle in _viewpoints(DUNGEON_3D_MAP, 60):
+            arrays = rc.cast_ray_arrays(px, py, angle)
+            assert list(zip(*(a.tolist() for a in arrays))) == rc._cast_rays_py(px, py, angle)
+            assert rc.cast_rays(px, py, angle) == [
+                hit[:3] for hit in rc._cast_rays_py(px, py, angle)]
+
+    def test_axis_aligned_and_open_maps(self):
+        # Exercises the 1e-8 direction guards and rays that never hit a wall
+        open_map = [[0] * 60 for _ in range(3)]
+        for map_data in (DUNGEON_3D_MAP, open_map):
+            rc = Raycaster(map_data)
+            for angle in (0.0, math.pi / 2, math.pi, -math.pi / 2, math.pi / 6):
+                arrays = rc.cast_ray_arrays(1.5, 1.5, angle)
+                assert list(zip(*(a.tolist() for a in arrays))) == rc._cast_rays_py(1.5, 1.5, angle)
+
+    def test_out_of_bounds_reads_as_stone(self):
+        rc = Raycaster([[0, 0], [0, 0]])
+        dists, wall_types, sides, _ = rc.cast_ray_arrays(1.0, 1.0, 0.0)
+        assert (wall_types == 1).all()
+        assert (dists < MAX_DEPTH).all()
+
+    def test_full_strip_resolution(self):
+        rc = Raycaster(DUNGEON_3D_MAP)
+        assert rc.strip_width == 1
+        assert len(rc.cast_ray_arrays(3.5, 3.5, 0.0)[0]) == rc.width
+
+
+def test_python_fallback(monkeypatch):
+    monkeypatch.setattr(raycaster_mod, "np", None)
+    rc = Raycaster(DUNGEON_3D_MAP)
+    assert rc.strip_width == 2
+    dists, wall_types, sides, _ = rc.cast_ray_arrays(3.5, 3.5, 0.0)
+    assert list(zip(dists, wall_types, sides)) == rc.cast_rays(3.5, 3.5, 0.0)
+    assert len(dists) == rc.num_rays
+
+
+class TestWallPass:
+    def test_background_is_baked_once_per_resolution(self):
+        bg = raycaster_mod.get_background(64, 48)
+        assert raycaster_mod.get_background(64, 48) is bg
+        assert raycaster_mod.get_background(32, 48) is not bg
+        assert bg.get_at((0, 0))[:3] == raycaster_mod.FOG_COLOR
+
+    def test_wall_lut_shades_sides_and_fog(self):
+        lut = raycaster_mod.build_wall_lut()
+        near_front, near_side = lut[3][0][0], lut[3][1][0]
+        assert all(s < f for s, f in zip(near_side, near_front))
+        far = lut[3][0][raycaster_mod.FOG_BUCKETS - 1]
+        assert all(abs(c - f) <= 3 for c, f in zip(far, raycaster_mod.FOG_COLOR))
+        # Unknown wall types fall back to stone
+        assert lut[0] == lut[1]
+
+    def test_walls_drawn_from_lut(self):
+        rc = Raycaster(DUNGEON_3D_MAP, textured=False)
+        rc.render(rc.surface.copy(), 3.5, 3.5, 0.3)
+        dists, wall_types, sides, _ = (list(a) for a in rc.cast_ray_arrays(3.5, 3.5, 0.3))
+        lut = raycaster_mod.build_wall_lut()
+        half_h = rc.height // 2
+        for i in range(0, rc.num_rays, 97):
+            if dists[i] >= MAX_DEPTH:
+                continue
+            bucket = min(raycaster_mod.FOG_BUCKETS - 1,
+                         int(dists[i] * raycaster_mod.FOG_BUCKETS / MAX_DEPTH))
+            expected = lut[wall_types[i]][sides[i]][bucket]
+            assert tuple(rc.surface.get_at((i * rc.strip_width, half_h)))[:3] == expected
+
+
+class TestTexturedWalls:
+    def test_wall_x_in_unit_range(self):
+        rc = Raycaster(DUNGEON_3D_MAP)
+        for px, py, angle in _viewpoints(DUNGEON_3D_MAP, 10, seed=5):
+            wall_xs = list(rc.cast_ray_arrays(px, py, angle)[3])
+            assert all(0.0 <= u <= 1.0 for u in wall_xs)
+
+    def test_textures_are_shaded_and_fogged(self):
+        textures = raycaster_mod.get_wall_textures()
+        assert raycaster_mod.get_wall_textures() is textures
+        columns = textures[1][0][0]
+        assert columns[0].get_height() == raycaster_mod.get_tile_surface(1).get_height()
+        near = columns[3].get_at((0, 5))
+        shaded = textures[1][1][0][3].get_at((0, 5))
+        far = textures[1][0][raycaster_mod.TEXTURE_FOG_BUCKETS - 1][3].get_at((0, 5))
+        assert shaded[0] < near[0]
+        assert all(abs(c - f) < abs(n - f) for c, n, f in
+                   zip(far[:3], near[:3], raycaster_mod.FOG_COLOR))
+
+    def test_textured_wall_samples_hit_column(self):
+        # Facing a flat wall head on: the wall is drawn with texture detail
+        rc = Raycaster([[1, 1, 1], [1, 0, 1], [1, 0, 1], [1, 1, 1]])
+        rc.render(rc.surface.copy(), 1.5, 2.5, -math.pi / 2)
+        mid = rc.height // 2
+        row = {tuple(rc.surface.get_at((x, mid)))[:3] for x in range(rc.width)}
+        assert len(row) > 2
+
+    def test_strip_cache_is_bounded_by_bytes(self, monkeypatch):
+        budget = 64 * 1024
+        monkeypatch.setattr(raycaster_mod, "WALL_STRIP_CACHE_MAX_BYTES", budget)
+        rc = Raycaster(DUNGEON_3D_MAP)
+        # Hugging a wall: strips are several times the view height
+        rc.render(rc.surface.copy(), 1.2, 1.5, math.pi)
+        rc.render(rc.surface.copy(), 3.5, 3.5, 0.3)
+        sizes = [raycaster_mod._surface_bytes(s) for s in rc._strip_cache.values()]
+        assert rc._strip_cache_bytes == sum(sizes)
+        assert budget - max(sizes) < rc._strip_cache_bytes <= budget
+
+    def test_quantized_heights(self):
+        for h in (1, 7, 64, 300, 1000, 2400):
+            q = raycaster_mod._quantize_wall_height(h)
+            assert abs(q - h) <= max(2, h >> 5)
+            assert q >= 1
+
+
+class TestSprites:
+    def test_visible_runs_match_column_scan(self):
+        rc = Raycaster(DUNGEON_3D_MAP)
+        rng = random.Random(3)
+        z_buffer = [rng.choice((1.0, 5.0)) for _ in range(rc.num_rays)]
+        for x0, x1 in ((-30, 90), (100, 400), (700, 900), (250, 251)):
+            visible = [c for c in range(max(0, x0), min(rc.width, x1))
+                       if 3.0 < z_buffer[c // rc.strip_width]]
+            runs = rc._visible_runs(x0, x1, 3.0, z_buffer)
+            assert [c for a, b in runs for c in range(a, b)] == visible
+            # Runs are maximal: no two touch
+            assert all(a[1] < b[0] for a, b in zip(runs, runs[1:]))
+
+    def test_scaled_sprites_are_lru_cached(self, monkeypatch):
+        monkeypatch.setattr(raycaster_mod, "_sprite_cache", raycaster_mod.OrderedDict())
+        monkeypatch.setattr(raycaster_mod, "SPRITE_CACHE_SIZE", 2)
+        src = pygame.Surface((8, 8), pygame.SRCALPHA)
+        a = raycaster_mod.get_sprite_surface(src, 40, 3)
+        assert raycaster_mod.get_sprite_surface(src, 40, 3) is a
+        b = raycaster_mod.get_sprite_surface(src, 44, 3)
+        raycaster_mod.get_sprite_surface(src, 40, 3)   # refresh a
+        raycaster_mod.get_sprite_surface(src, 48, 3)   # evicts b
+        assert raycaster_mod.get_sprite_surface(src, 40, 3) is a
+        assert raycaster_mod.get_sprite_surface(src, 44, 3) is not b
+
+    def test_fog_keeps_transparency(self):
+        src = pygame.Surface((4, 4), pygame.SRCALPHA)
+        src.fill((250, 250, 250, 255), (0, 0, 2, 4))
+        fogged = raycaster_mod.get_sprite_surface(src, 8, raycaster_mod.SPRITE_FOG_BUCKETS - 1)
+        assert fogged.get_at((7, 0))[3] == 0
+        r, g, b, a = fogged.get_at((0, 0))
+        assert a == 255 and r < 250
+
+    def test_sprite_clipped_by_walls(self):
+        rc = Raycaster([[0] * 40 for _ in range(3)])
+        src = pygame.Surface((8, 8))
+        src.fill((255, 0, 255))
+        z_buffer = [0.5 if i < rc.num_rays // 2 else MAX_DEPTH for i in range(rc.num_rays)]
+        rc.surface.fill((0, 0, 0))
+        rc._render_sprites(1.0, 1.5, 0.0, [(3.0, 1.5, (0, 0, 0), 1.0, src, None)], z_buffer)
+        mid = rc.height // 2
+        assert rc.surface.get_at((rc.width // 2 - 5, mid))[:3] == (0, 0, 0)
+        assert rc.surface.get_at((rc.width // 2 + 5, mid))[:3] != (0, 0, 0)
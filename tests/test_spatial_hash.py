@@ -0,0 +1,57 @@
+"""Tests for the SpatialHash collision index."""
+
+import random
+import pygame
+from zelda_miloutte.entities.entity import Entity
+from zelda_miloutte.spatial_hash import SpatialHash
+
+
+def _entity(x, y, size=28):
+    return Entity(x, y, size, size, (0, 0, 0))
+
+
+def _linear(entities, rect):
+    return [e for e in entities if e.alive and rect.colliderect(e.rect)]
+
+
+class TestSpatialHash:
+    def test_query_rect_matches_linear_scan(self):
+        rng = random.Random(7)
+        entities = [_entity(rng.uniform(-50, 900), rng.uniform(-50, 700), rng.randint(8, 80))
+                    for _ in range(300)]
+        grid = SpatialHash()
+        grid.sync(entities)
+        for _ in range(100):
+            rect = pygame.Rect(rng.randint(-60, 880), rng.randint(-60, 680),
+                               rng.randint(1, 120), rng.randint(1, 120))
+            assert grid.query_rect(rect) == _linear(entities, rect)
+
+    def test_results_follow_list_order(self):
+        a, b, c = _entity(10, 10), _entity(12, 12), _entity(14, 14)
+        grid = SpatialHash()
+        grid.sync([c, a, b])
+        assert grid.query_rect(pygame.Rect(0, 0, 64, 64)) == [c, a, b]
+
+    def test_sync_tracks_moves_and_removals(self):
+        a, b = _entity(0, 0), _entity(200, 200)
+        grid = SpatialHash()
+        grid.sync([a, b])
+        a.x, a.y = 400, 400
+        b.alive = False
+        grid.sync([a, b])
+        assert len(grid) == 1
+        assert grid.query_rect(pygame.Rect(0, 0, 40, 40)) == []
+        assert grid.query_rect(pygame.Rect(390, 390, 20, 20)) == [a]
+        grid.sync([])
+        assert len(grid) == 0
+        assert grid._cells == {}
+
+    def test_query_radius(self):
+        near, corner, far = _entity(100, 100, 20), _entity(140, 140, 20), _entity(300, 300, 20)
+        grid = SpatialHash()
+        grid.sync([near, corner, far])
+        # Circle at (90, 110) r=15 reaches into near but not corner
+        assert grid.query_radius(90, 110, 15) == [near]
+        # Closest point of corner is (140, 140): distance sqrt(2) * 20 ~ 28.3
+        assert grid.query_radius(120, 120, 28) == [near]
+        assert grid.query_radius(120, 120, 29) == [near, corner]
@@ -0,0 +1,63 @@
+"""Parity tests for the NumPy synthesis backend of SoundManager."""
+
+import array
+import pytest
+from zelda_miloutte import sounds as sounds_mod
+from zelda_miloutte.sounds import SoundManager
+
+np = pytest.importorskip("numpy")
+
+# Maximum allowed difference between backends, in 16-bit sample units
+TOLERANCE = 1
+
+
+@pytest.fixture
+def sm():
+    manager = SoundManager.__new__(SoundManager)
+    manager.sample_rate = 22050
+    manager._audio_cache = None
+    return manager
+
+
+def _python_backend(monkeypatch, fn, *args):
+    monkeypatch.setattr(sounds_mod, "np", None)
+    try:
+        return fn(*args)
+    finally:
+        monkeypatch.undo()
+
+
+def _assert_close(fast, slow):
+    assert isinstance(fast, array.array) and fast.typecode == 'h'
+    assert len(fast) == len(slow)
+    diff = np.abs(np.asarray(fast, dtype=np.int32) - np.asarray(slow, dtype=np.int32))
+    assert diff.max(initial=0) <= TOLERANCE
+
+
+class TestSynthesisParity:
+    @pytest.mark.parametrize("tone_type", ["sine", "triangle", "square"])
+    @pytest.mark.parametrize("warm", [True, False])
+    @pytest.mark.parametrize("frequency,duration", [(466, 0.15), (117, 0.9), (659, 0.05)])
+    def test_make_note_matches_python(self, sm, monkeypatch, tone_type, warm, frequency, duration):
+        fast = sm._make_note(frequency, duration, 0.3, warm, tone_type)
+        slow = _python_backend(monkeypatch, sm._make_note, frequency, duration, 0.3, warm, tone_type)
+        _assert_close(fast, slow)
+
+    def test_envelope_array_matches_scalar(self, sm):
+        t = np.arange(0, 0.6, 1 / 2205)
+        expected = [sm._envelope(x, 0.6, 0.08, 0.15, 0.6, 0.2) for x in t]
+        assert np.allclose(sm._envelope_array(t, 0.6, 0.08, 0.15, 0.6, 0.2), expected)
+
+    def test_mix_layers_matches_python(self, sm, monkeypatch):
+        a = array.array('h', [32000, -32000, 5, -5, 100] * 50)
+        b = array.array('h', [32000, -32000, -2, 3] * 30)
+        c = array.array('h')
+        fast = sm._mix_layers(a, b, c)
+        slow = _python_backend(monkeypatch, sm._mix_layers, a, b, c)
+        assert fast == slow
+
+    def test_notes_to_samples_matches_python(self, sm, monkeypatch):
+        notes = [(262, 0.1), (0, 0.05), (330, 0.12)]
+        fast = sm._notes_to_samples(notes, amplitude=0.25, warm=True, tone_type='triangle')
+        slow = _python_backend(monkeypatch, sm._notes_to_samples, notes, 0.25, True, 'triangle')
+        _assert_close(fast, slow)
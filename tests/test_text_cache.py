@@ -0,0 +1,98 @@
+"""Tests for the shared text render cache and glyph atlases."""
+
+import pygame
+import pytest
+from zelda_miloutte import text_cache
+from zelda_miloutte.hud import HUD
+from zelda_miloutte.entities.player import Player
+from zelda_miloutte.ui.floating_text import FloatingText
+
+
+class _Camera:
+    x = 0.0
+    y = 0.0
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    text_cache.clear_cache()
+    yield
+    text_cache.clear_cache()
+
+
+class TestRenderCache:
+    def test_fonts_are_shared(self):
+        assert text_cache.get_font(24) is text_cache.get_font(24)
+        assert text_cache.get_font(24) is not text_cache.get_font(18)
+
+    def test_render_is_cached(self):
+        surf = text_cache.render("Hello", 24, (255, 255, 255))
+        assert text_cache.render("Hello", 24, [255, 255, 255]) is surf
+        assert text_cache.render("Hello", 24, (255, 0, 0)) is not surf
+        assert text_cache.stats == {"hits": 1, "misses": 2}
+
+    def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        monkeypatch.setattr(text_cache, "TEXT_CACHE_SIZE", 2)
+        a = text_cache.render("a", 20, (0, 0, 0))
+        text_cache.render("b", 20, (0, 0, 0))
+        text_cache.render("a", 20, (0, 0, 0))
+        text_cache.render("c", 20, (0, 0, 0))
+        assert text_cache.render("a", 20, (0, 0, 0)) is a
+        assert len(text_cache._cache) == 2
+        assert ("b", 20, (0, 0, 0), True) not in text_cache._cache
+
+    def test_faded_draw_does_not_leak_alpha(self):
+        screen = pygame.Surface((100, 40))
+        text_cache.draw(screen, "Hi", 24, (255, 255, 255), (0, 0), alpha=40)
+        assert text_cache.render("Hi", 24, (255, 255, 255)).get_alpha() == 255
+
+
+class TestGlyphAtlas:
+    def test_atlas_draws_numbers(self):
+        atlas = text_cache.get_atlas(20, (255, 255, 255))
+        assert text_cache.get_atlas(20, (255, 255, 255)) is atlas
+        assert atlas.supports("12.5") and not atlas.supports("CRIT 12!")
+        screen = pygame.Surface((100, 40))
+        rect = atlas.draw(screen, "88", (10, 5))
+        assert rect.size == atlas.size("88") == (2 * atlas.size("8")[0], atlas.height)
+        lit = pygame.mask.from_threshold(screen, (255, 255, 255), (60, 60, 60, 255)).count()
+        assert lit > 0
+        assert screen.get_bounding_rect().colliderect(rect)
+
+    @pytest.mark.parametrize("size", [18, 20, 26])
+    @pytest.mark.parametrize("text", ["123", "2.5", "-12", "+40"])
+    def test_atlas_width_matches_font(self, size, text):
+        atlas = text_cache.get_atlas(size, (255, 255, 255))
+        assert abs(atlas.size(text)[0] - text_cache.get_font(size).size(text)[0]) <= 2
+
+    def test_glyph_edges_keep_color(self):
+        atlas = text_cache.get_atlas(20, (255, 200, 50))
+        for x in range(atlas.surface.get_width()):
+            for y in range(atlas.height):
+                r, g, b, a = atlas.surface.get_at((x, y))
+                if a:
+                    assert (r, g, b) == (255, 200, 50)
+
+
+class TestCallers:
+    def test_damage_numbers_use_the_atlas(self):
+        screen = pygame.Surface((200, 200))
+        texts = [FloatingText(str(n), 100, 100) for n in range(30)]
+        texts.append(FloatingText("LEVEL UP!", 100, 50, size=28))
+        for _ in range(3):
+            for ft in texts:
+                ft.update(0.01)
+                ft.draw(screen, _Camera())
+        assert all(ft._atlas is not None for ft in texts[:30])
+        assert texts[-1]._atlas is None
+        assert text_cache.stats["misses"] == 1
+
+    def test_hud_rerenders_nothing_when_idle(self):
+        screen = pygame.Surface((800, 600))
+        hud = HUD()
+        player = Player(100, 100)
+        hud.draw(screen, player)
+        misses = text_cache.stats["misses"]
+        for _ in range(5):
+            hud.draw(screen, player)
+        assert text_cache.stats["misses"] == misses
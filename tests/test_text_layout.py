@@ -0,0 +1,80 @@
+"""Tests for cached word-wrap layout and the dialogue/textbox reveal."""
+
+import pygame
+import pytest
+from zelda_miloutte.ui import text_layout
+from zelda_miloutte.ui.dialogue_box import DialogueBox
+from zelda_miloutte.ui.textbox import TextBox
+from zelda_miloutte.ui.text_layout import wrap_lines, get_layout
+
+TEXT = ("The old hermit says the forest temple opens only when the three "
+        "crystals glow together under a full moon.")
+
+
+@pytest.fixture
+def font():
+    return pygame.font.Font(None, 24)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    text_layout.clear_cache()
+    yield
+    text_layout.clear_cache()
+
+
+class TestWrap:
+    def test_lines_fit_and_cover_text(self, font):
+        lines = wrap_lines(TEXT, font, 200)
+        assert len(lines) > 2
+        assert all(font.size(line)[0] <= 200 for _, line in lines)
+        assert " ".join(line for _, line in lines) == TEXT
+        for start, line in lines:
+            assert TEXT[start:start + len(line)] == line
+
+    def test_long_word_gets_own_line(self, font):
+        lines = wrap_lines("a " + "x" * 60 + " b", font, 50)
+        assert [line for _, line in lines] == ["a", "x" * 60, "b"]
+
+
+class TestLayout:
+    def test_layout_cached_and_lines_rendered_once(self, font):
+        layout = get_layout(TEXT, font, 200, (255, 255, 255))
+        assert get_layout(TEXT, font, 200, [255, 255, 255]) is layout
+        assert get_layout(TEXT, font, 300, (255, 255, 255)) is not layout
+        screen = pygame.Surface((400, 200))
+        layout.draw(screen, 0, 0)
+        surfaces = list(layout._surfaces)
+        layout.draw(screen, 0, 0)
+        assert layout._surfaces == surfaces and None not in surfaces
+
+    def test_reveal_clips_lines(self, font):
+        layout = get_layout(TEXT, font, 200, (255, 255, 255))
+        screen = pygame.Surface((400, 200), pygame.SRCALPHA)
+        layout.draw(screen, 0, 0, revealed=3)
+        assert screen.get_bounding_rect().height <= layout.line_height
+        assert screen.get_bounding_rect().width <= font.size(TEXT[:3])[0]
+        assert layout._surfaces[1] is None
+
+
+class TestBoxes:
+    def test_dialogue_typewriter_reuses_layout(self):
+        box = DialogueBox()
+        box.show("Hermit", [TEXT])
+        screen = pygame.Surface((800, 600))
+        box.update(0.5)
+        box.draw(screen)
+        layout = get_layout(TEXT, box.font, box.width - 2 * box.padding, (255, 255, 255))
+        box.update(2.0)
+        box.draw(screen)
+        assert len(text_layout._layouts) == 1
+        assert layout._surfaces[0] is not None
+
+    def test_textbox_draws_full_text_when_revealed(self):
+        box = TextBox()
+        box.show(TEXT)
+        box.update(10.0)
+        screen = pygame.Surface((800, 600))
+        box.draw(screen)
+        (layout,) = text_layout._layouts.values()
+        assert None not in layout._surfaces
@@ -106,3 +106,72 @@ class TestTileMapCollision:
         e.vx = 10
         tm.resolve_collision_x(e)
         assert e.x == original_x  # No change; no wall nearby
+
+
+class _FixedCamera:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class TestTileMapChunks:
+    def _draw_per_tile(self, tm, camera, size):
+        import pygame
+        surf = pygame.Surface(size)
+        for row in range(tm.rows):
+            for col in range(tm.cols):
+                surf.blit(tm._tile_surface_grid[row][col],
+                          (col * TILE_SIZE - int(camera.x), row * TILE_SIZE - int(camera.y)))
+        return surf
+
+    def test_chunked_draw_matches_per_tile_draw(self):
+        import pygame
+        from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+        map_data = [[(c * 3 + r) % 6 for c in range(40)] for r in range(30)]
+        tm = TileMap(map_data)
+        camera = _FixedCamera(137, 61)
+        expected = self._draw_per_tile(tm, camera, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        tm.draw(actual, camera)
+        for x in range(0, SCREEN_WIDTH, 7):
+            for y in range(0, SCREEN_HEIGHT, 7):
+                assert actual.get_at((x, y)) == expected.get_at((x, y))
+
+    def test_draw_only_builds_visible_chunks(self):
+        import pygame
+        from zelda_miloutte.world.tilemap import CHUNK_SIZE
+        map_data = [[0] * (CHUNK_SIZE * 10) for _ in range(CHUNK_SIZE * 10)]
+        tm = TileMap(map_data)
+        tm.draw(pygame.Surface((800, 600)), _FixedCamera(0, 0))
+        assert 0 < len(tm._chunk_cache) < 100
+        assert (9, 9) not in tm._chunk_cache
+
+    def test_set_tile_patches_cached_chunk(self, simple_map_data):
+        import pygame
+        tm = TileMap([row[:] for row in simple_map_data])
+        tm.draw(pygame.Surface((800, 600)), _FixedCamera(0, 0))
+        chunk = tm._chunk_cache[(0, 0)]
+        tm.set_tile(2, 2, TileType.WALL)
+        assert tm._chunk_cache[(0, 0)] is chunk
+        wall = tm._tile_surface_grid[0][0]
+        for off in (0, 5, TILE_SIZE - 1):
+            assert chunk.get_at((2 * TILE_SIZE + off, 2 * TILE_SIZE + off)) == wall.get_at((off, off))
+        assert tm.get_tile(2, 2) == TileType.WALL
+        assert tm.data[2][2] == TileType.WALL.value
+        assert tm.is_solid(2, 2) is True
+
+    def test_set_tiles_returns_only_changed_cells(self, simple_map_data):
+        tm = TileMap([row[:] for row in simple_map_data])
+        changed = tm.set_tiles([
+            (1, 1, TileType.GRASS),   # unchanged
+            (2, 2, TileType.WALL),
+            (3, 3, TileType.FLOOR),
+        ])
+        assert changed == [(2, 2), (3, 3)]
+
+    def test_find_tiles(self, simple_map_data):
+        tm = TileMap(simple_map_data)
+        found = tm.find_tiles((TileType.GRASS, TileType.LAVA))
+        assert len(found[TileType.GRASS]) == 9
+        assert (2, 2) in found[TileType.GRASS]
+        assert found[TileType.LAVA] == []
@@ -0,0 +1,96 @@
+"""Tests for the TileMap solid/hazard/walkable grids."""
+
+import random
+import pytest
+from zelda_miloutte import pathfinding
+from zelda_miloutte.pathfinding import find_path, find_cover_position, reset_pathfind_budget, tile_to_pixel
+from zelda_miloutte.world.tile import TileType, HAZARD_TILES
+from zelda_miloutte.world.tilemap import TileMap
+
+# The pre-grid TileType.solid, rebuilding its tuple on every call
+_LEGACY_SOLID = lambda tile: tile in (  # noqa: E731
+    TileType.WALL, TileType.TREE, TileType.ROCK, TileType.WATER, TileType.PIT,
+    TileType.BARRIER_RED, TileType.BARRIER_BLUE, TileType.FROZEN_WALL,
+    TileType.CRACKED_WALL,
+)
+
+
+def _legacy_is_solid(tilemap, col, row):
+    return _LEGACY_SOLID(tilemap.get_tile(col, row))
+
+
+def _legacy_is_walkable(tilemap, col, row, avoid_hazards=True):
+    if col < 0 or row < 0 or row >= tilemap.rows or col >= tilemap.cols:
+        return False
+    tile = tilemap.get_tile(col, row)
+    if _LEGACY_SOLID(tile):
+        return False
+    if avoid_hazards and tile in HAZARD_TILES:
+        return False
+    return True
+
+
+def _maze(cols=60, rows=45, seed=3):
+    rng = random.Random(seed)
+    tiles = [0, 0, 0, 0, 0, 1, 2, 9, 18]  # grass-heavy with walls, trees, spikes, lava
+    data = [[rng.choice(tiles) for _ in range(cols)] for _ in range(rows)]
+    for row in data:
+        row[0] = row[-1] = 1
+    data[0] = [1] * cols
+    data[-1] = [1] * cols
+    return data
+
+
+class TestTileMapGrids:
+    def test_grids_match_tile_properties(self):
+        tm = TileMap(_maze(20, 15))
+        for row in range(tm.rows):
+            for col in range(tm.cols):
+                tile = tm.get_tile(col, row)
+                assert tm.is_solid(col, row) is tile.solid
+                assert tm.is_hazard(col, row) is (tile in HAZARD_TILES)
+                assert tm.is_walkable(col, row) is (not tile.solid and tile not in HAZARD_TILES)
+
+    def test_out_of_bounds(self, simple_map_data):
+        tm = TileMap(simple_map_data)
+        assert tm.is_solid(-1, 0) is True
+        assert tm.is_solid(0, 99) is True
+        assert tm.is_walkable(5, 0) is False
+        assert tm.is_hazard(-3, -3) is False
+
+    def test_set_tiles_keeps_grids_in_sync(self, simple_map_data):
+        tm = TileMap(simple_map_data)
+        tm.set_tiles([(1, 1, TileType.WALL), (2, 2, TileType.LAVA)])
+        assert tm.is_solid(1, 1) and not tm.is_walkable(1, 1)
+        assert tm.is_hazard(2, 2) and not tm.is_solid(2, 2) and not tm.is_walkable(2, 2)
+        tm.set_tile(1, 1, TileType.GRASS)
+        assert tm.is_walkable(1, 1)
+
+
+class TestGridEquivalence:
+    """A* and cover search on the flag grids match per-tile TileType lookups.
+
+    The timing comparison lives in benchmarks/bench_tilemap_grids.py.
+    """
+
+    @pytest.fixture
+    def workload(self):
+        tm = TileMap(_maze())
+        rng = random.Random(11)
+        walkable = [(c, r) for r in range(tm.rows) for c in range(tm.cols) if tm.is_walkable(c, r)]
+        pairs = [(rng.choice(walkable), rng.choice(walkable)) for _ in range(40)]
+
+        def run():
+            out = []
+            for (sc, sr), (gc, gr) in pairs:
+                reset_pathfind_budget()
+                out.append(find_path(tm, *tile_to_pixel(sc, sr), *tile_to_pixel(gc, gr)))
+                out.append(find_cover_position(tm, *tile_to_pixel(sc, sr), *tile_to_pixel(gc, gr)))
+            return out
+        return run
+
+    def test_grids_match_tile_lookups(self, workload, monkeypatch):
+        fast = workload()
+        monkeypatch.setattr(pathfinding, "_is_walkable", _legacy_is_walkable)
+        monkeypatch.setattr(TileMap, "is_solid", _legacy_is_solid)
+        assert fast == workload()
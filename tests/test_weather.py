@@ -0,0 +1,104 @@
+"""Tests for pooled weather rendering and PlayState weather integration."""
+
+import pygame
+import pytest
+from zelda_miloutte import overlays, weather as weather_mod
+from zelda_miloutte.game import Game
+from zelda_miloutte.scripted_input import ScriptedInput, random_script
+from zelda_miloutte.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from zelda_miloutte.states.play_state import PlayState
+from zelda_miloutte.weather import WeatherManager, WeatherType, WEATHER_MAX_PARTICLES
+
+
+class _Camera:
+    x = 0.0
+    y = 0.0
+
+
+def _force(wm, weather_type, intensity=1.0):
+    wm.current_weather = wm.target_weather = weather_type
+    wm.intensity = wm.target_intensity = intensity
+    return wm
+
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+class TestWeatherRendering:
+    @pytest.mark.parametrize("weather_type", [WeatherType.STORM, WeatherType.SANDSTORM,
+                                              WeatherType.ASH_FALL, WeatherType.BLIZZARD])
+    def test_particles_stay_within_pool(self, weather_type, screen):
+        wm = _force(WeatherManager(), weather_type)
+        for _ in range(200):
+            wm.update(0.05)
+        assert 0 < len(wm._particles) <= WEATHER_MAX_PARTICLES
+        screen.fill((0, 0, 0))
+        wm.draw(screen, _Camera())
+        black = pygame.mask.from_threshold(screen, (0, 0, 0), (1, 1, 1, 255)).count()
+        assert black < SCREEN_WIDTH * SCREEN_HEIGHT
+
+    def test_pool_caps_heavy_spawns(self):
+        wm = _force(WeatherManager(), WeatherType.RAIN)
+        wm._particles.capacity = 50
+        for _ in range(20):
+            wm._spawn_rain(0.5)
+        assert len(wm._particles) == 50
+
+    def test_tint_overlay_is_reused(self, screen):
+        wm = _force(WeatherManager(), WeatherType.BLIZZARD, 0.5)
+        wm.draw(screen, _Camera())
+        tint = overlays.get_fill((220, 225, 240), screen.get_size())
+        assert tint.get_alpha() == 40
+        wm.intensity = 1.0
+        wm.draw(screen, _Camera())
+        assert overlays.get_fill((220, 225, 240), screen.get_size()) is tint
+        assert tint.get_alpha() == 80
+
+    def test_fog_rebuilt_only_when_intensity_changes(self, screen):
+        wm = _force(WeatherManager(), WeatherType.FOG)
+        wm.draw(screen, _Camera())
+        fog = wm._fog_surface
+        key = wm._fog_key
+        assert fog.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))[3] == 0
+        assert fog.get_at((0, 0))[3] == 160
+        fog.set_at((0, 0), (1, 2, 3, 4))
+        wm.draw(screen, _Camera())
+        assert wm._fog_key == key and fog.get_at((0, 0)) == (1, 2, 3, 4)
+        wm.intensity = 0.5
+        wm.draw(screen, _Camera())
+        assert wm._fog_surface is fog and fog.get_at((0, 0))[3] == 80
+
+    def test_lightning_flash(self, screen):
+        wm = _force(WeatherManager(), WeatherType.STORM)
+        wm._lightning_flash_alpha = 200
+        screen.fill((0, 0, 0))
+        wm.draw(screen, _Camera())
+        assert screen.get_at((5, 5))[0] > 150
+
+    def test_bolt_surfaces_are_cached(self):
+        assert weather_mod.get_bolt_surface(200) is weather_mod.get_bolt_surface(205)
+
+
+class TestPlayStateWeather:
+    def test_area_sets_weather_pool(self):
+        game = Game(headless=True, input_script=ScriptedInput())
+        game.push_state(PlayState(game, area_id="frozen_peaks"))
+        assert game.weather._area_id == "frozen_peaks"
+        assert game.current_state.weather is game.weather
+
+    def test_storm_during_gameplay(self):
+        game = Game(headless=True, input_script=ScriptedInput(random_script(90, seed=3)))
+        game.push_state(PlayState(game))
+        _force(game.weather, WeatherType.STORM)
+        game.simulate(90)
+        assert len(game.weather._particles) > 0
+
+    def test_blizzard_slows_player(self):
+        game = Game(headless=True, input_script=ScriptedInput())
+        state = PlayState(game, area_id="frozen_peaks")
+        game.push_state(state)
+        _force(game.weather, WeatherType.BLIZZARD)
+        vx, vy = game.weather.get_movement_modifier(100.0, 0.0)
+        assert vx == pytest.approx(80.0) and vy == 0.0
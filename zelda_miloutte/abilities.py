@@ -4,6 +4,7 @@ import math
 import pygame
 from .settings import TILE_SIZE, PLAYER_SPEED, PROJECTILE_SPEED
 from .entities.projectile import Projectile
+from .lighting import FIRE_PROJECTILE_LIGHT
 from .sprites.ability_sprites import (
     create_spin_arc_surface,
     create_fireball_surface,
@@ -284,6 +285,7 @@ class FireBlast(Ability):
         # Mark as player-owned so it doesn't hurt the player
         fireball.owner = "player"
         fireball.color = (255, 120, 30)
+        fireball.light = FIRE_PROJECTILE_LIGHT
         projectiles.append(fireball)
 
         # Emit fire particles at launch
@@ -4,9 +4,7 @@ import math
 import pygame
 from enum import Enum
 from .settings import TILE_SIZE
-from .pathfinding import (
-    find_path, has_line_of_sight, can_pathfind,
-)
+from .pathfinding import get_flow_field, has_line_of_sight
 
 
 class AlertState(Enum):
@@ -82,8 +80,9 @@ class EnemyAI:
         Args:
             detection_range: Range at which enemy detects the player (defaults to self.chase_range)
             lose_range: Range at which enemy loses the player (defaults to 2x detection_range)
-            pathfind_interval: Seconds between pathfinding recalculations
-            use_pathfinding: Whether this enemy uses A* pathfinding
+            pathfind_interval: Kept for compatibility; chasing reads the shared
+                flow field every frame instead of re-planning on a timer
+            use_pathfinding: Whether this enemy follows the flow field when chasing
             suspicious_duration: How long the suspicious state lasts before alert
             lost_duration: How long the lost state lasts before returning to idle
         """
@@ -97,9 +96,6 @@ class EnemyAI:
 
         # Timers
         self._ai_state_timer = 0.0
-        self._pathfind_timer = 0.0
-        self._cached_path = []
-        self._path_index = 0
 
         # Icon display timer (for fade effect)
         self._icon_timer = 0.0
@@ -129,9 +125,6 @@ class EnemyAI:
             player.center_x, player.center_y
         )
 
-        # Update pathfinding timer
-        self._pathfind_timer -= dt
-
         old_state = self.ai_state
 
         # State transitions
@@ -151,12 +144,9 @@ class EnemyAI:
             if self._ai_state_timer <= 0:
                 self.ai_state = AlertState.ALERT
                 self._icon_timer = self._icon_duration
-                self._cached_path = []
-                self._pathfind_timer = 0.0  # Force immediate pathfind
             elif dist > self.detection_range or not has_los:
                 # Player left detection range or broke LOS during suspicious
                 self.ai_state = AlertState.IDLE
-                self._cached_path = []
 
         elif self.ai_state == AlertState.ALERT:
             if has_los:
@@ -175,11 +165,8 @@ class EnemyAI:
                 self._icon_timer = self._icon_duration
                 self._last_known_px = player.center_x
                 self._last_known_py = player.center_y
-                self._cached_path = []
-                self._pathfind_timer = 0.0
             elif self._ai_state_timer <= 0:
                 self.ai_state = AlertState.IDLE
-                self._cached_path = []
 
         # Update icon timer
         if self._icon_timer > 0:
@@ -200,7 +187,7 @@ class EnemyAI:
             target_y = player.center_y + self._group_offset_y
 
             if self.use_pathfinding:
-                target = self._follow_path(dt, tilemap, target_x, target_y, chase_speed)
+                target = self._follow_path(tilemap, player, chase_speed)
                 if target is not None:
                     return target
 
@@ -214,44 +201,21 @@ class EnemyAI:
 
         return None
 
-    def _follow_path(self, dt, tilemap, target_x, target_y, speed):
-        """Follow a cached A* path, recalculating when needed.
+    def _follow_path(self, tilemap, player, speed):
+        """Step along the shared flow field toward the player.
 
-        Returns (target_x, target_y, speed) for the next waypoint, or None
-        if no path is available.
+        Returns (target_x, target_y, speed) for the center of the next tile,
+        or None once the enemy is next to the player (or has no route), in
+        which case the caller moves straight at its (group-offset) target.
         """
-        # Recalculate path if timer expired
-        if self._pathfind_timer <= 0 and can_pathfind():
-            self._pathfind_timer = self.pathfind_interval
-            self._cached_path = find_path(
-                tilemap,
-                self.center_x, self.center_y,
-                target_x, target_y,
-                max_distance=20,
-                avoid_hazards=True,
-            )
-            self._path_index = 0
-
-        if not self._cached_path:
+        field = get_flow_field(tilemap, player.center_x, player.center_y)
+        remaining = field.distance(self.center_x, self.center_y)
+        if remaining is not None and remaining <= 1:
             return None
-
-        # Follow the path waypoints
-        if self._path_index >= len(self._cached_path):
+        step = field.next_step(self.center_x, self.center_y)
+        if step is None:
             return None
-
-        wx, wy = self._cached_path[self._path_index]
-        dx = wx - self.center_x
-        dy = wy - self.center_y
-        dist_to_wp = math.sqrt(dx * dx + dy * dy)
-
-        # Advance to next waypoint when close enough
-        if dist_to_wp < TILE_SIZE * 0.5:
-            self._path_index += 1
-            if self._path_index >= len(self._cached_path):
-                return None
-            wx, wy = self._cached_path[self._path_index]
-
-        return (wx, wy, speed)
+        return (step[0], step[1], speed)
 
     def _ai_distance_to(self, target):
         """Calculate distance to a target entity."""
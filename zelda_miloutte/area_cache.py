@@ -0,0 +1,82 @@
+"""Bounded LRU cache of suspended overworld areas.
+
+Leaving an area suspends its PlayState here instead of dropping it, so
+walking back across a border (or fast travelling to a recent area) resumes
+the existing tilemap, entities and chests instead of rebuilding them from
+AREAS. The cache is bounded both by area count and by the memory held in
+each area's pre-rendered tilemap chunks; the least recently left area is
+evicted first. Areas built ahead of time by AreaPreloader are added with
+prefetch() and are the first to go.
+"""
+
+from collections import OrderedDict
+from .settings import AREA_CACHE_SIZE, AREA_CACHE_MAX_BYTES
+
+
+def estimate_area_bytes(state):
+    """Approximate memory owned by a suspended area (its tilemap chunk surfaces)."""
+    return sum(surf.get_width() * surf.get_height() * surf.get_bytesize()
+               for surf in state.tilemap._chunk_cache.values())
+
+
+class AreaCache:
+    """Suspended area states keyed by area id, least recently used first."""
+
+    def __init__(self, max_areas=AREA_CACHE_SIZE, max_bytes=AREA_CACHE_MAX_BYTES):
+        self.max_areas = max_areas
+        self.max_bytes = max_bytes
+        self._states = OrderedDict()   # area_id -> (state, bytes)
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._states)
+
+    def __contains__(self, area_id):
+        return area_id in self._states
+
+    @property
+    def area_ids(self):
+        """Cached area ids, least recently suspended first."""
+        return list(self._states)
+
+    def suspend(self, state):
+        """Keep *state* for a later resume(), evicting old areas over the caps."""
+        self._discard(state.area_id)
+        self._add(state)
+        self._evict()
+
+    def prefetch(self, state):
+        """Add a preloaded, never entered area as the first one to evict."""
+        if state.area_id in self._states:
+            return
+        self._add(state)
+        self._states.move_to_end(state.area_id, last=False)
+        self._evict()
+
+    def _add(self, state):
+        size = estimate_area_bytes(state)
+        self._states[state.area_id] = (state, size)
+        self.total_bytes += size
+
+    def _evict(self):
+        while self._states and (len(self._states) > self.max_areas
+                                or self.total_bytes > self.max_bytes):
+            self._discard(next(iter(self._states)))
+
+    def resume(self, area_id):
+        """Remove and return the suspended state for *area_id*, or None."""
+        entry = self._states.pop(area_id, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry[1]
+        return entry[0]
+
+    def _discard(self, area_id):
+        entry = self._states.pop(area_id, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def clear(self):
+        """Forget every suspended area (new game, load, NG+)."""
+        self._states.clear()
+        self.total_bytes = 0
@@ -0,0 +1,117 @@
+"""Predictive background preloading of adjacent overworld areas.
+
+While the player walks towards a border exit (a TRANSITION_* tile), the
+area on the other side, from AREAS[area]["connections"], is built ahead of
+time: its tilemap rows, its enemies (whose sprite frames are generated on
+first use) and its baked tilemap chunks. Each piece is one small slice,
+and Game.run only runs slices in the time left over at the end of a frame,
+so preloading never pushes a frame over budget. A finished area is handed
+to the area cache, where the transition picks it up instead of building it
+inside the fade.
+"""
+
+import time
+
+from .settings import TILE_SIZE, PRELOAD_DISTANCE
+from .world.maps import AREAS
+from .world.tile import TileType
+
+# Exit tile type -> connection direction
+EXIT_DIRECTIONS = {
+    TileType.TRANSITION_N: "north",
+    TileType.TRANSITION_S: "south",
+    TileType.TRANSITION_E: "east",
+    TileType.TRANSITION_W: "west",
+}
+
+
+def _exit_tiles(tilemap):
+    """Map each exit direction of *tilemap* to the (col, row) cells of its tiles."""
+    found = tilemap.find_tiles(EXIT_DIRECTIONS)
+    return {EXIT_DIRECTIONS[tile_type]: cells for tile_type, cells in found.items() if cells}
+
+
+class AreaPreloader:
+    """Builds the area the player is heading to, one slice at a time."""
+
+    def __init__(self, game, distance=PRELOAD_DISTANCE):
+        self.game = game
+        self.distance = distance
+        self.target = None     # area id being built
+        self._state = None
+        self._job = None
+        self._exits = {}       # area id -> {direction: [(col, row), ...]}
+
+    def predict(self, state):
+        """Return the connected area whose exit the player is nearest, or None.
+
+        Only exits within ``distance`` tiles count.
+        """
+        exits = self._exits.get(state.area_id)
+        if exits is None:
+            exits = self._exits[state.area_id] = _exit_tiles(state.tilemap)
+        connections = AREAS[state.area_id].get("connections", {})
+        pc = state.player.center_x / TILE_SIZE
+        pr = state.player.center_y / TILE_SIZE
+        best = None
+        best_dist = self.distance * self.distance
+        for direction, cells in exits.items():
+            if direction not in connections:
+                continue
+            for col, row in cells:
+                d = (col + 0.5 - pc) ** 2 + (row + 0.5 - pr) ** 2
+                if d <= best_dist:
+                    best, best_dist = connections[direction]["area"], d
+        return best
+
+    def update(self, deadline=None):
+        """Re-predict the target and run preload slices.
+
+        Slices run until the perf_counter() *deadline*; with no deadline a
+        single slice runs (fixed-step headless simulation).
+        """
+        from .states.play_state import PlayState
+        state = self.game.current_state
+        if not isinstance(state, PlayState) or not state.built:
+            return
+        target = self.predict(state)
+        if target is not None and (target in self.game.area_cache
+                                   or target == state.area_id):
+            target = None
+        if target != self.target:
+            self._start(target)
+        while self._job is not None:
+            self._step()
+            if deadline is None or time.perf_counter() >= deadline:
+                break
+
+    def finish(self, area_id):
+        """Complete the preload of *area_id* now if it is in progress."""
+        if self.target == area_id:
+            while self._job is not None:
+                self._step()
+
+    def cancel(self):
+        self._start(None)
+
+    def _start(self, area_id):
+        self.target = area_id
+        self._state = None
+        self._job = self._preload(area_id) if area_id is not None else None
+
+    def _step(self):
+        try:
+            next(self._job)
+        except StopIteration:
+            self.game.area_cache.prefetch(self._state)
+            self.target = None
+            self._state = None
+            self._job = None
+
+    def _preload(self, area_id):
+        from .states.play_state import PlayState
+        state = self._state = PlayState(self.game, area_id=area_id, deferred=True)
+        yield
+        while not state.build_step():
+            yield
+        yield from state.tilemap.bake_steps()
@@ -0,0 +1,179 @@
+"""On-disk cache of synthesized PCM audio for SoundManager.
+
+Every sound effect and music track is generated procedurally, which is by
+far the slowest part of startup. The raw mixer-format PCM of each sound is
+written to disk the first time it is synthesized and loaded back on later
+runs. Cache entries are keyed by a hash of the generator source
+(``sounds.py``), the mixer format (sample rate, sample size, channels) and
+AUDIO_CACHE_VERSION, so editing a generator or changing the mixer
+configuration never plays stale audio.
+
+Two locations are searched, in order:
+
+* BUNDLED_CACHE_DIR - shipped with the package, filled at build time by
+  ``python -m zelda_miloutte.audio_cache`` so release builds (including the
+  pygbag web build) never synthesize at runtime;
+* the user cache under ``~/.zelda_miloutte/audio_cache/`` - written lazily
+  the first time a sound is generated.
+
+The bundled entries only hit when the runtime mixer format equals the one
+they were baked for, so the game opens the mixer with pre_init_mixer() in
+the fixed format from settings and bake() targets that same format.
+"""
+
+import argparse
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+from .settings import AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER
+
+AUDIO_CACHE_VERSION = 1
+
+BUNDLED_CACHE_DIR = Path(__file__).parent / "data" / "audio_cache"
+
+# File header: magic + playback volume stored alongside the PCM
+_HEADER = struct.Struct("<4sf")
+_MAGIC = b"ZMA1"
+
+
+def user_cache_dir():
+    """Return the per-user audio cache directory."""
+    return Path.home() / ".zelda_miloutte" / "audio_cache"
+
+
+def _generator_source_hash():
+    """Hash the sound generator source so code edits invalidate the cache."""
+    source = Path(__file__).with_name("sounds.py")
+    try:
+        return hashlib.sha1(source.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def pre_init_mixer(frequency=AUDIO_FREQUENCY, channels=AUDIO_CHANNELS):
+    """Preset the mixer to open in exactly (*frequency*, 16-bit, *channels*).
+
+    Call before ``pygame.init()``. SDL is not allowed to substitute the
+    device's native rate or channel count, so ``pygame.mixer.get_init()``
+    (and with it the audio cache key) is the same on every platform.
+    """
+    import pygame
+    pygame.mixer.pre_init(frequency, AUDIO_SIZE, channels, AUDIO_BUFFER,
+                          allowedchanges=0)
+
+
+class AudioCache:
+    """Loads and stores raw PCM for named sounds.
+
+    Args:
+        mixer_format: Tuple from ``pygame.mixer.get_init()``
+            (frequency, size, channels) describing the PCM layout.
+        read_dirs: Directories searched for cached entries, in order.
+        write_dir: Directory new entries are written to (None = read-only).
+    """
+
+    def __init__(self, mixer_format, read_dirs=None, write_dir=None):
+        if read_dirs is None:
+            read_dirs = [BUNDLED_CACHE_DIR, user_cache_dir()]
+        if write_dir is None and read_dirs:
+            write_dir = read_dirs[-1]
+        self.read_dirs = [Path(d) for d in read_dirs]
+        self.write_dir = Path(write_dir) if write_dir is not None else None
+
+        source_hash = _generator_source_hash()
+        if source_hash is None:
+            # Without the generator source we cannot tell entries apart
+            self.key = None
+        else:
+            key_src = f"{AUDIO_CACHE_VERSION}:{source_hash}:{tuple(mixer_format)}"
+            self.key = hashlib.sha1(key_src.encode()).hexdigest()[:16]
+
+    @property
+    def enabled(self):
+        return self.key is not None
+
+    def _filename(self, name):
+        return f"{name}-{self.key}.pcm"
+
+    def load(self, name):
+        """Return (volume, pcm memoryview) for *name*, or None on a miss."""
+        if not self.enabled:
+            return None
+        filename = self._filename(name)
+        for directory in self.read_dirs:
+            try:
+                data = (directory / filename).read_bytes()
+            except OSError:
+                continue
+            if len(data) < _HEADER.size:
+                continue
+            magic, volume = _HEADER.unpack_from(data)
+            if magic != _MAGIC:
+                continue
+            return volume, memoryview(data)[_HEADER.size:]
+        return None
+
+    def store(self, name, pcm, volume=1.0):
+        """Write *pcm* for *name*, replacing entries with an older key.
+
+        Failures (read-only filesystem, full disk) are ignored: the cache is
+        purely an optimization.
+        """
+        if not self.enabled or self.write_dir is None:
+            return
+        try:
+            self.write_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.write_dir.glob(f"{name}-*.pcm"):
+                stale.unlink()
+            path = self.write_dir / self._filename(name)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(_HEADER.pack(_MAGIC, volume) + bytes(pcm))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+def bake(output_dir=BUNDLED_CACHE_DIR, frequency=AUDIO_FREQUENCY,
+         channels=AUDIO_CHANNELS):
+    """Synthesize every sound and music track into *output_dir*.
+
+    Entries are baked for the mixer format (*frequency*, 16-bit,
+    *channels*), which defaults to the format the game opens the mixer in;
+    they are only ever loaded by a mixer running that exact format.
+    Returns the number of entries written.
+    """
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    pre_init_mixer(frequency, channels)
+    pygame.init()
+    mixer_format = (frequency, AUDIO_SIZE, channels)
+    if pygame.mixer.get_init() != mixer_format:
+        # Mixer was already open in another format: reopen it for the target
+        pygame.mixer.quit()
+        pygame.mixer.init(frequency, AUDIO_SIZE, channels, AUDIO_BUFFER,
+                          allowedchanges=0)
+
+    from .sounds import SoundManager
+    cache = AudioCache(mixer_format, read_dirs=[], write_dir=output_dir)
+    SoundManager(audio_cache=cache)._generate_music()
+    return len(list(Path(output_dir).glob(f"*-{cache.key}.pcm")))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Pre-bake synthesized game audio so builds never synthesize at runtime.")
+    parser.add_argument("output_dir", nargs="?", default=str(BUNDLED_CACHE_DIR),
+                        help="directory to write the cache to (default: bundled package cache)")
+    parser.add_argument("--frequency", type=int, default=AUDIO_FREQUENCY,
+                        help="mixer sample rate to bake for (default: %(default)s)")
+    parser.add_argument("--channels", type=int, default=AUDIO_CHANNELS,
+                        help="mixer channel count to bake for (default: %(default)s)")
+    args = parser.parse_args(argv)
+    count = bake(args.output_dir, args.frequency, args.channels)
+    print(f"Baked {count} audio entries into {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
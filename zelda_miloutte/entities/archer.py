@@ -9,7 +9,7 @@ from ..settings import (
 )
 from ..sprites import AnimatedSprite
 from ..sprites.archer_sprites import get_archer_frames, get_projectile_sprite
-from ..sprites.effects import flash_white
+from ..sprites.effects import get_white_frames
 from ..ai_state import AlertState
 from ..pathfinding import find_path, find_cover_position, has_line_of_sight, can_pathfind
 
@@ -58,6 +58,10 @@ class Archer(Enemy):
         self.flash_timer = 0.0
         self.flash_duration = 0.15
 
+        # Archers never wind up a lunge, but Enemy.draw checks for it
+        self.telegraph_timer = 0.0
+        self.telegraphing = False
+
         # Death animation
         self.death_timer = 0.0
         self.death_duration = 0.3
@@ -76,10 +80,7 @@ class Archer(Enemy):
 
         # Sprites (archer-specific)
         self.anim = AnimatedSprite(get_archer_frames(), frame_duration=0.18)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
         # Pending projectile to be added to game state
         self.pending_projectile = None
@@ -11,7 +11,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.boss_sprites import get_boss_frames_phase1, get_boss_frames_phase2
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, get_overlay_frame, scale_shrink
 
 
 class Boss(Enemy):
@@ -82,14 +82,8 @@ class Boss(Enemy):
         self.anim_p2 = AnimatedSprite(frames_phase2_fn(), frame_duration=0.14)
         self.anim = self.anim_p1
         # Pre-build white flash frames for both phases
-        self._white_p1 = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim_p1.frames.items()
-        }
-        self._white_p2 = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim_p2.frames.items()
-        }
+        self._white_p1 = get_white_frames(self.anim_p1.frames)
+        self._white_p2 = get_white_frames(self.anim_p2.frames)
         self._white_frames = self._white_p1
 
     @property
@@ -317,10 +311,7 @@ class Boss(Enemy):
         if self.charge_telegraphing:
             import math as _math
             pulse = abs(_math.sin(self.charge_telegraph_timer * 15))
-            tint_surf = frame.copy()
-            red_overlay = pygame.Surface(tint_surf.get_size(), pygame.SRCALPHA)
-            red_overlay.fill((255, 30, 30, int(100 * pulse)))
-            tint_surf.blit(red_overlay, (0, 0))
+            tint_surf = get_overlay_frame(frame, (255, 30, 30), 100 * pulse)
             # Shake offset
             import random as _random
             shake_x = _random.randint(-3, 3)
@@ -4,6 +4,7 @@ import math
 import random
 import pygame
 from .entity import Entity
+from .. import text_cache
 
 
 # Companion constants
@@ -219,9 +220,7 @@ class Companion(Entity):
         if self.alert:
             alert_x = r.centerx - 3
             alert_y = r.top - 14
-            font = pygame.font.Font(None, 18)
-            alert_surf = font.render("!", True, (255, 220, 50))
-            surface.blit(alert_surf, (alert_x, alert_y))
+            text_cache.draw(surface, "!", 18, (255, 220, 50), (alert_x, alert_y))
 
     def to_dict(self):
         """Serialize companion state for saving."""
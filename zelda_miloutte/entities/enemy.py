@@ -1,6 +1,5 @@
 import math
 import random
-import pygame
 from .entity import Entity
 from ..settings import (
     ENEMY_SIZE, ENEMY_SPEED, ENEMY_CHASE_SPEED, ENEMY_CHASE_RANGE,
@@ -10,7 +9,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.enemy_sprites import get_enemy_frames
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, get_overlay_frame, scale_shrink
 from ..ai_state import EnemyAI
 
 
@@ -62,10 +61,7 @@ class Enemy(Entity, EnemyAI):
 
         # Sprites
         self.anim = AnimatedSprite(get_enemy_frames(), frame_duration=0.18)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
         # Initialize smart AI
         self.init_ai(
@@ -268,10 +264,7 @@ class Enemy(Entity, EnemyAI):
         if self.telegraphing:
             # Pulsing red overlay
             pulse = abs(math.sin(self.telegraph_timer * 12))
-            tint_surf = frame.copy()
-            red_overlay = pygame.Surface(tint_surf.get_size(), pygame.SRCALPHA)
-            red_overlay.fill((255, 40, 40, int(80 * pulse)))
-            tint_surf.blit(red_overlay, (0, 0))
+            tint_surf = get_overlay_frame(frame, (255, 40, 40), 80 * pulse)
             # Pull back slightly
             pb = ENEMY_WINDUP_PULLBACK * (self.telegraph_timer / ENEMY_TELEGRAPH_TIME)
             if self.facing == "up":
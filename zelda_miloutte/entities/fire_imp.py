@@ -11,7 +11,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.fire_imp_sprites import get_fire_imp_frames
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 from ..ai_state import EnemyAI, AlertState
 
 
@@ -57,10 +57,7 @@ class FireImp(Entity, EnemyAI):
 
         # Sprites
         self.anim = AnimatedSprite(get_fire_imp_frames(), frame_duration=0.15)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
         # Initialize smart AI -- fire imp is aggressive and fast
         self.init_ai(
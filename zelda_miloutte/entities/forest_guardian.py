@@ -14,7 +14,7 @@ from ..sprites.forest_guardian_sprites import (
     get_forest_guardian_frames_phase1,
     get_forest_guardian_frames_phase2,
 )
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 
 
 class ForestGuardian(Entity):
@@ -68,14 +68,8 @@ class ForestGuardian(Entity):
         self.anim = self.anim_p1
 
         # Pre-build white flash frames for both phases
-        self._white_p1 = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim_p1.frames.items()
-        }
-        self._white_p2 = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim_p2.frames.items()
-        }
+        self._white_p1 = get_white_frames(self.anim_p1.frames)
+        self._white_p2 = get_white_frames(self.anim_p2.frames)
         self._white_frames = self._white_p1
 
     @property
@@ -12,7 +12,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.frost_golem_sprites import get_frost_golem_frames
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 
 
 class FrostGolem(Entity):
@@ -55,10 +55,7 @@ class FrostGolem(Entity):
 
         # Sprites
         self.anim = AnimatedSprite(get_frost_golem_frames(), frame_duration=0.20)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
     def take_damage(self, amount):
         if self.dying:
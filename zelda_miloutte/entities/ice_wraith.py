@@ -11,7 +11,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.ice_wraith_sprites import get_ice_wraith_frames
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 
 
 class IceWraith(Entity):
@@ -53,10 +53,7 @@ class IceWraith(Entity):
 
         # Sprites
         self.anim = AnimatedSprite(get_ice_wraith_frames(), frame_duration=0.15)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
     def take_damage(self, amount):
         if self.dying:
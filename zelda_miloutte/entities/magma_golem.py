@@ -5,6 +5,7 @@ import random
 import pygame
 from .entity import Entity
 from .projectile import Projectile
+from ..lighting import FIRE_PROJECTILE_LIGHT
 from ..settings import (
     MAGMA_GOLEM_SIZE, MAGMA_GOLEM_SPEED, MAGMA_GOLEM_HP,
     MAGMA_GOLEM_DAMAGE, MAGMA_GOLEM_CHASE_RANGE,
@@ -13,7 +14,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.magma_golem_sprites import get_magma_golem_frames, get_magma_projectile_sprite
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 from ..ai_state import EnemyAI, AlertState
 from ..pathfinding import has_line_of_sight
 
@@ -62,10 +63,7 @@ class MagmaGolem(Entity, EnemyAI):
 
         # Sprites
         self.anim = AnimatedSprite(get_magma_golem_frames(), frame_duration=0.20)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
         # Initialize smart AI -- golem is slow but persistent
         self.init_ai(
@@ -148,6 +146,7 @@ class MagmaGolem(Entity, EnemyAI):
         if dist > 0:
             proj.vx = (dx / dist) * MAGMA_GOLEM_PROJECTILE_SPEED
             proj.vy = (dy / dist) * MAGMA_GOLEM_PROJECTILE_SPEED
+        proj.light = FIRE_PROJECTILE_LIGHT
 
         return proj
 
@@ -15,6 +15,7 @@ class Projectile(Entity):
         self.sprite = sprite
         self.owner = owner  # "enemy" or "player"
         self.deflected = False
+        self.light = None  # (radius, glow color) if it lights up the night
 
         proj_speed = speed or PROJECTILE_SPEED
 
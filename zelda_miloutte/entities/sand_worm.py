@@ -16,7 +16,7 @@ from ..sprites.sand_worm_sprites import (
     get_sand_worm_frames_surface_p2,
     get_sand_worm_frames_burrowed_p2,
 )
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 
 
 class SandWorm(Entity):
@@ -81,14 +81,8 @@ class SandWorm(Entity):
         self.anim = self.anim_surface
 
         # Pre-build white flash frames for both phases (surface only)
-        self._white_surface_p1 = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim_surface_p1.frames.items()
-        }
-        self._white_surface_p2 = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim_surface_p2.frames.items()
-        }
+        self._white_surface_p1 = get_white_frames(self.anim_surface_p1.frames)
+        self._white_surface_p2 = get_white_frames(self.anim_surface_p2.frames)
         self._white_frames = self._white_surface_p1
 
     @property
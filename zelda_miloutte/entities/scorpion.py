@@ -11,7 +11,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.scorpion_sprites import get_scorpion_frames
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 from ..ai_state import EnemyAI, AlertState
 
 
@@ -52,10 +52,7 @@ class Scorpion(Entity, EnemyAI):
 
         # Sprites
         self.anim = AnimatedSprite(get_scorpion_frames(), frame_duration=0.18)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
         # Initialize smart AI
         self.init_ai(
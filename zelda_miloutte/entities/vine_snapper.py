@@ -11,7 +11,7 @@ from ..settings import (
 from ..sounds import get_sound_manager
 from ..sprites import AnimatedSprite
 from ..sprites.vine_snapper_sprites import get_vine_snapper_frames, get_thorn_sprite
-from ..sprites.effects import flash_white, scale_shrink
+from ..sprites.effects import get_white_frames, scale_shrink
 from ..pathfinding import has_line_of_sight
 
 
@@ -50,10 +50,7 @@ class VineSnapper(Entity):
 
         # Sprites
         self.anim = AnimatedSprite(get_vine_snapper_frames(), frame_duration=0.25)
-        self._white_frames = {
-            d: [flash_white(f) for f in frames]
-            for d, frames in self.anim.frames.items()
-        }
+        self._white_frames = get_white_frames(self.anim.frames)
 
         # Pending projectile to be added to game state
         self.pending_projectile = None
@@ -1,24 +1,65 @@
 import asyncio
+import os
+import time
 import pygame
-from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, BLACK
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, BLACK, PRELOAD_FRAME_MARGIN
 from .input_handler import InputHandler
 from .transition import Transition
 from .save_manager import SaveManager
 from .quest_manager import QuestManager
 from .data.quests import get_all_quests
 from .time_system import TimeSystem
+from .weather import WeatherManager
 from .achievements import AchievementManager
 from .bestiary import BestiaryManager
+from .profiler import profiler, start_from_env
+from .area_cache import AreaCache
+from .area_preloader import AreaPreloader
+from .audio_cache import pre_init_mixer
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, input_script=None, record_input=None, audio=None):
+        """
+        Args:
+            headless: Use the dummy SDL video/audio drivers and never flip the
+                display; drive the game with simulate() instead of run()
+            input_script: Optional ScriptedInput feeding key events and held
+                keys (used for headless runs and input replay)
+            record_input: Optional path; live key events are recorded there
+                as a replayable script when the game quits
+            audio: Generate and play sound (defaults to not headless)
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        # Fixed mixer format so the bundled audio cache matches everywhere
+        pre_init_mixer()
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(TITLE)
+        if audio is None:
+            audio = not headless
+        if not audio:
+            from .sounds import init_sound_manager
+            init_sound_manager(enabled=False)
         self.clock = pygame.time.Clock()
         self.running = True
-        self.input = InputHandler()
+        # Frames stepped and simulated seconds elapsed (fixed-dt in headless runs)
+        self.frame = 0
+        self.sim_time = 0.0
+        self.input_script = input_script
+        self._record_path = record_input
+        self._recorder = None
+        if record_input:
+            from .scripted_input import InputRecorder
+            self._recorder = InputRecorder()
+        if input_script is not None:
+            self.input = InputHandler(key_state=input_script.get_pressed,
+                                      clock=lambda: self.sim_time)
+        else:
+            self.input = InputHandler()
         self.states = []
         self.transition = Transition()
         self.save_manager = SaveManager()
@@ -35,9 +76,13 @@ class Game:
         }
         self.quest_manager = QuestManager()
         self.time_system = TimeSystem(game_hour=8.0)
+        self.weather = WeatherManager()
         self.achievement_manager = AchievementManager()
         self.bestiary = BestiaryManager()
+        self.area_cache = AreaCache()
+        self.preloader = AreaPreloader(self)
         self._init_quests()
+        start_from_env()
 
     def _init_quests(self):
         """Register all quests."""
@@ -110,6 +155,11 @@ class Game:
         state.enter()
         self.states.append(state)
 
+    def forget_areas(self):
+        """Drop cached and preloading areas (new game, load, NG+)."""
+        self.preloader.cancel()
+        self.area_cache.clear()
+
     def transition_to(self, callback, duration=0.4):
         """Start a transition. The callback will be called between fade-out and fade-in."""
         if not self.transition.active:
@@ -119,34 +169,44 @@ class Game:
     def current_state(self):
         return self.states[-1] if self.states else None
 
-    async def run(self):
-        while self.running:
-            try:
-                dt = self.clock.tick(FPS) / 1000.0
-                dt = min(dt, 0.05)  # Cap delta time
+    def step(self, dt, render=True):
+        """Advance the game by one frame of *dt* seconds: input, update, draw.
 
-                self.input.reset_actions()
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                        return
-                    self.input.handle_event(event)
-                    # Don't handle events during transitions
-                    if self.current_state and not self.transition.active:
-                        self.current_state.handle_event(event)
+        Returns False if the frame received a quit request.
+        """
+        profiler.begin_frame()
+        self.input.reset_actions()
+        events = pygame.event.get()
+        if self.input_script is not None:
+            events = self.input_script.next_frame() + events
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+                return False
+            if self._recorder is not None:
+                self._recorder.record(self.frame, event)
+            self.input.handle_event(event)
+            # Don't handle events during transitions
+            if self.current_state and not self.transition.active:
+                self.current_state.handle_event(event)
 
-                self.input.update()
+        self.input.update()
+        if self.input.toggle_profiler:
+            profiler.toggle_overlay()
 
-                # Track play time during gameplay states
-                if self.current_state and hasattr(self.current_state, 'player'):
-                    self.play_time += dt
+        # Track play time during gameplay states
+        if self.current_state and hasattr(self.current_state, 'player'):
+            self.play_time += dt
 
-                # Update transition if active, otherwise update game state
-                if self.transition.active:
-                    self.transition.update(dt)
-                elif self.current_state:
-                    self.current_state.update(dt)
+        # Update transition if active, otherwise update game state
+        with profiler.scope("update"):
+            if self.transition.active:
+                self.transition.update(dt)
+            elif self.current_state:
+                self.current_state.update(dt)
 
+        if render:
+            with profiler.scope("draw"):
                 # Draw current state and transition overlay
                 if self.current_state:
                     self.screen.fill(BLACK)
@@ -157,12 +217,57 @@ class Game:
 
                 # Draw transition overlay on top
                 self.transition.draw(self.screen)
+            profiler.draw_overlay(self.screen)
+
+        profiler.end_frame()
+        self.frame += 1
+        self.sim_time += dt
+        return True
+
+    def simulate(self, frames, dt=1.0 / FPS, render=True):
+        """Step *frames* frames with a fixed *dt* as fast as the CPU allows.
+
+        No wall-clock pacing and no display flip, so a headless game can
+        soak-test or profile gameplay much faster than real time. Errors
+        propagate instead of being logged. Returns the CPU time of each
+        frame in seconds.
+        """
+        frame_times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            if not self.step(dt, render):
+                break
+            self.preloader.update()
+            frame_times.append(time.perf_counter() - start)
+        return frame_times
+
+    def _save_recording(self):
+        if self._recorder is not None:
+            self._recorder.save(self._record_path)
+
+    async def run(self):
+        while self.running:
+            try:
+                dt = self.clock.tick(FPS) / 1000.0
+                dt = min(dt, 0.05)  # Cap delta time
+                frame_start = time.perf_counter()
+
+                if not self.step(dt):
+                    self._save_recording()
+                    profiler.close_csv()
+                    return
+
+                if not self.headless:
+                    pygame.display.flip()
 
-                pygame.display.flip()
+                # Spend what is left of the frame budget preloading areas
+                self.preloader.update(frame_start + 1.0 / FPS - PRELOAD_FRAME_MARGIN)
             except Exception as e:
                 import traceback
                 print(f"GAME LOOP ERROR: {e}")
                 traceback.print_exc()
             await asyncio.sleep(0)
 
+        self._save_recording()
+        profiler.close_csv()
         pygame.quit()
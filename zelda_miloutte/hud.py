@@ -1,7 +1,16 @@
+"""Retained-mode HUD: hearts, counters, level/XP, MP, stamina, ability, status, boss bar.
+
+The HUD is kept on a persistent backing surface. Each widget has a key
+function returning the values it depends on; a widget is redrawn (its old
+area cleared first) only when its key changes, so a frame where nothing
+changed costs a single blit. Widgets whose areas touch a redrawn widget
+are redrawn with it, so clearing never leaves a neighbour half erased.
+"""
+
 import pygame
 from .settings import (
     SCREEN_WIDTH, HUD_HEIGHT, HUD_HEART_SIZE, HUD_HEART_SPACING,
-    HUD_MARGIN, HEART_RED, KEY_YELLOW, BLACK, WHITE, DARK_RED,
+    HUD_MARGIN, BLACK, WHITE,
     BOSS_BAR_WIDTH, BOSS_BAR_HEIGHT, BOSS_PURPLE, RED,
     MANA_BLUE, MANA_DARK,
     STAMINA_MAX, STAMINA_BAR_WIDTH, STAMINA_BAR_HEIGHT,
@@ -11,12 +20,39 @@ from .sprites.hud_sprites import (
     get_hud_key_icon,
 )
 from .sprites.gold_sprites import get_hud_coin_icon
+from . import overlays, text_cache
+
+# Label font sizes
+FONT_SIZE = 24
+SMALL_FONT_SIZE = 18
+
+# Backing surface height: the HUD_HEIGHT background band plus the bars,
+# ability name and status timers that hang below it
+HUD_SURFACE_HEIGHT = 64
+HUD_BG_COLOR = (0, 0, 0, 160)
+
+XP_BAR_WIDTH = 80
+XP_BAR_HEIGHT = 8
+
+# Status effect labels and colors
+STATUS_STYLES = {
+    "poison": ("PSN", (80, 200, 80)),
+    "slow": ("SLW", (80, 150, 255)),
+    "freeze": ("FRZ", (100, 200, 255)),
+    "burn": ("BRN", (255, 120, 30)),
+    "stun": ("STN", (255, 255, 80)),
+}
+
+
+def _union(rects):
+    rects = [r for r in rects if r.width and r.height]
+    if not rects:
+        return pygame.Rect(0, 0, 0, 0)
+    return rects[0].unionall(rects[1:])
 
 
 class HUD:
     def __init__(self):
-        self.font = None
-        self.small_font = None
         self.boss = None
         self._heart_full = None
         self._heart_half = None
@@ -25,6 +61,21 @@ class HUD:
         self._coin_icon = None
         # Smooth XP bar animation
         self._displayed_xp_ratio = 0.0
+        # Retained state: backing surface, last key and drawn area per widget
+        self._surface = None
+        self._keys = {}
+        self._rects = {}
+        self._widgets = (
+            ("hearts", self._hearts_key, self._draw_hearts),
+            ("counters", self._counters_key, self._draw_counters),
+            ("level", self._level_key, self._draw_level),
+            ("mp", self._mp_key, self._draw_mp_bar),
+            ("stamina", self._stamina_key, self._draw_stamina_bar),
+            ("ability", self._ability_key, self._draw_ability_icon),
+            ("status", self._status_key, self._draw_status_effects),
+            ("boss", self._boss_key, self._draw_boss_bar),
+        )
+        self.redraws = 0
 
     def _ensure_sprites(self):
         if self._heart_full is None:
@@ -34,155 +85,234 @@ class HUD:
             self._key_icon = get_hud_key_icon()
             self._coin_icon = get_hud_coin_icon()
 
-    def _get_font(self):
-        if self.font is None:
-            self.font = pygame.font.Font(None, 24)
-            self.small_font = pygame.font.Font(None, 18)
-        return self.font
+    def invalidate(self):
+        """Force every widget to be redrawn on the next draw."""
+        self._surface = None
+        self._keys.clear()
+        self._rects.clear()
 
     def draw(self, surface, player, boss=None):
         self._ensure_sprites()
+        if self._surface is None:
+            self._surface = pygame.Surface((SCREEN_WIDTH, HUD_SURFACE_HEIGHT), pygame.SRCALPHA)
+            self._clear(self._surface.get_rect())
+        self.boss = boss if boss and boss.alive and not boss.dying else None
+        self._update_xp_ratio(player)
+
+        keys = {name: key_fn(player) for name, key_fn, _ in self._widgets}
+        dirty = {name for name in keys if keys[name] != self._keys.get(name, ())}
+        if dirty:
+            # Neighbours touching a cleared area are redrawn with it
+            cleared = [self._rects[name] for name in dirty if name in self._rects]
+            while cleared:
+                touched = [name for name, rect in self._rects.items()
+                           if name not in dirty and rect.collidelist(cleared) != -1]
+                dirty.update(touched)
+                cleared = [self._rects[name] for name in touched]
+            for name in dirty:
+                if name in self._rects:
+                    self._clear(self._rects.pop(name))
+            for name, _, draw_fn in self._widgets:
+                if name in dirty:
+                    self._keys[name] = keys[name]
+                    self._rects[name] = _union(draw_fn(self._surface, player) or [])
+                    self.redraws += 1
+        surface.blit(self._surface, (0, 0))
 
-        # HUD background
-        hud_surface = pygame.Surface((SCREEN_WIDTH, HUD_HEIGHT), pygame.SRCALPHA)
-        hud_surface.fill((0, 0, 0, 160))
-        surface.blit(hud_surface, (0, 0))
+    def _clear(self, rect):
+        """Restore the background under *rect* on the backing surface."""
+        self._surface.fill((0, 0, 0, 0), rect)
+        self._surface.fill(HUD_BG_COLOR, rect.clip((0, 0, SCREEN_WIDTH, HUD_HEIGHT)))
+
+    def _update_xp_ratio(self, player):
+        xp = getattr(player, 'xp', 0)
+        xp_to_next = getattr(player, 'xp_to_next', 100)
+        xp_ratio = xp / xp_to_next if xp_to_next > 0 else 0
+        # Smooth animation
+        diff = xp_ratio - self._displayed_xp_ratio
+        if abs(diff) > 0.01:
+            self._displayed_xp_ratio += diff * 0.15
+        else:
+            self._displayed_xp_ratio = xp_ratio
+
+    # ── Layout ────────────────────────────────────────────────────────
+
+    def _key_x(self, player):
+        return HUD_MARGIN + (player.max_hp // 2) * (HUD_HEART_SIZE + HUD_HEART_SPACING) + 20
+
+    def _level_label(self, player):
+        return text_cache.render(f"Lv.{getattr(player, 'level', 1)}", SMALL_FONT_SIZE,
+                                 (200, 200, 255))
+
+    def _bars_x(self, player):
+        """Left edge of the XP/MP/stamina bars (just right of the level label)."""
+        return HUD_MARGIN + self._level_label(player).get_width() + 4
+
+    # ── Widget keys ───────────────────────────────────────────────────
+
+    def _hearts_key(self, player):
+        return (player.hp, player.max_hp)
+
+    def _counters_key(self, player):
+        return (player.max_hp, player.keys, getattr(player, 'gold', 0))
+
+    def _level_key(self, player):
+        return (getattr(player, 'level', 1), int(XP_BAR_WIDTH * self._displayed_xp_ratio))
+
+    def _mp_key(self, player):
+        max_mp = getattr(player, 'max_mp', 50)
+        if max_mp <= 0:
+            return None
+        return (self._bars_x(player), int(80 * getattr(player, 'mp', 0) / max_mp))
+
+    def _stamina_key(self, player):
+        max_stamina = getattr(player, 'max_stamina', STAMINA_MAX)
+        if max_stamina <= 0:
+            return None
+        ratio = getattr(player, 'stamina', STAMINA_MAX) / max_stamina
+        return (self._bars_x(player), int(STAMINA_BAR_WIDTH * ratio), self._stamina_color(ratio))
 
-        # Hearts
+    def _ability_key(self, player):
+        ability = getattr(player, 'active_ability', None)
+        if ability is None:
+            return None
+        cooldown = f"{ability.cooldown_timer:.1f}" if ability.cooldown_timer > 0 else None
+        return (ability.name, ability.display_name, cooldown)
+
+    def _status_key(self, player):
+        effects = getattr(player, 'status_effects', {})
+        key = []
+        for name, effect_data in effects.items():
+            remaining = effect_data.get("timer", 0) if isinstance(effect_data, dict) else 0
+            key.append((name, f"{remaining:.0f}s" if remaining > 0 else None))
+        return tuple(key)
+
+    def _boss_key(self, player):
+        boss = self.boss
+        if boss is None:
+            return None
+        hp_ratio = max(0, boss.hp / boss.max_hp)
+        return (int(BOSS_BAR_WIDTH * hp_ratio), boss.phase)
+
+    # ── Widgets (each returns the rects it drew) ──────────────────────
+
+    def _draw_hearts(self, surface, player):
+        rects = []
         for i in range(player.max_hp // 2):
             x = HUD_MARGIN + i * (HUD_HEART_SIZE + HUD_HEART_SPACING)
             y = HUD_MARGIN
             heart_val = player.hp - i * 2
 
             if heart_val >= 2:
-                surface.blit(self._heart_full, (x, y))
+                rects.append(surface.blit(self._heart_full, (x, y)))
             elif heart_val == 1:
-                surface.blit(self._heart_half, (x, y))
+                rects.append(surface.blit(self._heart_half, (x, y)))
             else:
-                surface.blit(self._heart_empty, (x, y))
+                rects.append(surface.blit(self._heart_empty, (x, y)))
+        return rects
 
-        # Key icon + count
-        font = self._get_font()
-        key_x = HUD_MARGIN + (player.max_hp // 2) * (HUD_HEART_SIZE + HUD_HEART_SPACING) + 20
-        surface.blit(self._key_icon, (key_x, HUD_MARGIN))
-        text = font.render(f"x{player.keys}", True, WHITE)
-        surface.blit(text, (key_x + self._key_icon.get_width() + 4, HUD_MARGIN + 4))
+    def _draw_counters(self, surface, player):
+        """Key icon + count, then gold coin icon + count."""
+        key_x = self._key_x(player)
+        rects = [surface.blit(self._key_icon, (key_x, HUD_MARGIN))]
+        text = text_cache.render(f"x{player.keys}", FONT_SIZE, WHITE)
+        rects.append(surface.blit(text, (key_x + self._key_icon.get_width() + 4, HUD_MARGIN + 4)))
 
-        # Gold coin icon + count
         gold = getattr(player, 'gold', 0)
         gold_x = key_x + self._key_icon.get_width() + 4 + text.get_width() + 16
-        surface.blit(self._coin_icon, (gold_x, HUD_MARGIN))
-        gold_text = font.render(f"{gold}", True, (255, 200, 50))
-        surface.blit(gold_text, (gold_x + self._coin_icon.get_width() + 4, HUD_MARGIN + 4))
-
-        # Level + XP bar (below hearts)
-        level = getattr(player, 'level', 1)
-        xp = getattr(player, 'xp', 0)
-        xp_to_next = getattr(player, 'xp_to_next', 100)
-        xp_ratio = xp / xp_to_next if xp_to_next > 0 else 0
-
-        # Smooth animation
-        diff = xp_ratio - self._displayed_xp_ratio
-        if abs(diff) > 0.01:
-            self._displayed_xp_ratio += diff * 0.15
-        else:
-            self._displayed_xp_ratio = xp_ratio
+        rects.append(surface.blit(self._coin_icon, (gold_x, HUD_MARGIN)))
+        gold_text = text_cache.render(f"{gold}", FONT_SIZE, (255, 200, 50))
+        rects.append(surface.blit(gold_text, (gold_x + self._coin_icon.get_width() + 4,
+                                              HUD_MARGIN + 4)))
+        return rects
 
-        # Level number
-        lv_text = self.small_font.render(f"Lv.{level}", True, (200, 200, 255))
+    def _draw_level(self, surface, player):
+        """Level number and XP bar (below hearts)."""
+        lv_text = self._level_label(player)
         lv_x = HUD_MARGIN
         lv_y = HUD_MARGIN + HUD_HEART_SIZE + 2
-        surface.blit(lv_text, (lv_x, lv_y))
+        rects = [surface.blit(lv_text, (lv_x, lv_y))]
 
-        # XP bar
         xp_bar_x = lv_x + lv_text.get_width() + 4
         xp_bar_y = lv_y + 2
-        xp_bar_w = 80
-        xp_bar_h = 8
         # Background
-        pygame.draw.rect(surface, (40, 40, 60), (xp_bar_x, xp_bar_y, xp_bar_w, xp_bar_h))
+        rects.append(pygame.draw.rect(surface, (40, 40, 60),
+                                      (xp_bar_x, xp_bar_y, XP_BAR_WIDTH, XP_BAR_HEIGHT)))
         # Fill
-        fill_w = int(xp_bar_w * self._displayed_xp_ratio)
+        fill_w = int(XP_BAR_WIDTH * self._displayed_xp_ratio)
         if fill_w > 0:
-            pygame.draw.rect(surface, (100, 180, 255), (xp_bar_x, xp_bar_y, fill_w, xp_bar_h))
+            pygame.draw.rect(surface, (100, 180, 255), (xp_bar_x, xp_bar_y, fill_w, XP_BAR_HEIGHT))
         # Border
-        pygame.draw.rect(surface, (80, 80, 100), (xp_bar_x, xp_bar_y, xp_bar_w, xp_bar_h), 1)
-
-        # MP bar (blue bar below XP bar)
-        mp_bar_y = xp_bar_y + xp_bar_h + 2
-        self._draw_mp_bar(surface, player, xp_bar_x, mp_bar_y)
-
-        # Stamina bar (below MP bar)
-        self._draw_stamina_bar(surface, player, xp_bar_x, mp_bar_y + 8)
-
-        # Ability icon
-        self._draw_ability_icon(surface, player)
+        pygame.draw.rect(surface, (80, 80, 100), (xp_bar_x, xp_bar_y, XP_BAR_WIDTH, XP_BAR_HEIGHT), 1)
+        return rects
 
-        # Status effect icons
-        self._draw_status_effects(surface, player)
-
-        # Boss health bar
-        if boss and boss.alive and not boss.dying:
-            self._draw_boss_bar(surface, boss)
-
-    def _draw_mp_bar(self, surface, player, bar_x, bar_y):
+    def _draw_mp_bar(self, surface, player):
         """Draw the mana bar below the XP bar."""
         mp = getattr(player, 'mp', 0)
         max_mp = getattr(player, 'max_mp', 50)
         if max_mp <= 0:
-            return
+            return []
+        bar_x = self._bars_x(player)
+        bar_y = HUD_MARGIN + HUD_HEART_SIZE + 4 + XP_BAR_HEIGHT + 2
         mp_ratio = mp / max_mp
         bar_w = 80
         bar_h = 6
         # Label
-        mp_label = self.small_font.render("MP", True, (100, 160, 255))
-        surface.blit(mp_label, (bar_x - mp_label.get_width() - 3, bar_y - 1))
+        mp_label = text_cache.render("MP", SMALL_FONT_SIZE, (100, 160, 255))
+        rects = [surface.blit(mp_label, (bar_x - mp_label.get_width() - 3, bar_y - 1))]
         # Background
-        pygame.draw.rect(surface, MANA_DARK, (bar_x, bar_y, bar_w, bar_h))
+        rects.append(pygame.draw.rect(surface, MANA_DARK, (bar_x, bar_y, bar_w, bar_h)))
         # Fill
         fill_w = int(bar_w * mp_ratio)
         if fill_w > 0:
             pygame.draw.rect(surface, MANA_BLUE, (bar_x, bar_y, fill_w, bar_h))
         # Border
         pygame.draw.rect(surface, (60, 80, 140), (bar_x, bar_y, bar_w, bar_h), 1)
+        return rects
+
+    @staticmethod
+    def _stamina_color(ratio):
+        """Yellow/green when high, orange/red when low."""
+        if ratio > 0.5:
+            return (180, 200, 50)
+        if ratio > 0.25:
+            return (220, 160, 30)
+        return (220, 60, 30)
 
-    def _draw_stamina_bar(self, surface, player, bar_x, bar_y):
+    def _draw_stamina_bar(self, surface, player):
         """Draw the stamina bar below the MP bar."""
         stamina = getattr(player, 'stamina', STAMINA_MAX)
         max_stamina = getattr(player, 'max_stamina', STAMINA_MAX)
         if max_stamina <= 0:
-            return
+            return []
+        bar_x = self._bars_x(player)
+        bar_y = HUD_MARGIN + HUD_HEART_SIZE + 4 + XP_BAR_HEIGHT + 2 + 8
         ratio = stamina / max_stamina
         bar_w = STAMINA_BAR_WIDTH
         bar_h = STAMINA_BAR_HEIGHT
         # Label
-        st_label = self.small_font.render("ST", True, (200, 180, 50))
-        surface.blit(st_label, (bar_x - st_label.get_width() - 3, bar_y - 1))
+        st_label = text_cache.render("ST", SMALL_FONT_SIZE, (200, 180, 50))
+        rects = [surface.blit(st_label, (bar_x - st_label.get_width() - 3, bar_y - 1))]
         # Background
-        pygame.draw.rect(surface, (50, 40, 20), (bar_x, bar_y, bar_w, bar_h))
-        # Fill (yellow/green when high, orange/red when low)
+        rects.append(pygame.draw.rect(surface, (50, 40, 20), (bar_x, bar_y, bar_w, bar_h)))
+        # Fill
         fill_w = int(bar_w * ratio)
-        if ratio > 0.5:
-            color = (180, 200, 50)
-        elif ratio > 0.25:
-            color = (220, 160, 30)
-        else:
-            color = (220, 60, 30)
         if fill_w > 0:
-            pygame.draw.rect(surface, color, (bar_x, bar_y, fill_w, bar_h))
+            pygame.draw.rect(surface, self._stamina_color(ratio), (bar_x, bar_y, fill_w, bar_h))
         # Border
         pygame.draw.rect(surface, (80, 70, 40), (bar_x, bar_y, bar_w, bar_h), 1)
+        return rects
 
     def _draw_ability_icon(self, surface, player):
         """Draw the currently selected ability icon on the HUD."""
         ability = getattr(player, 'active_ability', None)
         if ability is None:
-            return
+            return []
 
         from .sprites.ability_sprites import get_ability_icon
         icon = get_ability_icon(ability.name)
         if icon is None:
-            return
+            return []
 
         # Position in top-right area of HUD (before status effects)
         ix = SCREEN_WIDTH - HUD_MARGIN - 120
@@ -190,74 +320,57 @@ class HUD:
 
         # Background box
         box_size = max(icon.get_width(), icon.get_height()) + 4
-        bg = pygame.Surface((box_size, box_size), pygame.SRCALPHA)
-        bg.fill((0, 0, 0, 120))
-        surface.blit(bg, (ix - 2, iy - 2))
+        box = pygame.Rect(ix - 2, iy - 2, box_size, box_size)
+        overlays.draw_fill(surface, BLACK, 120, box)
+        rects = [box]
 
         # Icon
         surface.blit(icon, (ix, iy))
 
         # Cooldown overlay (gray out if on cooldown)
         if ability.cooldown_timer > 0:
-            cd_surf = pygame.Surface((box_size, box_size), pygame.SRCALPHA)
-            cd_surf.fill((0, 0, 0, 140))
-            surface.blit(cd_surf, (ix - 2, iy - 2))
+            overlays.draw_fill(surface, BLACK, 140, box)
             # Cooldown timer text
-            cd_text = self.small_font.render(f"{ability.cooldown_timer:.1f}", True, WHITE)
-            surface.blit(cd_text, (ix + box_size // 2 - cd_text.get_width() // 2 - 2,
-                                   iy + box_size // 2 - cd_text.get_height() // 2 - 2))
+            text_cache.get_atlas(SMALL_FONT_SIZE, WHITE).draw(
+                surface, f"{ability.cooldown_timer:.1f}",
+                (ix + box_size // 2 - 2, iy + box_size // 2 - 2), center=True)
 
         # Ability name below icon
-        name_text = self.small_font.render(ability.display_name, True, (200, 200, 200))
-        surface.blit(name_text, (ix - 2, iy + box_size))
+        name_text = text_cache.render(ability.display_name, SMALL_FONT_SIZE, (200, 200, 200))
+        rects.append(surface.blit(name_text, (ix - 2, iy + box_size)))
 
         # Key hint
-        key_text = self.small_font.render("[R]", True, (150, 150, 150))
-        surface.blit(key_text, (ix + box_size + 2, iy + 2))
+        key_text = text_cache.render("[R]", SMALL_FONT_SIZE, (150, 150, 150))
+        rects.append(surface.blit(key_text, (ix + box_size + 2, iy + 2)))
+        return rects
 
     def _draw_status_effects(self, surface, player):
         """Draw status effect indicators with remaining duration."""
         effects = getattr(player, 'status_effects', {})
-        if not effects:
-            return
-        font = self._get_font()
-        small = self.small_font
+        rects = []
         ex = SCREEN_WIDTH - HUD_MARGIN - 60
         ey = HUD_MARGIN + 2
         for name, effect_data in effects.items():
-            if name == "poison":
-                color = (80, 200, 80)
-                label = "PSN"
-            elif name == "slow":
-                color = (80, 150, 255)
-                label = "SLW"
-            elif name == "freeze":
-                color = (100, 200, 255)
-                label = "FRZ"
-            elif name == "burn":
-                color = (255, 120, 30)
-                label = "BRN"
-            elif name == "stun":
-                color = (255, 255, 80)
-                label = "STN"
-            else:
-                color = WHITE
-                label = name[:3].upper()
-            txt = font.render(label, True, color)
-            surface.blit(txt, (ex, ey))
+            label, color = STATUS_STYLES.get(name, (name[:3].upper(), WHITE))
+            txt = text_cache.render(label, FONT_SIZE, color)
+            rects.append(surface.blit(txt, (ex, ey)))
             # Draw remaining duration below
             remaining = effect_data.get("timer", 0) if isinstance(effect_data, dict) else 0
             if remaining > 0:
-                timer_txt = small.render(f"{remaining:.0f}s", True, color)
-                surface.blit(timer_txt, (ex + 2, ey + 18))
+                rects.append(text_cache.get_atlas(SMALL_FONT_SIZE, color).draw(
+                    surface, f"{remaining:.0f}s", (ex + 2, ey + 18)))
             ex -= 45
+        return rects
 
-    def _draw_boss_bar(self, surface, boss):
+    def _draw_boss_bar(self, surface, player):
+        boss = self.boss
+        if boss is None:
+            return []
         bar_x = (SCREEN_WIDTH - BOSS_BAR_WIDTH) // 2
         bar_y = HUD_MARGIN
         # Background
-        pygame.draw.rect(surface, (40, 40, 40),
-                         (bar_x - 1, bar_y - 1, BOSS_BAR_WIDTH + 2, BOSS_BAR_HEIGHT + 2))
+        rects = [pygame.draw.rect(surface, (40, 40, 40),
+                                  (bar_x - 1, bar_y - 1, BOSS_BAR_WIDTH + 2, BOSS_BAR_HEIGHT + 2))]
         # HP fill
         hp_ratio = max(0, boss.hp / boss.max_hp)
         fill_width = int(BOSS_BAR_WIDTH * hp_ratio)
@@ -268,7 +381,7 @@ class HUD:
         pygame.draw.rect(surface, WHITE,
                          (bar_x - 1, bar_y - 1, BOSS_BAR_WIDTH + 2, BOSS_BAR_HEIGHT + 2), 1)
         # Label
-        font = self._get_font()
-        label = font.render("BOSS", True, WHITE)
-        surface.blit(label, (bar_x + BOSS_BAR_WIDTH // 2 - label.get_width() // 2,
-                             bar_y + BOSS_BAR_HEIGHT + 2))
+        label = text_cache.render("BOSS", FONT_SIZE, WHITE)
+        rects.append(surface.blit(label, (bar_x + BOSS_BAR_WIDTH // 2 - label.get_width() // 2,
+                                          bar_y + BOSS_BAR_HEIGHT + 2)))
+        return rects
@@ -4,7 +4,16 @@ from .settings import DODGE_DOUBLE_TAP_WINDOW
 
 
 class InputHandler:
-    def __init__(self):
+    def __init__(self, key_state=None, clock=None):
+        """
+        Args:
+            key_state: Callable returning the held-key state (defaults to
+                pygame.key.get_pressed; scripted input supplies its own)
+            clock: Callable returning the current time in seconds, used for
+                double-tap detection (defaults to pygame ticks)
+        """
+        self._key_state = key_state or pygame.key.get_pressed
+        self._clock = clock or (lambda: pygame.time.get_ticks() / 1000.0)
         self.move_x = 0.0
         self.move_y = 0.0
         self.attack = False
@@ -15,6 +24,7 @@ class InputHandler:
         self.toggle_minimap = False
         self.toggle_world_map = False
         self.toggle_timer = False
+        self.toggle_profiler = False
         self.touch = TouchControls()
         self._prev_touch_move_y = 0.0
 
@@ -35,7 +45,7 @@ class InputHandler:
         self.use_ability = False     # R key - use selected ability
 
     def update(self):
-        keys = pygame.key.get_pressed()
+        keys = self._key_state()
         self.move_x = 0.0
         self.move_y = 0.0
 
@@ -86,6 +96,7 @@ class InputHandler:
         self.toggle_minimap = False
         self.toggle_world_map = False
         self.toggle_timer = False
+        self.toggle_profiler = False
         self.touch.attack_pressed = False
         self.touch.interact_pressed = False
         self.touch.pause_pressed = False
@@ -130,6 +141,8 @@ class InputHandler:
                 self.use_ability = True
             if event.key == pygame.K_t:
                 self.toggle_timer = True
+            if event.key == pygame.K_F3:
+                self.toggle_profiler = True
             if event.key == pygame.K_i or event.key == pygame.K_TAB:
                 self.open_inventory = True
 
@@ -155,7 +168,7 @@ class InputHandler:
         if direction is None:
             return
 
-        now = pygame.time.get_ticks() / 1000.0
+        now = self._clock()
         if direction == self._last_tap_dir and (now - self._last_tap_time) < DODGE_DOUBLE_TAP_WINDOW:
             self.dodge_direction = direction
             self._last_tap_dir = None
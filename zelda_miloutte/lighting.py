@@ -0,0 +1,86 @@
+"""Pre-rendered light masks and night-time light compositing.
+
+A light mask is a white SRCALPHA surface whose alpha is the fraction of
+darkness left at each pixel: 0 at the light's centre, rising to 255 at its
+radius as (distance / radius) ** falloff. Masks and coloured glows are
+rendered once per (radius, falloff) / (radius, color, alpha) and reused.
+
+composite_lights() turns the night overlay into the lit overlay with one
+BLEND_RGBA_MULT blit per light: each light scales the overlay's alpha by
+its mask, so overlapping lights combine (two half-dark lights leave a
+quarter of the darkness) and cost stays proportional to the lit area.
+Lights with a color also get a soft glow blit on top.
+"""
+
+import pygame
+
+# Darkness falloff exponent (2 = quadratic, soft edge)
+LIGHT_FALLOFF = 2.0
+
+# World light sources: (radius, glow color or None)
+CAMPFIRE_LIGHT = (110, (255, 150, 50))
+TORCH_LIGHT = (80, (255, 170, 60))
+FIRE_PROJECTILE_LIGHT = (48, (255, 140, 50))
+
+# Glow added around coloured lights: extra radius and peak alpha
+GLOW_MARGIN = 20
+GLOW_ALPHA = 15
+
+_mask_cache = {}
+_glow_cache = {}
+
+
+def get_light_mask(radius, falloff=LIGHT_FALLOFF, inner=0):
+    """Return the cached (2r x 2r) darkness mask for a light of *radius*.
+
+    Within *inner* pixels of the centre the mask is fully clear; the
+    falloff runs from there out to *radius*.
+    """
+    key = (radius, falloff, inner)
+    mask = _mask_cache.get(key)
+    if mask is None:
+        size = radius * 2
+        mask = pygame.Surface((size, size), pygame.SRCALPHA)
+        mask.fill((255, 255, 255, 255))
+        # One ring per pixel of radius, outside in
+        for r in range(radius, 0, -1):
+            t = max(0.0, (r - inner) / (radius - inner))
+            a = int(255 * t ** falloff)
+            pygame.draw.circle(mask, (255, 255, 255, a), (radius, radius), r)
+        _mask_cache[key] = mask
+    return mask
+
+
+def get_glow(radius, color, alpha=GLOW_ALPHA):
+    """Return the cached soft glow disc of *color* fading out to *radius*."""
+    key = (radius, color, alpha)
+    glow = _glow_cache.get(key)
+    if glow is None:
+        size = radius * 2
+        glow = pygame.Surface((size, size), pygame.SRCALPHA)
+        for r in range(radius, 0, -2):
+            a = int(alpha * (1.0 - r / radius))
+            pygame.draw.circle(glow, (*color, a), (radius, radius), r)
+        _glow_cache[key] = glow
+    return glow
+
+
+def composite_lights(overlay, lights, falloff=LIGHT_FALLOFF):
+    """Cut every light out of the filled darkness *overlay*.
+
+    *lights* is an iterable of (screen_x, screen_y, radius, glow_color)
+    with glow_color None for an untinted light. Lights entirely off the
+    overlay are skipped.
+    """
+    width, height = overlay.get_size()
+    glows = []
+    for x, y, radius, glow_color in lights:
+        x, y = int(x), int(y)
+        if x + radius < 0 or y + radius < 0 or x - radius > width or y - radius > height:
+            continue
+        overlay.blit(get_light_mask(radius, falloff), (x - radius, y - radius),
+                     special_flags=pygame.BLEND_RGBA_MULT)
+        if glow_color is not None:
+            glows.append((x, y, radius + GLOW_MARGIN, glow_color))
+    for x, y, radius, glow_color in glows:
+        overlay.blit(get_glow(radius, glow_color), (x - radius, y - radius))
@@ -1,10 +1,19 @@
 import asyncio
+import os
 from .game import Game
 from .states.cinematic_state import CinematicState
 
 
 async def main():
-    game = Game()
+    # ZELDA_RECORD_INPUT=path records key input to a replayable script;
+    # ZELDA_REPLAY_INPUT=path plays one back
+    input_script = None
+    replay_path = os.environ.get("ZELDA_REPLAY_INPUT")
+    if replay_path:
+        from .scripted_input import ScriptedInput
+        input_script = ScriptedInput.load(replay_path)
+    game = Game(input_script=input_script,
+                record_input=os.environ.get("ZELDA_RECORD_INPUT"))
     game.push_state(CinematicState(game))
     await game.run()
 
@@ -1,7 +1,7 @@
 """New Game+ difficulty scaling and utility functions."""
 
 import pygame
-from .sprites.effects import tint_surface
+from .sprites.effects import get_variant, get_frame_variants
 
 # Maximum NG+ cycle (cap at 5 to prevent absurdity)
 NG_PLUS_MAX = 5
@@ -125,7 +125,7 @@ def tint_sprite_ng_plus(surface, ng_plus_count):
     """
     if ng_plus_count <= 0:
         return surface
-    return tint_surface(surface, NG_PLUS_TINT)
+    return get_variant(surface, "tint", NG_PLUS_TINT)
 
 
 def tint_frames_ng_plus(frames_dict, ng_plus_count):
@@ -136,14 +136,12 @@ def tint_frames_ng_plus(frames_dict, ng_plus_count):
         ng_plus_count: Current NG+ cycle
 
     Returns:
-        New dict with tinted frames, or original if ng_plus_count <= 0
+        Dict with tinted frames (shared across callers), or original if
+        ng_plus_count <= 0
     """
     if ng_plus_count <= 0:
         return frames_dict
-    tinted = {}
-    for direction, frame_list in frames_dict.items():
-        tinted[direction] = [tint_sprite_ng_plus(f, ng_plus_count) for f in frame_list]
-    return tinted
+    return get_frame_variants(frames_dict, "tint", NG_PLUS_TINT)
 
 
 def get_ng_plus_label(ng_plus_count):
@@ -0,0 +1,110 @@
+"""Shared full-screen effect overlays.
+
+Flashes, fades, dims and vignettes used to allocate a new full-screen
+surface every frame they were visible. Here each overlay is rendered once
+per (kind, color, size) at full strength and cached; the requested
+intensity is applied with set_alpha(), which pygame multiplies into the
+blit (on top of any per-pixel alpha), so drawing an overlay is a single
+blit with no allocation.
+
+Callers always pass the alpha they want, so one cached surface is safely
+shared between states.
+"""
+
+import pygame
+
+# Width of the vignette's edge gradient, in pixels
+VIGNETTE_EDGE = 40
+
+_fill_cache = {}
+_vignette_cache = {}
+_scratch_cache = {}
+
+
+def _blit(surface, overlay, alpha, dest=(0, 0), area=None):
+    if overlay.get_alpha() != alpha:
+        overlay.set_alpha(alpha)
+    surface.blit(overlay, dest, area)
+
+
+def get_fill(color, size):
+    """Return the cached opaque surface of *size* filled with *color*."""
+    key = (color, size)
+    fill = _fill_cache.get(key)
+    if fill is None:
+        fill = pygame.Surface(size)
+        fill.fill(color)
+        _fill_cache[key] = fill
+    return fill
+
+
+def get_vignette(color, size, edge=VIGNETTE_EDGE):
+    """Return the cached edge-gradient mask of *color* for *size*.
+
+    Alpha is 255 on the outermost pixel row/column and fades linearly to
+    0 at *edge* pixels in.
+    """
+    key = (color, size, edge)
+    vignette = _vignette_cache.get(key)
+    if vignette is None:
+        width, height = size
+        vignette = pygame.Surface(size, pygame.SRCALPHA)
+        for i in range(edge):
+            c = (*color, int(255 * (1 - i / edge)))
+            vignette.fill(c, (0, i, width, 1))
+            vignette.fill(c, (0, height - 1 - i, width, 1))
+            vignette.fill(c, (i, 0, 1, height))
+            vignette.fill(c, (width - 1 - i, 0, 1, height))
+        _vignette_cache[key] = vignette
+    return vignette
+
+
+def draw_fill(surface, color, alpha, rect=None):
+    """Blend *color* at *alpha* over *rect* (default: the whole surface).
+
+    Covers screen flashes, fades and the dim behind menus.
+    """
+    alpha = max(0, min(255, int(alpha)))
+    if alpha <= 0:
+        return
+    if rect is None:
+        _blit(surface, get_fill(color, surface.get_size()), alpha)
+    else:
+        rect = pygame.Rect(rect)
+        _blit(surface, get_fill(color, rect.size), alpha, rect.topleft)
+
+
+def draw_vignette(surface, color, alpha, edge=VIGNETTE_EDGE):
+    """Tint the edges of *surface* with *color*, peaking at *alpha*."""
+    alpha = max(0, min(255, int(alpha)))
+    if alpha <= 0:
+        return
+    _blit(surface, get_vignette(color, surface.get_size(), edge), alpha)
+
+
+def draw_line(surface, color, alpha, start, end, width=1):
+    """Draw a translucent line of *color* at *alpha*.
+
+    The line is drawn opaque on a shared SRCALPHA scratch surface and only
+    its bounding box is blitted and cleared again, so the cost follows the
+    line's size rather than the screen's.
+    """
+    alpha = max(0, min(255, int(alpha)))
+    if alpha <= 0:
+        return
+    size = surface.get_size()
+    scratch = _scratch_cache.get(size)
+    if scratch is None:
+        scratch = pygame.Surface(size, pygame.SRCALPHA)
+        _scratch_cache[size] = scratch
+    dirty = pygame.draw.line(scratch, color, start, end, width)
+    if dirty.width and dirty.height:
+        _blit(surface, scratch, alpha, dirty.topleft, dirty)
+        scratch.fill((0, 0, 0, 0), dirty)
+
+
+def clear_cache():
+    """Drop every cached overlay (e.g. after a resolution change)."""
+    _fill_cache.clear()
+    _vignette_cache.clear()
+    _scratch_cache.clear()
@@ -2,43 +2,108 @@ import pygame
 import random
 import math
 from .settings import WHITE, GOLD, BROWN, LIGHT_BROWN, BOSS_PURPLE, RED
+from .profiler import profiler
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to flat Python lists
+    np = None
 
-class Particle:
-    """A single particle with position, velocity, color, lifetime, and gravity support."""
+# Fixed capacity of the particle pool; emits beyond it are dropped
+MAX_PARTICLES = 8192
 
-    def __init__(self, x, y, vx, vy, color, lifetime, size, gravity=0):
-        self.x = float(x)
-        self.y = float(y)
-        self.vx = float(vx)
-        self.vy = float(vy)
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = gravity
-        self.alive = True
+# Particle alpha is quantized to this step so circle sprites can be cached
+ALPHA_STEP = 16
 
-    def update(self, dt):
-        """Update particle position, apply gravity, and reduce lifetime."""
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += self.gravity * dt
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.alive = False
+# Pre-rendered circle sprites: (radius, rgb, alpha) -> Surface
+_sprite_cache = {}
 
-    @property
-    def alpha(self):
-        """Calculate alpha based on remaining lifetime (fade out)."""
-        return int(255 * (self.lifetime / self.max_lifetime))
 
+def get_particle_sprite(size, color, alpha):
+    """Return a cached circle sprite of radius *size* in *color* at *alpha*."""
+    key = (size, color, alpha)
+    surf = _sprite_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (size, size), size)
+        _sprite_cache[key] = surf
+    return surf
 
-class ParticleSystem:
-    """Manages and renders a collection of particles."""
 
-    def __init__(self):
-        self.particles = []
+class ParticleSystem:
+    """Pooled particle store kept as flat parallel arrays (struct of arrays).
+
+    Positions, velocities, lifetimes, sizes, gravity and palette-indexed
+    colors live in fixed-capacity NumPy arrays when NumPy is available, or
+    in preallocated Python lists otherwise. Dead particles are compacted
+    away in place during update, and drawing blits cached circle sprites
+    in a single fblits batch.
+    """
+
+    _FIELDS = ("_x", "_y", "_vx", "_vy", "_life", "_max_life", "_size", "_gravity", "_color")
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self._palette = []
+        self._palette_index = {}
+        if np is not None:
+            for name in self._FIELDS[:-1]:
+                setattr(self, name, np.zeros(capacity, dtype=np.float64))
+            self._color = np.zeros(capacity, dtype=np.int32)
+        else:
+            for name in self._FIELDS:
+                setattr(self, name, [0.0] * capacity)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
+
+    def _color_id(self, color):
+        color = tuple(color[:3])
+        idx = self._palette_index.get(color)
+        if idx is None:
+            idx = len(self._palette)
+            self._palette.append(color)
+            self._palette_index[color] = idx
+        return idx
+
+    def _spawn(self, x, y, vxs, vys, lifetimes, sizes, colors, gravity):
+        """Append a batch of particles sharing gravity.
+
+        *x* and *y* are a shared spawn point or lists of per-particle positions.
+        """
+        n = self.count
+        k = min(len(vxs), self.capacity - n)
+        if k <= 0:
+            return
+        end = n + k
+        self._x[n:end] = x[:k] if isinstance(x, list) else [float(x)] * k
+        self._y[n:end] = y[:k] if isinstance(y, list) else [float(y)] * k
+        self._vx[n:end] = vxs[:k]
+        self._vy[n:end] = vys[:k]
+        self._life[n:end] = lifetimes[:k]
+        self._max_life[n:end] = lifetimes[:k]
+        self._size[n:end] = sizes[:k]
+        self._gravity[n:end] = [float(gravity)] * k
+        self._color[n:end] = [self._color_id(c) for c in colors[:k]]
+        self.count = end
+
+    def _random_batch(self, count, angle_fn, color, speed_range, lifetime_range, size_range):
+        vxs, vys, lifetimes, sizes, colors = [], [], [], [], []
+        multi = isinstance(color[0], (list, tuple))
+        for _ in range(count):
+            angle = angle_fn()
+            speed = random.uniform(speed_range[0], speed_range[1])
+            vxs.append(math.cos(angle) * speed)
+            vys.append(math.sin(angle) * speed)
+            lifetimes.append(random.uniform(lifetime_range[0], lifetime_range[1]))
+            sizes.append(random.uniform(size_range[0], size_range[1]))
+            colors.append(random.choice(color) if multi else color)
+        return vxs, vys, lifetimes, sizes, colors
 
     def emit(self, x, y, count, color, speed_range, lifetime_range, size_range, gravity=0):
         """
@@ -53,51 +118,101 @@ class ParticleSystem:
             size_range: (min, max) size in pixels
             gravity: Downward acceleration (pixels/sec^2)
         """
-        for _ in range(count):
-            # Random direction (360 degrees)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(speed_range[0], speed_range[1])
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-
-            # Random properties
-            lifetime = random.uniform(lifetime_range[0], lifetime_range[1])
-            size = random.uniform(size_range[0], size_range[1])
+        # Random direction (360 degrees)
+        batch = self._random_batch(
+            count, lambda: random.uniform(0, 2 * math.pi),
+            color, speed_range, lifetime_range, size_range)
+        self._spawn(x, y, *batch, gravity)
 
-            # Handle color being a list of colors
-            if isinstance(color[0], (list, tuple)):
-                particle_color = random.choice(color)
-            else:
-                particle_color = color
-
-            particle = Particle(x, y, vx, vy, particle_color, lifetime, size, gravity)
-            self.particles.append(particle)
+    def emit_points(self, xs, ys, vxs, vys, lifetimes, sizes, colors, gravity=0):
+        """Spawn one particle per entry of the given parallel lists."""
+        self._spawn(xs, ys, vxs, vys, lifetimes, sizes, colors, gravity)
 
     def update(self, dt):
-        """Update all particles and remove dead ones."""
-        for particle in self.particles:
-            particle.update(dt)
-        self.particles = [p for p in self.particles if p.alive]
-
-    def draw(self, surface, camera):
-        """Draw all particles as small circles with alpha blending."""
-        for particle in self.particles:
-            # Calculate screen position
-            screen_x = int(particle.x - camera.x)
-            screen_y = int(particle.y - camera.y)
-
-            # Create a temporary surface for alpha blending
-            size = int(particle.size)
-            if size < 1:
-                size = 1
-
-            # Create surface with alpha
-            temp_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color_with_alpha = (*particle.color, particle.alpha)
-            pygame.draw.circle(temp_surf, color_with_alpha, (size, size), size)
-
-            # Blit to main surface
-            surface.blit(temp_surf, (screen_x - size, screen_y - size))
+        """Advance all particles and compact out the dead ones."""
+        n = self.count
+        if n == 0:
+            return
+        if np is not None:
+            x, y = self._x[:n], self._y[:n]
+            vy, life = self._vy[:n], self._life[:n]
+            x += self._vx[:n] * dt
+            y += vy * dt
+            vy += self._gravity[:n] * dt
+            life -= dt
+            alive = life > 0
+            if not alive.all():
+                keep = np.flatnonzero(alive)
+                m = len(keep)
+                for name in self._FIELDS:
+                    arr = getattr(self, name)
+                    arr[:m] = arr[keep]
+                self.count = m
+            return
+
+        xs, ys, vxs, vys = self._x, self._y, self._vx, self._vy
+        life, gravity = self._life, self._gravity
+        fields = [getattr(self, name) for name in self._FIELDS]
+        m = 0
+        for i in range(n):
+            xs[i] += vxs[i] * dt
+            ys[i] += vys[i] * dt
+            vys[i] += gravity[i] * dt
+            life[i] -= dt
+            if life[i] > 0:
+                if m != i:
+                    for arr in fields:
+                        arr[m] = arr[i]
+                m += 1
+        self.count = m
+
+    def draw(self, surface, camera, sprite_fn=get_particle_sprite, alpha_scale=1.0):
+        """Draw all particles as cached alpha sprites in one blit batch.
+
+        *sprite_fn(size, color, alpha)* returns the (cached) sprite for a
+        particle, circles by default; *alpha_scale* fades the whole system.
+        """
+        n = self.count
+        if n == 0:
+            return
+        cam_x, cam_y = camera.x, camera.y
+        width, height = surface.get_size()
+        palette = self._palette
+        if np is not None:
+            sizes = np.maximum(self._size[:n].astype(np.int64), 1)
+            sx = (self._x[:n] - cam_x).astype(np.int64) - sizes
+            sy = (self._y[:n] - cam_y).astype(np.int64) - sizes
+            alphas = (255 * alpha_scale * self._life[:n] / self._max_life[:n]).astype(np.int64)
+            alphas = alphas // ALPHA_STEP * ALPHA_STEP + (ALPHA_STEP - 1)
+            visible = ((sx + 2 * sizes >= 0) & (sy + 2 * sizes >= 0)
+                       & (sx <= width) & (sy <= height))
+            # One sprite lookup per distinct (size, color, alpha), not per particle
+            keys = ((sizes[visible] << 24) | (self._color[:n][visible].astype(np.int64) << 8)
+                    | alphas[visible])
+            unique_keys, inverse = np.unique(keys, return_inverse=True)
+            sprites = [sprite_fn(k >> 24, palette[(k >> 8) & 0xFFFF], k & 0xFF)
+                       for k in unique_keys.tolist()]
+            surface.fblits(list(zip(
+                map(sprites.__getitem__, inverse.tolist()),
+                zip(sx[visible].tolist(), sy[visible].tolist()))))
+            profiler.count("blits", len(inverse))
+            return
+
+        blits = []
+        xs, ys, sz, life, max_life, col = (
+            self._x, self._y, self._size, self._life, self._max_life, self._color)
+        for i in range(n):
+            size = max(1, int(sz[i]))
+            x = int(xs[i] - cam_x)
+            y = int(ys[i] - cam_y)
+            if x + size < 0 or y + size < 0 or x - size > width or y - size > height:
+                continue
+            alpha = (int(255 * alpha_scale * life[i] / max_life[i])
+                     // ALPHA_STEP * ALPHA_STEP + (ALPHA_STEP - 1))
+            blits.append((sprite_fn(size, palette[col[i]], alpha),
+                          (x - size, y - size)))
+        surface.fblits(blits)
+        profiler.count("blits", len(blits))
 
     # Convenience methods for specific effects
 
@@ -116,18 +231,10 @@ class ParticleSystem:
             size_range: (min, max) size
             gravity: Downward acceleration
         """
-        for _ in range(count):
-            a = angle + random.uniform(-spread, spread)
-            speed = random.uniform(speed_range[0], speed_range[1])
-            vx = math.cos(a) * speed
-            vy = math.sin(a) * speed
-            lifetime = random.uniform(lifetime_range[0], lifetime_range[1])
-            size = random.uniform(size_range[0], size_range[1])
-            if isinstance(color[0], (list, tuple)):
-                particle_color = random.choice(color)
-            else:
-                particle_color = color
-            self.particles.append(Particle(x, y, vx, vy, particle_color, lifetime, size, gravity))
+        batch = self._random_batch(
+            count, lambda: angle + random.uniform(-spread, spread),
+            color, speed_range, lifetime_range, size_range)
+        self._spawn(x, y, *batch, gravity)
 
     def emit_sword_sparks(self, x, y):
         """White/yellow sparks when sword hits enemy (fast, short-lived)."""
@@ -252,12 +359,12 @@ class ParticleSystem:
         """Sand wind — tan particles blowing rightward (desert)."""
         x = random.uniform(camera_x - 20, camera_x + screen_w * 0.3)
         y = random.uniform(camera_y, camera_y + screen_h)
-        self.particles.append(Particle(
+        self._spawn(
             x, y,
-            random.uniform(40, 80), random.uniform(-5, 5),
-            (210, 180, 120), random.uniform(2.0, 4.0),
-            random.uniform(1, 2), gravity=0
-        ))
+            [random.uniform(40, 80)], [random.uniform(-5, 5)],
+            [random.uniform(2.0, 4.0)], [random.uniform(1, 2)],
+            [(210, 180, 120)], gravity=0
+        )
 
     def emit_ambient_embers(self, screen_w, screen_h, camera_x, camera_y):
         """Floating embers — orange dots rising (volcano)."""
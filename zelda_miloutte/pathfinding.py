@@ -1,13 +1,11 @@
-"""A* pathfinding on the tile grid for enemy AI."""
+"""A* pathfinding and shared flow fields on the tile grid for enemy AI."""
 
 import heapq
 import math
+import weakref
+from collections import deque
 from .settings import TILE_SIZE
-from .world.tile import TileType
-
-
-# Tiles that enemies should avoid (hazards they are aware of)
-HAZARD_TILES = {TileType.WATER, TileType.LAVA, TileType.SPIKES, TileType.PIT}
+from .world.tile import HAZARD_TILES  # noqa: F401  (re-exported for callers)
 
 # Maximum number of pathfinding calls allowed per frame across all enemies
 MAX_PATHFINDS_PER_FRAME = 3
@@ -47,12 +45,10 @@ def _is_walkable(tilemap, col, row, avoid_hazards=True):
     """Check if a tile is walkable for an enemy."""
     if col < 0 or row < 0 or row >= tilemap.rows or col >= tilemap.cols:
         return False
-    tile = tilemap.get_tile(col, row)
-    if tile.solid:
-        return False
-    if avoid_hazards and tile in HAZARD_TILES:
-        return False
-    return True
+    i = row * tilemap.cols + col
+    if avoid_hazards:
+        return tilemap.walkable_grid[i] == 1
+    return tilemap.solid_grid[i] == 0
 
 
 def _heuristic(a, b):
@@ -68,6 +64,130 @@ _DIRS_8 = [(0, -1), (0, 1), (-1, 0), (1, 0),
            (-1, -1), (-1, 1), (1, -1), (1, 1)]
 
 
+# Chase radius of flow fields, in tiles of path distance (find_path's
+# default max_distance); tiles farther from the goal get no field
+FLOW_FIELD_RADIUS = 20
+
+
+class FlowField:
+    """Breadth-first distance field toward a single goal tile.
+
+    Every tile reachable from the goal within *max_distance* steps
+    (4-directional, never through solid or HAZARD_TILES tiles) stores its
+    distance in tiles and the index of the neighbor one step closer to the
+    goal, so any number of enemies chasing the same target read their next
+    step in O(1). The search stops at *max_distance*, so rebuilding the
+    field as the goal moves costs the chase area, not the whole map.
+    """
+
+    def __init__(self, tilemap, goal, max_distance=FLOW_FIELD_RADIUS):
+        self.goal = goal
+        self.max_distance = max_distance
+        self.revision = tilemap.revision
+        self.cols = cols = tilemap.cols
+        self.rows = tilemap.rows
+        self._size = n = cols * self.rows
+
+        walkable = tilemap.walkable_grid
+        dist = [-1] * n
+        step = [-1] * n
+        gc, gr = goal
+        if 0 <= gc < cols and 0 <= gr < self.rows:
+            # The goal itself may be unwalkable (player on a hazard); enemies
+            # then converge on its walkable neighbors
+            start = gr * cols + gc
+            dist[start] = 0
+            step[start] = start
+            queue = deque([start])
+            while queue:
+                i = queue.popleft()
+                d = dist[i] + 1
+                if d > max_distance:
+                    break
+                for j in self._neighbors(i):
+                    if walkable[j] and dist[j] < 0:
+                        dist[j] = d
+                        step[j] = i
+                        queue.append(j)
+        self._dist = dist
+        self._step = step
+        self._walkable = walkable
+
+    def _neighbors(self, i):
+        """Flat indices of the in-bounds 4-neighbors of tile index *i* (up, down, left, right)."""
+        cols = self.cols
+        col = i % cols
+        result = []
+        if i >= cols:
+            result.append(i - cols)
+        if i + cols < self._size:
+            result.append(i + cols)
+        if col > 0:
+            result.append(i - 1)
+        if col < cols - 1:
+            result.append(i + 1)
+        return result
+
+    def _index_at(self, px, py):
+        col, row = pixel_to_tile(px, py)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return row * self.cols + col
+        return None
+
+    def distance(self, px, py):
+        """Distance in tiles from the pixel position to the goal, or None if unreachable."""
+        i = self._index_at(px, py)
+        if i is None or self._dist[i] < 0:
+            return None
+        return self._dist[i]
+
+    def next_step(self, px, py):
+        """Pixel center of the next tile toward the goal, or None.
+
+        Returns None at the goal tile, beyond the field's radius, or when no
+        route exists. An unwalkable position (e.g. knocked onto a hazard)
+        steps to its closest reachable neighbor.
+        """
+        i = self._index_at(px, py)
+        if i is None:
+            return None
+        dist = self._dist
+        if dist[i] == 0:
+            return None
+        if dist[i] > 0:
+            j = self._step[i]
+        elif self._walkable[i]:
+            return None
+        else:
+            j = None
+            for k in self._neighbors(i):
+                if dist[k] >= 0 and (j is None or dist[k] < dist[j]):
+                    j = k
+            if j is None:
+                return None
+        return tile_to_pixel(j % self.cols, j // self.cols)
+
+
+# Most recent flow field per tilemap (dropped with the tilemap)
+_flow_fields = weakref.WeakKeyDictionary()
+
+
+def get_flow_field(tilemap, goal_px, goal_py):
+    """Return the flow field toward the tile under (goal_px, goal_py).
+
+    The field is rebuilt only when the goal moves to another tile or the
+    tilemap changes (TileMap.revision), so it is computed once per
+    player-tile change no matter how many enemies read it, and each
+    rebuild only floods the FLOW_FIELD_RADIUS chase area.
+    """
+    goal = pixel_to_tile(goal_px, goal_py)
+    field = _flow_fields.get(tilemap)
+    if field is None or field.goal != goal or field.revision != tilemap.revision:
+        field = FlowField(tilemap, goal)
+        _flow_fields[tilemap] = field
+    return field
+
+
 def find_path(tilemap, start_px, start_py, goal_px, goal_py,
               max_distance=20, avoid_hazards=True, eight_directional=False):
     """Find a path from start to goal using A* on the tile grid.
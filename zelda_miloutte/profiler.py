@@ -0,0 +1,258 @@
+"""Built-in frame profiler with an on-screen overlay and CSV export.
+
+Game.step brackets every frame with begin_frame()/end_frame(). Inside a
+frame, subsystems are timed with named scopes, either as a context manager
+
+    with profiler.scope("draw.tilemap"):
+        ...
+
+or by decorating a method with ``@profiled("update.enemies")``. Counters
+(``profiler.count("blits", n)``) are summed per frame.
+
+The profiler is off by default and every hook then reduces to a single
+attribute check, so the instrumentation can stay in the game loop. It is
+turned on by showing the overlay (F3 in game) or by setting the
+ZELDA_PROFILE_CSV environment variable to a file path, which writes one
+CSV row per frame with the timings of SCOPES and the values of COUNTERS.
+"""
+
+import atexit
+import csv
+import functools
+import os
+import time
+from collections import deque
+
+import pygame
+
+PROFILE_CSV_ENV = "ZELDA_PROFILE_CSV"
+
+# Scopes and counters exported as CSV columns, in column order. Names not
+# listed here are still shown in the overlay.
+SCOPES = (
+    "update",
+    "update.movement",
+    "update.enemies",
+    "update.combat",
+    "update.projectiles",
+    "update.items",
+    "update.particles",
+    "update.weather",
+    "draw",
+    "draw.tilemap",
+    "draw.entities",
+    "draw.particles",
+    "draw.weather",
+    "draw.day_night",
+    "draw.hud",
+    "draw.minimap",
+)
+COUNTERS = ("enemies", "projectiles", "particles", "blits", "entities_drawn")
+
+# Frames kept for the rolling average and p99
+HISTORY_FRAMES = 120
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler.add_time(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class FrameProfiler:
+    """Collects per-frame scope timings and counters."""
+
+    def __init__(self, history=HISTORY_FRAMES):
+        self.enabled = False
+        self.overlay_visible = False
+        self.history = history
+        self.frames = 0
+        self._frame_start = None
+        self._times = {}      # scope -> seconds accumulated this frame
+        self._counts = {}     # counter -> value accumulated this frame
+        self._samples = {}    # scope (and "frame") -> deque of ms per frame
+        self.counters = {}    # counter -> value of the last finished frame
+        self._csv_file = None
+        self._csv_writer = None
+        self._font = None
+
+    def _update_enabled(self):
+        self.enabled = self.overlay_visible or self._csv_writer is not None
+
+    # -- Recording ---------------------------------------------------------
+
+    def scope(self, name):
+        """Context manager timing the enclosed block under *name*."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add_time(self, name, seconds):
+        times = self._times
+        times[name] = times.get(name, 0.0) + seconds
+
+    def count(self, name, n=1):
+        if self.enabled:
+            counts = self._counts
+            counts[name] = counts.get(name, 0) + n
+
+    def begin_frame(self):
+        if not self.enabled:
+            self._frame_start = None
+            return
+        self._times.clear()
+        self._counts.clear()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Fold the frame's scopes into the rolling history (and CSV)."""
+        if self._frame_start is None:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000.0
+        self._frame_start = None
+        self.frames += 1
+        self._sample("frame", frame_ms)
+        times = self._times
+        for name in times:
+            if name not in self._samples:
+                self._samples[name] = deque(maxlen=self.history)
+        # Scopes that did not run this frame record 0 ms
+        for name, samples in self._samples.items():
+            if name != "frame":
+                samples.append(times.get(name, 0.0) * 1000.0)
+        self.counters = dict(self._counts)
+        if self._csv_writer is not None:
+            self._write_row(frame_ms)
+
+    def _sample(self, name, ms):
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.history)
+        samples.append(ms)
+
+    def stats(self, name):
+        """Return (average ms, p99 ms) of *name* over the history window."""
+        samples = self._samples.get(name)
+        if not samples:
+            return 0.0, 0.0
+        ordered = sorted(samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return sum(ordered) / len(ordered), p99
+
+    def scope_names(self):
+        """Scopes seen so far, declared SCOPES first."""
+        seen = [name for name in SCOPES if name in self._samples]
+        seen += sorted(name for name in self._samples
+                       if name not in SCOPES and name != "frame")
+        return seen
+
+    def reset(self):
+        self.frames = 0
+        self._samples.clear()
+        self.counters = {}
+
+    # -- Overlay -----------------------------------------------------------
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if not self.overlay_visible:
+            self.reset()
+        self._update_enabled()
+
+    def draw_overlay(self, surface):
+        if not self.overlay_visible:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        font = self._font
+        rows = [("frame", *self.stats("frame"))]
+        rows += [(name, *self.stats(name)) for name in self.scope_names()]
+        counters = "  ".join(f"{name} {self.counters[name]}" for name in sorted(self.counters))
+        line_h = font.get_linesize()
+        panel = pygame.Surface((300, line_h * (len(rows) + 2) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        color = (200, 255, 200)
+        panel.blit(font.render("scope", True, color), (6, 4))
+        panel.blit(font.render("avg ms    p99 ms", True, color), (170, 4))
+        for i, (name, avg, p99) in enumerate(rows, 1):
+            y = 4 + i * line_h
+            panel.blit(font.render(name, True, color), (6, y))
+            panel.blit(font.render(f"{avg:6.2f}    {p99:6.2f}", True, color), (170, y))
+        panel.blit(font.render(counters, True, color), (6, 4 + (len(rows) + 1) * line_h))
+        surface.blit(panel, (8, 8))
+
+    # -- CSV export --------------------------------------------------------
+
+    def start_csv(self, path):
+        """Write one row per frame to *path* until close_csv()."""
+        self.close_csv()
+        self._csv_file = open(path, "w", newline="")
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(
+            ["frame", "frame_ms"] + [f"{name}_ms" for name in SCOPES] + list(COUNTERS))
+        self._update_enabled()
+
+    def _write_row(self, frame_ms):
+        times = self._times
+        counts = self._counts
+        self._csv_writer.writerow(
+            [self.frames, f"{frame_ms:.3f}"]
+            + [f"{times.get(name, 0.0) * 1000.0:.3f}" for name in SCOPES]
+            + [counts.get(name, 0) for name in COUNTERS])
+
+    def close_csv(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            self._update_enabled()
+
+
+profiler = FrameProfiler()
+
+
+def start_from_env():
+    """Start CSV export if ZELDA_PROFILE_CSV names an output file."""
+    path = os.environ.get(PROFILE_CSV_ENV)
+    if path:
+        profiler.start_csv(path)
+        atexit.register(profiler.close_csv)
+
+
+def profiled(name):
+    """Decorator timing every call of the wrapped function under *name*."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.add_time(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
@@ -1,8 +1,16 @@
 """Wolfenstein 3D-style raycasting renderer for the 3D dungeon level."""
 
 import math
+from collections import OrderedDict
 import pygame
 from .settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from .world.tile import TileType
+from .sprites.tile_sprites import get_tile_surface
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the per-ray Python DDA
+    np = None
 
 
 # Wall colors by tile value in the 3D map
@@ -15,6 +23,16 @@ WALL_COLORS = {
     5: (100, 60, 60),     # Dark red stone
 }
 
+# Wall textures by tile value: (tile sprite, RGB multiplier or None).
+# Mossy, brick and dark red walls are tinted versions of the 2D wall tiles.
+WALL_TEXTURES = {
+    1: (TileType.WALL.value, None),
+    2: (TileType.WALL.value, (145, 200, 127)),
+    3: (TileType.WALL.value, (255, 163, 100)),
+    4: (TileType.BOSS_DOOR.value, None),
+    5: (TileType.CRACKED_WALL.value, (196, 117, 117)),
+}
+
 CEILING_COLOR = (30, 30, 50)
 FLOOR_COLOR = (60, 50, 40)
 FOG_COLOR = (15, 12, 20)
@@ -23,25 +41,208 @@ FOV = math.pi / 3       # 60 degree field of view
 HALF_FOV = FOV / 2
 MAX_DEPTH = 20
 
+# Distance fog is quantized into this many steps over [0, MAX_DEPTH)
+FOG_BUCKETS = 64
+
+# Side-shaded darkening applied to horizontal (y-side) wall faces
+SIDE_SHADE = 35
+
+# Fog levels of the pre-darkened wall textures
+TEXTURE_FOG_BUCKETS = 16
+
+# Pixel memory of the scaled texture columns kept per Raycaster (LRU).
+# Bounded by bytes rather than entries: close to a wall a single strip can
+# be several times the view height.
+WALL_STRIP_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Pre-rendered ceiling/floor gradient per (width, height)
+_background_cache = {}
+
+# Scaled, fogged billboard surfaces: (surface, height, fog bucket) -> Surface.
+# Heights are rounded to SPRITE_HEIGHT_STEP and fog to SPRITE_FOG_BUCKETS
+# levels so a sprite walking toward the player reuses a handful of entries.
+# Only used for sprites given a surface; Dungeon3DState currently passes
+# None and draws its entities as color slabs.
+SPRITE_CACHE_SIZE = 96
+SPRITE_HEIGHT_STEP = 4
+SPRITE_FOG_BUCKETS = 16
+_sprite_cache = OrderedDict()
+
+
+def _fog_blend(color, fog_factor):
+    return tuple(
+        int(c * (1 - fog_factor) + FOG_COLOR[ci] * fog_factor)
+        for ci, c in enumerate(color)
+    )
+
+
+def get_background(width, height):
+    """Return the ceiling and floor gradient for a *width* x *height* view."""
+    key = (width, height)
+    background = _background_cache.get(key)
+    if background is None:
+        background = pygame.Surface((width, height))
+        background.fill(FOG_COLOR)
+        # Ceiling fades from the fog color at the top into CEILING_COLOR,
+        # floor from the fog color at the horizon into FLOOR_COLOR
+        half_h = height // 2
+        for y in range(half_h):
+            t = y / half_h
+            r = int(CEILING_COLOR[0] * t + FOG_COLOR[0] * (1 - t))
+            g = int(CEILING_COLOR[1] * t + FOG_COLOR[1] * (1 - t))
+            b = int(CEILING_COLOR[2] * t + FOG_COLOR[2] * (1 - t))
+            pygame.draw.line(background, (r, g, b), (0, y), (width, y))
+        for y in range(half_h, height):
+            t = (y - half_h) / half_h
+            r = int(FLOOR_COLOR[0] * t + FOG_COLOR[0] * (1 - t))
+            g = int(FLOOR_COLOR[1] * t + FOG_COLOR[1] * (1 - t))
+            b = int(FLOOR_COLOR[2] * t + FOG_COLOR[2] * (1 - t))
+            pygame.draw.line(background, (r, g, b), (0, y), (width, y))
+        _background_cache[key] = background
+    return background
+
+
+def get_sprite_surface(sprite_surf, height, fog_bucket):
+    """Return *sprite_surf* scaled to *height* x *height* and fogged (LRU cached)."""
+    key = (sprite_surf, height, fog_bucket)
+    scaled = _sprite_cache.get(key)
+    if scaled is not None:
+        _sprite_cache.move_to_end(key)
+        return scaled
+    scaled = pygame.transform.scale(sprite_surf, (height, height))
+    # Blend RGB toward the fog color; alpha is left alone so transparent
+    # pixels stay transparent
+    fog = fog_bucket / SPRITE_FOG_BUCKETS * 200 / 255
+    keep = int(255 * (1 - fog))
+    scaled.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+    scaled.fill(tuple(int(c * fog) for c in FOG_COLOR), special_flags=pygame.BLEND_RGB_ADD)
+    _sprite_cache[key] = scaled
+    if len(_sprite_cache) > SPRITE_CACHE_SIZE:
+        _sprite_cache.popitem(last=False)
+    return scaled
+
+
+_wall_textures = None
+
+
+def _fogged(surface, fog):
+    """Copy of *surface* with its RGB blended toward FOG_COLOR by *fog*."""
+    fogged = surface.copy()
+    keep = int(255 * (1 - fog))
+    fogged.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+    fogged.fill(tuple(int(c * fog) for c in FOG_COLOR), special_flags=pygame.BLEND_RGB_ADD)
+    return fogged
+
+
+def get_wall_textures():
+    """Wall texture columns indexed [wall_type][side][fog bucket][texture x].
+
+    Every texture is shaded and fogged once up front and sliced into
+    1 px wide column subsurfaces. Index 0 and unknown wall types use the
+    stone texture, like build_wall_lut().
+    """
+    global _wall_textures
+    if _wall_textures is None:
+        textures = []
+        for wall_type in range(max(WALL_TEXTURES) + 1):
+            tile, tint = WALL_TEXTURES.get(wall_type, WALL_TEXTURES[1])
+            base = get_tile_surface(tile).copy()
+            if tint is not None:
+                base.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+            shaded = base.copy()
+            shaded.fill((SIDE_SHADE,) * 3, special_flags=pygame.BLEND_RGB_SUB)
+            sides = []
+            for texture in (base, shaded):
+                buckets = []
+                for bucket in range(TEXTURE_FOG_BUCKETS):
+                    fogged = _fogged(texture, (bucket + 0.5) / TEXTURE_FOG_BUCKETS)
+                    w, h = fogged.get_size()
+                    buckets.append([fogged.subsurface((u, 0, 1, h)) for u in range(w)])
+                sides.append(buckets)
+            textures.append(sides)
+        _wall_textures = textures
+    return _wall_textures
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _quantize_wall_height(height):
+    """Round *height* to a step of about 3% so scaled strips can be shared."""
+    step = max(2, height >> 5)
+    return max(step, (height + step // 2) // step * step)
+
+
+def build_wall_lut():
+    """Fogged wall colors indexed [wall_type][side][fog bucket].
+
+    Index 0 and wall types missing from WALL_COLORS use the stone color.
+    Each bucket is shaded with the fog factor at its center.
+    """
+    lut = []
+    for wall_type in range(max(WALL_COLORS) + 1):
+        base = WALL_COLORS.get(wall_type, WALL_COLORS[1])
+        shaded = tuple(max(0, c - SIDE_SHADE) for c in base)
+        lut.append([
+            [_fog_blend(color, (bucket + 0.5) / FOG_BUCKETS) for bucket in range(FOG_BUCKETS)]
+            for color in (base, shaded)
+        ])
+    return lut
+
 
 class Raycaster:
     """Casts rays against a 2D tile grid and renders a first-person 3D view."""
 
-    def __init__(self, map_data):
+    def __init__(self, map_data, textured=True):
+        """
+        Args:
+            map_data: 2D list of wall types (0 = open floor)
+            textured: Draw walls with the tile textures; False draws
+                flat WALL_COLORS slabs
+        """
         self.map_data = map_data
+        self.textured = textured
         self.map_height = len(map_data)
         self.map_width = len(map_data[0]) if self.map_height > 0 else 0
         self.width = SCREEN_WIDTH
         self.height = SCREEN_HEIGHT
 
-        # Column rendering strip width (2px strips for performance)
-        self.strip_width = 2
+        # Column rendering strip width: full 1px resolution with the
+        # vectorized caster, 2px strips for the pure-Python fallback
+        self.strip_width = 1 if np is not None else 2
         self.num_rays = self.width // self.strip_width
         self.delta_angle = FOV / self.num_rays
 
+        # Wall grid padded with a ring of stone walls, so every ray stops
+        # inside it and out-of-bounds cells read as wall type 1
+        self._wall_grid = None
+        if np is not None:
+            grid = np.ones((self.map_height + 2, self.map_width + 2), dtype=np.int32)
+            if self.map_height and self.map_width:
+                grid[1:-1, 1:-1] = np.asarray(map_data, dtype=np.int32)
+            self._wall_grid = grid
+
         # Pre-create the rendering surface
         self.surface = pygame.Surface((self.width, self.height))
 
+        # One full-height strip per (wall type, side, fog bucket); walls are
+        # drawn by blitting the visible part of the matching strip
+        self._wall_strips = [
+            [[self._make_strip(color) for color in buckets] for buckets in sides]
+            for sides in build_wall_lut()
+        ]
+        self._fog_scale = FOG_BUCKETS / MAX_DEPTH
+        if textured:
+            self._wall_textures = get_wall_textures()
+            self._strip_cache = OrderedDict()
+            self._strip_cache_bytes = 0
+
+    def _make_strip(self, color):
+        strip = pygame.Surface((self.strip_width, self.height))
+        strip.fill(color)
+        return strip
+
     def _is_wall(self, x, y):
         """Check if map position is a wall (non-zero)."""
         if x < 0 or x >= self.map_width or y < 0 or y >= self.map_height:
@@ -59,6 +260,104 @@ class Raycaster:
 
         Uses DDA (Digital Differential Analyzer) algorithm.
         """
+        if self._wall_grid is None:
+            return [hit[:3] for hit in self._cast_rays_py(px, py, angle)]
+        dists, wall_types, sides, _ = self._cast_rays_np(px, py, angle)
+        return list(zip(dists.tolist(), wall_types.tolist(), sides.tolist()))
+
+    def cast_ray_arrays(self, px, py, angle):
+        """Cast all rays; return (perp_dists, wall_types, sides, wall_xs).
+
+        wall_xs is the texture coordinate of each hit along the wall face,
+        in [0, 1], oriented so textures read left to right from every side.
+        NumPy arrays when NumPy is available, otherwise lists from the
+        pure-Python caster.
+        """
+        if self._wall_grid is None:
+            results = self._cast_rays_py(px, py, angle)
+            if not results:
+                return [], [], [], []
+            return tuple(list(column) for column in zip(*results))
+        return self._cast_rays_np(px, py, angle)
+
+    def _cast_rays_np(self, px, py, angle):
+        """DDA for all rays in lock-step over the padded wall grid.
+
+        Mirrors _cast_rays_py step for step (same ray angles, same
+        side-distance updates) so both casters agree.
+        """
+        n = self.num_rays
+        # Sequential accumulation, exactly like ray_angle += delta_angle
+        steps = np.full(n, self.delta_angle)
+        steps[0] = angle - HALF_FOV
+        ray_angles = np.add.accumulate(steps)
+
+        sin_a = np.sin(ray_angles)
+        cos_a = np.cos(ray_angles)
+        # Avoid division by zero
+        cos_a = np.where(np.abs(cos_a) < 1e-8, np.where(cos_a >= 0, 1e-8, -1e-8), cos_a)
+        sin_a = np.where(np.abs(sin_a) < 1e-8, np.where(sin_a >= 0, 1e-8, -1e-8), sin_a)
+
+        start_x = int(px)
+        start_y = int(py)
+        delta_x = np.abs(1.0 / cos_a)
+        delta_y = np.abs(1.0 / sin_a)
+        neg_x = cos_a < 0
+        neg_y = sin_a < 0
+        step_x = np.where(neg_x, -1, 1)
+        step_y = np.where(neg_y, -1, 1)
+        side_x = np.where(neg_x, (px - start_x) * delta_x, (start_x + 1.0 - px) * delta_x)
+        side_y = np.where(neg_y, (py - start_y) * delta_y, (start_y + 1.0 - py) * delta_y)
+
+        dists = np.full(n, float(MAX_DEPTH))
+        wall_types = np.ones(n, dtype=np.int32)
+        sides = np.zeros(n, dtype=np.int32)
+
+        grid = self._wall_grid
+        max_row, max_col = grid.shape[0] - 1, grid.shape[1] - 1
+        # Working set: indices of rays still marching, in padded-grid coords
+        active = np.arange(n)
+        map_x = np.full(n, start_x + 1)
+        map_y = np.full(n, start_y + 1)
+        for _ in range(MAX_DEPTH * 2):
+            go_x = side_x < side_y
+            go_y = ~go_x
+            side_x = side_x + np.where(go_x, delta_x, 0.0)
+            side_y = side_y + np.where(go_y, delta_y, 0.0)
+            map_x = map_x + np.where(go_x, step_x, 0)
+            map_y = map_y + np.where(go_y, step_y, 0)
+
+            cells = grid[np.clip(map_y, 0, max_row), np.clip(map_x, 0, max_col)]
+            hit = cells > 0
+            if hit.any():
+                idx = active[hit]
+                wall_types[idx] = cells[hit]
+                sides[idx] = go_y[hit]
+                dists[idx] = np.where(go_x[hit], side_x[hit] - delta_x[hit],
+                                      side_y[hit] - delta_y[hit])
+                keep = ~hit
+                active = active[keep]
+                if not active.size:
+                    break
+                (side_x, side_y, delta_x, delta_y, step_x, step_y, map_x, map_y) = (
+                    a[keep] for a in (side_x, side_y, delta_x, delta_y,
+                                      step_x, step_y, map_x, map_y))
+
+        hit_rays = np.ones(n, dtype=bool)
+        hit_rays[active] = False
+        # Where along the wall face each ray hit
+        wall_xs = np.where(sides == 0, py + dists * sin_a, px + dists * cos_a)
+        wall_xs -= np.floor(wall_xs)
+        flip = ((sides == 0) & (cos_a > 0)) | ((sides == 1) & (sin_a < 0))
+        wall_xs = np.where(flip, 1.0 - wall_xs, wall_xs)
+        wall_xs[~hit_rays] = 0.0
+        # Fix fish-eye: correct for angle difference from center
+        corrected = np.maximum(dists * np.cos(ray_angles - angle), 0.01)
+        dists = np.where(hit_rays, corrected, float(MAX_DEPTH))
+        return dists, wall_types, sides, wall_xs
+
+    def _cast_rays_py(self, px, py, angle):
+        """Per-ray Python DDA; returns a list of (perp_dist, wall_type, side, wall_x)."""
         results = []
         ray_angle = angle - HALF_FOV
 
@@ -114,7 +413,7 @@ class Raycaster:
                     break
 
             if not hit:
-                results.append((MAX_DEPTH, 1, 0))
+                results.append((MAX_DEPTH, 1, 0, 0.0))
             else:
                 # Calculate perpendicular distance to avoid fish-eye
                 if side == 0:
@@ -122,6 +421,15 @@ class Raycaster:
                 else:
                     perp_dist = side_dist_y - delta_dist_y
 
+                # Where along the wall face the ray hit
+                if side == 0:
+                    wall_x = py + perp_dist * sin_a
+                else:
+                    wall_x = px + perp_dist * cos_a
+                wall_x -= math.floor(wall_x)
+                if (side == 0 and cos_a > 0) or (side == 1 and sin_a < 0):
+                    wall_x = 1.0 - wall_x
+
                 # Fix fish-eye: correct for angle difference from center
                 perp_dist *= math.cos(ray_angle - angle)
 
@@ -129,7 +437,7 @@ class Raycaster:
                     perp_dist = 0.01
 
                 wall_type = self._get_wall_type(map_x, map_y)
-                results.append((perp_dist, wall_type, side))
+                results.append((perp_dist, wall_type, side, wall_x))
 
             ray_angle += self.delta_angle
 
@@ -144,68 +452,21 @@ class Raycaster:
             angle: player viewing angle in radians
             sprites: optional list of (world_x, world_y, color, size, sprite_surface) for entities
         """
-        self.surface.fill(FOG_COLOR)
-
-        # Draw ceiling gradient
-        half_h = self.height // 2
-        for y in range(half_h):
-            t = y / half_h
-            r = int(CEILING_COLOR[0] * t + FOG_COLOR[0] * (1 - t))
-            g = int(CEILING_COLOR[1] * t + FOG_COLOR[1] * (1 - t))
-            b = int(CEILING_COLOR[2] * t + FOG_COLOR[2] * (1 - t))
-            pygame.draw.line(self.surface, (r, g, b), (0, y), (self.width, y))
-
-        # Draw floor gradient
-        for y in range(half_h, self.height):
-            t = (y - half_h) / half_h
-            r = int(FLOOR_COLOR[0] * t + FOG_COLOR[0] * (1 - t))
-            g = int(FLOOR_COLOR[1] * t + FOG_COLOR[1] * (1 - t))
-            b = int(FLOOR_COLOR[2] * t + FOG_COLOR[2] * (1 - t))
-            pygame.draw.line(self.surface, (r, g, b), (0, y), (self.width, y))
+        self.surface.blit(get_background(self.width, self.height), (0, 0))
 
         # Cast rays
-        wall_data = self.cast_rays(px, py, angle)
+        dists, wall_types, sides, wall_xs = self.cast_ray_arrays(px, py, angle)
+        if np is not None:
+            dists, wall_types, sides, wall_xs = (
+                dists.tolist(), wall_types.tolist(), sides.tolist(), wall_xs.tolist())
 
         # Store z-buffer for sprite clipping
-        z_buffer = []
+        z_buffer = dists
 
-        # Draw walls
-        for i, (dist, wall_type, side) in enumerate(wall_data):
-            z_buffer.append(dist)
-
-            if dist >= MAX_DEPTH:
-                continue
-
-            # Wall height based on distance
-            wall_height = int(self.height / dist)
-            if wall_height > self.height * 4:
-                wall_height = self.height * 4
-
-            # Center vertically
-            draw_start = half_h - wall_height // 2
-            draw_end = half_h + wall_height // 2
-
-            # Get base color
-            base_color = WALL_COLORS.get(wall_type, WALL_COLORS[1])
-
-            # Darken one side for depth perception
-            if side == 1:
-                color = tuple(max(0, c - 35) for c in base_color)
-            else:
-                color = base_color
-
-            # Distance fog
-            fog_factor = min(1.0, dist / MAX_DEPTH)
-            color = tuple(
-                int(c * (1 - fog_factor) + FOG_COLOR[ci] * fog_factor)
-                for ci, c in enumerate(color)
-            )
-
-            x = i * self.strip_width
-            pygame.draw.rect(
-                self.surface, color,
-                (x, draw_start, self.strip_width, draw_end - draw_start)
-            )
+        if self.textured:
+            self._draw_textured_walls(dists, wall_types, sides, wall_xs)
+        else:
+            self._draw_walls(dists, wall_types, sides)
 
         # Draw sprites (enemies, items, etc.)
         if sprites:
@@ -213,6 +474,76 @@ class Raycaster:
 
         surface.blit(self.surface, (0, 0))
 
+    def _draw_walls(self, dists, wall_types, sides):
+        """Draw one wall strip per ray in a single blits() batch."""
+        height = self.height
+        half_h = height // 2
+        strip_width = self.strip_width
+        strips = self._wall_strips
+        max_type = len(strips) - 1
+        fog_scale = self._fog_scale
+        last_bucket = FOG_BUCKETS - 1
+        batch = []
+        x = 0
+        for dist, wall_type, side in zip(dists, wall_types, sides):
+            if dist < MAX_DEPTH:
+                # Wall height based on distance, centered vertically and
+                # clipped to the view
+                half_wall = min(int(height / dist), height * 4) // 2
+                top = max(0, half_h - half_wall)
+                bottom = min(height, half_h + half_wall)
+                if wall_type > max_type:
+                    wall_type = 1
+                bucket = min(last_bucket, int(dist * fog_scale))
+                batch.append((strips[wall_type][side][bucket], (x, top),
+                              (0, 0, strip_width, bottom - top)))
+            x += strip_width
+        self.surface.blits(batch, doreturn=False)
+
+    def _draw_textured_walls(self, dists, wall_types, sides, wall_xs):
+        """Draw one scaled texture column per ray in a single blits() batch.
+
+        Columns are scaled to a quantized wall height and kept in an LRU
+        cache keyed by (wall type, side, fog bucket, texture x, height),
+        evicted once the cached pixels exceed WALL_STRIP_CACHE_MAX_BYTES.
+        """
+        height = self.height
+        half_h = height // 2
+        strip_width = self.strip_width
+        textures = self._wall_textures
+        max_type = len(textures) - 1
+        cache = self._strip_cache
+        fog_scale = TEXTURE_FOG_BUCKETS / MAX_DEPTH
+        last_bucket = TEXTURE_FOG_BUCKETS - 1
+        scale = pygame.transform.scale
+        batch = []
+        x = 0
+        for dist, wall_type, side, wall_x in zip(dists, wall_types, sides, wall_xs):
+            if dist < MAX_DEPTH:
+                wall_h = _quantize_wall_height(min(int(height / dist), height * 4))
+                if wall_type > max_type:
+                    wall_type = 1
+                bucket = min(last_bucket, int(dist * fog_scale))
+                columns = textures[wall_type][side][bucket]
+                u = min(len(columns) - 1, int(wall_x * len(columns)))
+                key = (wall_type, side, bucket, u, wall_h)
+                strip = cache.get(key)
+                if strip is None:
+                    strip = scale(columns[u], (strip_width, wall_h))
+                    cache[key] = strip
+                    self._strip_cache_bytes += _surface_bytes(strip)
+                    while self._strip_cache_bytes > WALL_STRIP_CACHE_MAX_BYTES and len(cache) > 1:
+                        self._strip_cache_bytes -= _surface_bytes(cache.popitem(last=False)[1])
+                else:
+                    cache.move_to_end(key)
+                # Centered vertically; blit only the part inside the view
+                top = half_h - wall_h // 2
+                clip = max(0, -top)
+                batch.append((strip, (x, top + clip),
+                              (0, clip, strip_width, min(wall_h, height - top) - clip)))
+            x += strip_width
+        self.surface.blits(batch, doreturn=False)
+
     def _render_sprites(self, px, py, angle, sprites, z_buffer):
         """Render billboarded sprites sorted by distance (painter's algorithm)."""
         # Calculate distance and screen position for each sprite
@@ -251,6 +582,7 @@ class Raycaster:
         # Sort far to near (painter's algorithm)
         sprite_data.sort(key=lambda s: -s[0])
 
+        surf = self.surface
         for dist, rel_angle, color, size, sprite_surf, hp_ratio in sprite_data:
             if dist >= MAX_DEPTH:
                 continue
@@ -260,6 +592,10 @@ class Raycaster:
 
             # Sprite size on screen
             sprite_height = int(self.height / dist * size)
+            if sprite_surf is not None:
+                # Round to the sprite cache's height step
+                step = SPRITE_HEIGHT_STEP
+                sprite_height = (sprite_height + step // 2) // step * step
             sprite_width = sprite_height
 
             if sprite_height < 1:
@@ -269,65 +605,61 @@ class Raycaster:
             draw_x = screen_x - sprite_width // 2
             draw_y = self.height // 2 - sprite_height // 2
 
+            # Columns in front of the walls, as contiguous runs
+            runs = self._visible_runs(draw_x, draw_x + sprite_width, dist, z_buffer)
+            if not runs:
+                continue
+
             # Distance fog factor
             fog_factor = min(1.0, dist / MAX_DEPTH)
 
             if sprite_surf is not None:
-                # Scale and draw the provided sprite surface
-                scaled = pygame.transform.scale(sprite_surf, (sprite_width, sprite_height))
-                # Apply fog by blending
-                fog_overlay = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
-                fog_alpha = int(fog_factor * 200)
-                fog_overlay.fill((*FOG_COLOR, fog_alpha))
-                scaled.blit(fog_overlay, (0, 0))
-                # Clip against z-buffer column by column
-                for col in range(max(0, draw_x), min(self.width, draw_x + sprite_width)):
-                    buf_idx = col // self.strip_width
-                    if buf_idx < len(z_buffer) and dist < z_buffer[buf_idx]:
-                        src_col = col - draw_x
-                        self.surface.blit(
-                            scaled, (col, draw_y),
-                            (src_col, 0, 1, sprite_height)
-                        )
+                fog_bucket = min(SPRITE_FOG_BUCKETS - 1, int(fog_factor * SPRITE_FOG_BUCKETS))
+                scaled = get_sprite_surface(sprite_surf, sprite_height, fog_bucket)
+                surf.blits([(scaled, (x0, draw_y), (x0 - draw_x, 0, x1 - x0, sprite_height))
+                            for x0, x1 in runs], doreturn=False)
             else:
-                # Draw as a colored rectangle with shading
-                fogged_color = tuple(
-                    int(c * (1 - fog_factor) + FOG_COLOR[ci] * fog_factor)
-                    for ci, c in enumerate(color)
-                )
-
-                # Draw column by column, checking z-buffer
-                for col in range(max(0, draw_x), min(self.width, draw_x + sprite_width)):
-                    buf_idx = col // self.strip_width
-                    if buf_idx < len(z_buffer) and dist < z_buffer[buf_idx]:
-                        pygame.draw.line(
-                            self.surface, fogged_color,
-                            (col, max(0, draw_y)), (col, min(self.height, draw_y + sprite_height))
-                        )
+                # Colored rectangle with distance fog
+                fogged_color = _fog_blend(color, fog_factor)
+                top = max(0, draw_y)
+                rect_h = min(self.height, draw_y + sprite_height) - top
+                for x0, x1 in runs:
+                    surf.fill(fogged_color, (x0, top, x1 - x0, rect_h))
 
             # Draw health bar above sprite if hp_ratio is provided
             if hp_ratio is not None and hp_ratio < 1.0:
-                bar_w = sprite_width
                 bar_h = max(2, sprite_height // 10)
                 bar_y = draw_y - bar_h - 2
                 if bar_y >= 0:
-                    # Background
-                    for col in range(max(0, draw_x), min(self.width, draw_x + bar_w)):
-                        buf_idx = col // self.strip_width
-                        if buf_idx < len(z_buffer) and dist < z_buffer[buf_idx]:
-                            pygame.draw.line(
-                                self.surface, (40, 40, 40),
-                                (col, bar_y), (col, bar_y + bar_h)
-                            )
-                    # Health fill
-                    fill_w = int(bar_w * hp_ratio)
-                    for col in range(max(0, draw_x), min(self.width, draw_x + fill_w)):
-                        buf_idx = col // self.strip_width
-                        if buf_idx < len(z_buffer) and dist < z_buffer[buf_idx]:
-                            pygame.draw.line(
-                                self.surface, (220, 30, 30),
-                                (col, bar_y), (col, bar_y + bar_h)
-                            )
+                    fill_end = draw_x + int(sprite_width * hp_ratio)
+                    for x0, x1 in runs:
+                        # Background, then health fill
+                        surf.fill((40, 40, 40), (x0, bar_y, x1 - x0, bar_h))
+                        if x0 < fill_end:
+                            surf.fill((220, 30, 30), (x0, bar_y, min(x1, fill_end) - x0, bar_h))
+
+    def _visible_runs(self, x0, x1, dist, z_buffer):
+        """Return [start, end) screen column runs of [x0, x1) nearer than the walls.
+
+        z_buffer holds one distance per strip, so each strip is tested once.
+        """
+        x0 = max(0, x0)
+        x1 = min(self.width, x1)
+        if x0 >= x1:
+            return []
+        sw = self.strip_width
+        runs = []
+        run_start = None
+        for strip in range(x0 // sw, (x1 - 1) // sw + 1):
+            if dist < z_buffer[strip]:
+                if run_start is None:
+                    run_start = max(x0, strip * sw)
+            elif run_start is not None:
+                runs.append((run_start, strip * sw))
+                run_start = None
+        if run_start is not None:
+            runs.append((run_start, x1))
+        return runs
 
     def draw_minimap(self, surface, px, py, angle, enemies=None, items=None):
         """Draw a small minimap overlay in the corner."""
@@ -0,0 +1,118 @@
+"""Scripted keyboard input for headless simulation and input replay.
+
+A script is a list of (frame, kind, key) entries where kind is "down" or
+"up" and key is a pygame key code. ScriptedInput turns it back into
+KEYDOWN/KEYUP events frame by frame and tracks which keys are held, so it
+can stand in for ``pygame.key.get_pressed`` in InputHandler. Scripts can
+be recorded from a live session (InputRecorder), saved as JSON, or
+generated (hold, tap, random_script).
+"""
+
+import json
+import random
+import pygame
+
+
+class _HeldKeys:
+    """Indexable like the result of pygame.key.get_pressed()."""
+
+    def __init__(self, held):
+        self._held = held
+
+    def __getitem__(self, key):
+        return key in self._held
+
+
+class ScriptedInput:
+    """Replays a key script one frame at a time."""
+
+    def __init__(self, script=()):
+        self.script = sorted(script, key=lambda entry: entry[0])
+        self.frame = 0
+        self._pos = 0
+        self._held = set()
+
+    @property
+    def finished(self):
+        """True once every scripted entry has been replayed."""
+        return self._pos >= len(self.script)
+
+    def next_frame(self):
+        """Return the pygame events for the current frame and advance one frame."""
+        events = []
+        script = self.script
+        while self._pos < len(script) and script[self._pos][0] <= self.frame:
+            _, kind, key = script[self._pos]
+            self._pos += 1
+            if kind == "down":
+                self._held.add(key)
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+            else:
+                self._held.discard(key)
+                events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0))
+        self.frame += 1
+        return events
+
+    def get_pressed(self):
+        """Held-key state for InputHandler (replaces pygame.key.get_pressed)."""
+        return _HeldKeys(self._held)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump([list(entry) for entry in self.script], f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(tuple(entry) for entry in json.load(f))
+
+
+class InputRecorder:
+    """Records live KEYDOWN/KEYUP events as a replayable script."""
+
+    def __init__(self):
+        self.script = []
+
+    def record(self, frame, event):
+        if event.type == pygame.KEYDOWN:
+            self.script.append((frame, "down", event.key))
+        elif event.type == pygame.KEYUP:
+            self.script.append((frame, "up", event.key))
+
+    def save(self, path):
+        ScriptedInput(self.script).save(path)
+
+
+def hold(key, start, frames):
+    """Script entries holding *key* from frame *start* for *frames* frames."""
+    return [(start, "down", key), (start + frames, "up", key)]
+
+
+def tap(key, frame):
+    """Script entries for a single one-frame press of *key*."""
+    return hold(key, frame, 1)
+
+
+# Keys used by random_script: movement plus the common actions
+_MOVE_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+_ACTION_KEYS = (pygame.K_SPACE, pygame.K_e, pygame.K_r, pygame.K_q, pygame.K_LSHIFT)
+
+
+def random_script(frames, seed=0, move_hold=(10, 90), action_chance=0.05):
+    """Generate a wandering-and-fighting script lasting *frames* frames.
+
+    The player walks in random directions for random stretches and
+    presses a random action key on roughly *action_chance* of frames.
+    Menus are never opened, so the script keeps the game in gameplay.
+    """
+    rng = random.Random(seed)
+    script = []
+    frame = 0
+    while frame < frames:
+        length = min(rng.randint(*move_hold), frames - frame)
+        script += hold(rng.choice(_MOVE_KEYS), frame, length)
+        frame += length
+    for frame in range(frames):
+        if rng.random() < action_chance:
+            script += tap(rng.choice(_ACTION_KEYS), frame)
+    return script
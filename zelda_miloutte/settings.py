@@ -255,3 +255,26 @@ HUD_HEART_SPACING = 4
 HUD_MARGIN = 8
 BOSS_BAR_WIDTH = 200
 BOSS_BAR_HEIGHT = 12
+
+# Area cache (suspended overworld areas kept for instant re-entry)
+AREA_CACHE_SIZE = 4                       # areas kept besides the current one
+AREA_CACHE_MAX_BYTES = 64 * 1024 * 1024   # pre-rendered tilemap chunks across them
+# Enemies when re-entering a cached area: "reentry" respawns them on every
+# entry (as if the area were rebuilt), "never" keeps defeated enemies gone
+AREA_ENEMY_RESPAWN = "reentry"
+
+# Area preloading (adjacent areas built in idle frame time)
+PRELOAD_DISTANCE = 10          # tiles from a border exit at which its area starts preloading
+PRELOAD_FRAME_MARGIN = 0.002   # seconds of each frame budget left unused by preload slices
+
+# Text rendering cache
+TEXT_CACHE_SIZE = 512   # rendered (text, size, color, antialias) surfaces kept
+LAYOUT_CACHE_SIZE = 64  # word-wrapped (text, font, width, color) layouts kept
+
+# Audio output format. Sounds are synthesized as 16-bit mono at this rate;
+# the mixer is opened in exactly this format (SDL converts for the device)
+# so the bundled audio cache, baked for it, matches on every platform
+AUDIO_FREQUENCY = 22050
+AUDIO_SIZE = -16
+AUDIO_CHANNELS = 1
+AUDIO_BUFFER = 512
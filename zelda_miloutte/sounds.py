@@ -1,6 +1,14 @@
 import pygame
 import math
 import array
+import threading
+from collections import deque
+from .settings import AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to per-sample Python loops
+    np = None
 
 
 class SoundManager:
@@ -9,78 +17,203 @@ class SoundManager:
     Uses pygame.mixer to create simple synth sounds without external audio files.
     """
 
-    def __init__(self):
-        self.sounds_enabled = True
-        self.sample_rate = 22050
+    def __init__(self, audio_cache=None, enabled=True):
+        self.sounds_enabled = enabled
+        self.sample_rate = AUDIO_FREQUENCY
         self.sounds = {}
         self._music_tracks = {}
         self._music_channel = None
         self._current_track = None
         self._music_volume = 0.2
+        self._audio_cache = audio_cache
+        # Lazy music generation: tracks are synthesized on first request,
+        # by a background worker when threads are available
+        self._music_lock = threading.Lock()
+        self._music_wakeup = threading.Condition(self._music_lock)
+        self._music_queue = deque()
+        self._music_worker = None
+
+        if not enabled:
+            # Silent manager (headless simulation): every play_* call is a no-op
+            return
 
         try:
             # Check if mixer is initialized
             if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=1, buffer=512)
+                pygame.mixer.init(frequency=self.sample_rate, size=AUDIO_SIZE,
+                                  channels=AUDIO_CHANNELS, buffer=AUDIO_BUFFER,
+                                  allowedchanges=0)
+
+            if self._audio_cache is None:
+                from .audio_cache import AudioCache
+                self._audio_cache = AudioCache(pygame.mixer.get_init())
 
             # Reserve a channel for music
             pygame.mixer.set_num_channels(8)
             self._music_channel = pygame.mixer.Channel(7)  # Use last channel for music
 
-            # Generate all sounds
+            # Generate all sounds; music tracks are generated lazily
             self._generate_sounds()
-            # Generate all music tracks
-            self._generate_music()
+            self._start_music_worker()
         except Exception as e:
             print(f"Warning: Could not initialize sound system: {e}")
             self.sounds_enabled = False
 
+    def _cached_sound(self, name, build):
+        """Load sound *name* from the audio cache, or build and cache it.
+
+        Args:
+            name: Cache entry name (unique per sound/track)
+            build: Zero-argument callable returning a pygame.mixer.Sound
+
+        Returns:
+            pygame.mixer.Sound object (or None if the builder returned None)
+        """
+        cache = self._audio_cache
+        cached = cache.load(name) if cache is not None else None
+        if cached is not None:
+            volume, pcm = cached
+            sound = pygame.mixer.Sound(buffer=pcm)
+            sound.set_volume(volume)
+            return sound
+        sound = build()
+        if sound is not None and cache is not None:
+            cache.store(name, sound.get_raw(), sound.get_volume())
+        return sound
+
     def _generate_sounds(self):
         """Generate all game sounds and cache them."""
-        self.sounds['sword_swing'] = self._make_sword_swing()
-        self.sounds['enemy_hit'] = self._make_enemy_hit()
-        self.sounds['enemy_death'] = self._make_enemy_death()
-        self.sounds['player_hurt'] = self._make_player_hurt()
-        self.sounds['heart_pickup'] = self._make_heart_pickup()
-        self.sounds['key_pickup'] = self._make_key_pickup()
-        self.sounds['boss_roar'] = self._make_boss_roar()
-        self.sounds['boss_death'] = self._make_boss_death()
-        self.sounds['dungeon_enter'] = self._make_dungeon_enter()
-        self.sounds['chest_open'] = self._make_chest_open()
-        self.sounds['victory_fanfare'] = self._make_victory_fanfare()
-        self.sounds['gold_pickup'] = self._make_gold_pickup()
-        self.sounds['push_block'] = self._make_push_block()
-        self.sounds['switch_click'] = self._make_switch_click()
-        self.sounds['torch_ignite'] = self._make_torch_ignite()
-        self.sounds['door_open'] = self._make_door_open()
-        self.sounds['ability_spin'] = self._make_ability_spin()
-        self.sounds['ability_dash'] = self._make_ability_dash()
-        self.sounds['room_clear'] = self._make_room_clear()
-        self.sounds['door_lock'] = self._make_door_lock()
-        self.sounds['parry_clang'] = self._make_parry_clang()
-        self.sounds['dodge_whoosh'] = self._make_dodge_whoosh()
-        self.sounds['charge_hum'] = self._make_charge_hum()
-        self.sounds['combo_hit_1'] = self._make_combo_hit(1)
-        self.sounds['combo_hit_2'] = self._make_combo_hit(2)
-        self.sounds['combo_hit_3'] = self._make_combo_hit(3)
-        self.sounds['shield_block'] = self._make_shield_block()
-        self.sounds['ability_fire'] = self._make_ability_fire()
-        self.sounds['ability_shield'] = self._make_ability_shield()
-        self.sounds['ability_fail'] = self._make_ability_fail()
-        self.sounds['thunder'] = self._make_thunder()
-        self.sounds['rain_ambient'] = self._make_rain_ambient()
-        self.sounds['wind_howl'] = self._make_wind_howl()
-        self.sounds['fire_crackle'] = self._make_fire_crackle()
+        builders = {
+            'sword_swing': self._make_sword_swing,
+            'enemy_hit': self._make_enemy_hit,
+            'enemy_death': self._make_enemy_death,
+            'player_hurt': self._make_player_hurt,
+            'heart_pickup': self._make_heart_pickup,
+            'key_pickup': self._make_key_pickup,
+            'boss_roar': self._make_boss_roar,
+            'boss_death': self._make_boss_death,
+            'dungeon_enter': self._make_dungeon_enter,
+            'chest_open': self._make_chest_open,
+            'victory_fanfare': self._make_victory_fanfare,
+            'gold_pickup': self._make_gold_pickup,
+            'push_block': self._make_push_block,
+            'switch_click': self._make_switch_click,
+            'torch_ignite': self._make_torch_ignite,
+            'door_open': self._make_door_open,
+            'ability_spin': self._make_ability_spin,
+            'ability_dash': self._make_ability_dash,
+            'room_clear': self._make_room_clear,
+            'door_lock': self._make_door_lock,
+            'parry_clang': self._make_parry_clang,
+            'dodge_whoosh': self._make_dodge_whoosh,
+            'charge_hum': self._make_charge_hum,
+            'combo_hit_1': lambda: self._make_combo_hit(1),
+            'combo_hit_2': lambda: self._make_combo_hit(2),
+            'combo_hit_3': lambda: self._make_combo_hit(3),
+            'shield_block': self._make_shield_block,
+            'ability_fire': self._make_ability_fire,
+            'ability_shield': self._make_ability_shield,
+            'ability_fail': self._make_ability_fail,
+            'thunder': self._make_thunder,
+            'rain_ambient': self._make_rain_ambient,
+            'wind_howl': self._make_wind_howl,
+            'fire_crackle': self._make_fire_crackle,
+        }
+        for name, build in builders.items():
+            self.sounds[name] = self._cached_sound(name, build)
+
+    def _music_builders(self):
+        """Map each music track name to the method that synthesizes it."""
+        return {
+            'title': self._generate_title_music,
+            'overworld': self._generate_overworld_music,
+            'dungeon': self._generate_dungeon_music,
+            'forest': self._generate_forest_music,
+            'desert': self._generate_desert_music,
+            'volcano': self._generate_volcano_music,
+            'boss': self._generate_boss_music,
+        }
 
     def _generate_music(self):
-        """Generate all music tracks and cache them."""
-        self._music_tracks['title'] = self._generate_title_music()
-        self._music_tracks['overworld'] = self._generate_overworld_music()
-        self._music_tracks['dungeon'] = self._generate_dungeon_music()
-        self._music_tracks['forest'] = self._generate_forest_music()
-        self._music_tracks['desert'] = self._generate_desert_music()
-        self._music_tracks['volcano'] = self._generate_volcano_music()
-        self._music_tracks['boss'] = self._generate_boss_music()
+        """Generate all music tracks synchronously (used when baking the audio cache)."""
+        for name in self._music_builders():
+            self._build_music_track(name)
+
+    def _build_music_track(self, track_name):
+        """Synthesize (or load from cache) one music track and publish it.
+
+        If the track was requested by play_music while it was still being
+        generated, playback starts as soon as it is ready.
+        """
+        with self._music_lock:
+            if track_name in self._music_tracks:
+                return
+        build = self._music_builders().get(track_name)
+        sound = self._cached_sound(f"music_{track_name}", build) if build else None
+        with self._music_lock:
+            self._music_tracks[track_name] = sound
+            if self._current_track == track_name and self._music_channel and sound:
+                self._music_channel.play(sound, loops=-1)
+                self._music_channel.set_volume(self._music_volume)
+
+    def _start_music_worker(self):
+        """Start the background music generation thread if threads are available.
+
+        The web (WASM) build has no threads; music is then generated
+        synchronously on first play instead.
+        """
+        worker = threading.Thread(target=self._music_worker_loop,
+                                  name="music-generator", daemon=True)
+        try:
+            worker.start()
+        except RuntimeError:
+            return
+        self._music_worker = worker
+
+    def _music_worker_loop(self):
+        while True:
+            with self._music_wakeup:
+                while not self._music_queue:
+                    self._music_wakeup.wait()
+                track_name = self._music_queue.popleft()
+            try:
+                self._build_music_track(track_name)
+            except Exception as e:
+                print(f"Warning: Could not generate music track {track_name}: {e}")
+                with self._music_lock:
+                    self._music_tracks[track_name] = None
+
+    def _queue_music(self, track_name, urgent=False):
+        """Queue *track_name* for background generation (caller holds the lock)."""
+        if track_name in self._music_tracks or track_name not in self._music_builders():
+            return
+        if track_name in self._music_queue:
+            if not urgent:
+                return
+            self._music_queue.remove(track_name)
+        if urgent:
+            self._music_queue.appendleft(track_name)
+        else:
+            self._music_queue.append(track_name)
+        self._music_wakeup.notify()
+
+    def prefetch_music(self, track_names):
+        """
+        Generate music tracks in the background ahead of their first play.
+
+        Args:
+            track_names: Track names in order of likelihood of being played next
+        """
+        if not self.sounds_enabled or self._music_worker is None:
+            return
+        with self._music_lock:
+            for track_name in track_names:
+                self._queue_music(track_name)
+
+    def is_music_ready(self, track_name):
+        """Return True if *track_name* has been generated (or failed to generate)."""
+        with self._music_lock:
+            return track_name in self._music_tracks
 
     def _make_sound(self, duration, generator_func):
         """
@@ -130,6 +263,14 @@ class SoundManager:
         else:
             return sustain * (duration - t) / release
 
+    def _envelope_array(self, t, duration, attack=0.01, decay=0.05, sustain=0.7, release=0.1):
+        """Vectorized _envelope: evaluate the ADSR envelope over a NumPy time array."""
+        return np.select(
+            [t < attack, t < attack + decay, t < duration - release],
+            [t / attack, 1.0 - ((1.0 - sustain) * (t - attack) / decay), sustain],
+            sustain * (duration - t) / release,
+        )
+
     def _make_sword_swing(self):
         """Short whoosh sound - white noise burst with quick fade."""
         duration = 0.15
@@ -420,6 +561,8 @@ class SoundManager:
         Returns:
             array of samples
         """
+        if np is not None:
+            return self._make_note_np(frequency, duration, amplitude, warm, tone_type)
         num_samples = int(duration * self.sample_rate)
         samples = array.array('h', [0] * num_samples)
 
@@ -455,6 +598,38 @@ class SoundManager:
 
         return samples
 
+    def _make_note_np(self, frequency, duration, amplitude, warm, tone_type):
+        """NumPy backend for _make_note: computes the whole note at once."""
+        num_samples = int(duration * self.sample_rate)
+        t = np.arange(num_samples) / self.sample_rate
+        phase = 2 * math.pi * frequency * t
+
+        if tone_type == 'triangle':
+            base = 2 * np.abs(2 * (frequency * t % 1) - 1) - 1
+        elif tone_type == 'square':
+            base = np.where(np.sin(phase) >= 0, 0.6, -0.6)
+        else:
+            base = np.sin(phase)
+
+        if warm:
+            tone = (base + 0.15 * np.sin(phase * 2) + 0.08 * np.sin(phase * 1.5)
+                    + 0.05 * np.sin(phase * 1.25)) / 1.28
+            env = self._envelope_array(t, duration, attack=0.08, decay=0.15, sustain=0.6,
+                                       release=max(0.2, duration * 0.3))
+        else:
+            tone = (base + 0.3 * np.sin(phase * 2) + 0.1 * np.sin(phase * 1.5)) / 1.4
+            env = self._envelope_array(t, duration, attack=0.02, decay=0.05, sustain=0.8, release=0.1)
+
+        values = np.clip(tone * env * amplitude, -1.0, 1.0)
+        return self._to_samples(values * 32767)
+
+    @staticmethod
+    def _to_samples(values):
+        """Truncate a float NumPy array to a 16-bit array.array like int() does."""
+        samples = array.array('h')
+        samples.frombytes(values.astype(np.int16).tobytes())
+        return samples
+
     def _make_rest(self, duration):
         """Generate silence for a rest."""
         num_samples = int(duration * self.sample_rate)
@@ -464,6 +639,8 @@ class SoundManager:
         """Mix multiple sample arrays together by summing and normalizing."""
         if not layers:
             return array.array('h')
+        if np is not None:
+            return self._mix_layers_np(layers)
         max_len = max(len(layer) for layer in layers)
         mixed = array.array('h', [0] * max_len)
         n = len(layers)
@@ -477,6 +654,15 @@ class SoundManager:
             mixed[i] = total
         return mixed
 
+    def _mix_layers_np(self, layers):
+        """NumPy backend for _mix_layers: sum padded layers, average and clip."""
+        max_len = max(len(layer) for layer in layers)
+        total = np.zeros(max_len, dtype=np.int64)
+        for layer in layers:
+            if len(layer):
+                total[:len(layer)] += np.frombuffer(layer, dtype=np.int16)
+        return self._to_samples(np.clip(np.trunc(total / len(layers)), -32767, 32767))
+
     def _scale_tempo(self, notes, factor, rest_extra=1.0):
         """Scale all note/rest durations by factor. rest_extra applies additional scaling to rests."""
         return [(freq, dur * factor * (rest_extra if freq == 0 else 1.0)) for freq, dur in notes]
@@ -1782,28 +1968,50 @@ class SoundManager:
         if self.sounds_enabled and 'door_lock' in self.sounds:
             self.sounds['door_lock'].play()
 
+    def play_thunder(self):
+        """Play thunder crack sound."""
+        if self.sounds_enabled and 'thunder' in self.sounds:
+            self.sounds['thunder'].play()
+
     # Music playback methods
 
     def play_music(self, track_name):
         """
         Play a music track on loop.
 
+        Tracks are generated on first use. While a track is still being
+        generated in the background, silence plays and the track starts as
+        soon as it is ready.
+
         Args:
             track_name: Name of the track ('title', 'overworld', 'dungeon', 'forest', 'desert', 'volcano')
         """
         if not self.sounds_enabled:
             return
 
-        # Don't restart if already playing this track
-        if self._current_track == track_name and self._music_channel and self._music_channel.get_busy():
-            return
-
-        # Stop current music
-        if self._music_channel:
-            self._music_channel.stop()
-
-        # Play new track
-        if track_name in self._music_tracks:
+        if (self._music_worker is None and track_name not in self._music_tracks
+                and track_name in self._music_builders()):
+            # No background worker (e.g. web build): generate synchronously
+            self._build_music_track(track_name)
+
+        with self._music_lock:
+            # Don't restart if already playing (or waiting for) this track
+            if self._current_track == track_name and self._music_channel and (
+                    self._music_channel.get_busy() or track_name not in self._music_tracks):
+                return
+
+            # Stop current music
+            if self._music_channel:
+                self._music_channel.stop()
+
+            if track_name not in self._music_tracks:
+                # Not generated yet: keep silent until the worker publishes it
+                if track_name in self._music_builders():
+                    self._current_track = track_name
+                    self._queue_music(track_name, urgent=True)
+                return
+
+            # Play new track
             self._current_track = track_name
             sound = self._music_tracks[track_name]
             if sound:
@@ -1813,8 +2021,9 @@ class SoundManager:
     def stop_music(self):
         """Stop the current music with a short fade."""
         if self.sounds_enabled and self._music_channel:
-            self._music_channel.fadeout(500)  # 500ms fade
-            self._current_track = None
+            with self._music_lock:
+                self._music_channel.fadeout(500)  # 500ms fade
+                self._current_track = None
 
     def set_music_volume(self, volume):
         """
@@ -1860,3 +2069,10 @@ def get_sound_manager():
     if _sound_manager is None:
         _sound_manager = SoundManager()
     return _sound_manager
+
+
+def init_sound_manager(**kwargs):
+    """Create (or replace) the global SoundManager with the given options."""
+    global _sound_manager
+    _sound_manager = SoundManager(**kwargs)
+    return _sound_manager
@@ -0,0 +1,127 @@
+"""Uniform-grid spatial index for entity collision queries."""
+
+from .settings import TILE_SIZE
+
+
+class SpatialHash:
+    """Buckets entities into TILE_SIZE grid cells for fast overlap queries.
+
+    Works with any Entity (x, y, width, height, alive and rect).
+
+    Entities are registered with sync(), which is meant to be called once
+    per frame (or before a batch of queries) with the current entity list:
+    new entities are inserted, entities whose covered cells changed are
+    re-bucketed, and dead or removed entities are dropped. Unmoved entities
+    cost one cell-range comparison.
+
+    Query results are returned in the order of the list last passed to
+    sync(), so code that replaces a linear scan keeps the same hit order.
+    Results are tested against the entities' live rects.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}     # (cx, cy) -> {id(entity): entity}
+        self._entries = {}   # id(entity) -> [entity, cell_range, order]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+
+    def _cell_range(self, x, y, w, h):
+        cs = self.cell_size
+        return (x // cs, y // cs, (x + max(w, 1) - 1) // cs, (y + max(h, 1) - 1) // cs)
+
+    def _entity_range(self, entity):
+        return self._cell_range(int(entity.x), int(entity.y), entity.width, entity.height)
+
+    def _add_cells(self, key, entity, cell_range):
+        cells = self._cells
+        c0, r0, c1, r1 = cell_range
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {key: entity}
+                else:
+                    bucket[key] = entity
+
+    def _remove_cells(self, key, cell_range):
+        cells = self._cells
+        c0, r0, c1, r1 = cell_range
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(key, None)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def sync(self, entities):
+        """Bring the index in line with *entities* (only alive ones are kept)."""
+        entries = self._entries
+        seen = set()
+        for order, entity in enumerate(entities):
+            if not entity.alive:
+                continue
+            key = id(entity)
+            seen.add(key)
+            cell_range = self._entity_range(entity)
+            entry = entries.get(key)
+            if entry is not None and entry[0] is not entity:
+                # id() reused by a new object after the old one was freed
+                self._remove_cells(key, entry[1])
+                entry = None
+            if entry is None:
+                entries[key] = [entity, cell_range, order]
+                self._add_cells(key, entity, cell_range)
+            else:
+                entry[2] = order
+                if entry[1] != cell_range:
+                    self._remove_cells(key, entry[1])
+                    self._add_cells(key, entity, cell_range)
+                    entry[1] = cell_range
+        if len(seen) != len(entries):
+            for key in [k for k in entries if k not in seen]:
+                self._remove_cells(key, entries.pop(key)[1])
+
+    def _candidates(self, x0, y0, x1, y1):
+        """Collect entities from cells covering the pixel box [x0, x1) x [y0, y1)."""
+        cells = self._cells
+        found = {}
+        c0, r0, c1, r1 = self._cell_range(int(x0), int(y0), int(x1 - x0), int(y1 - y0))
+        for cy in range(r0, r1 + 1):
+            for cx in range(c0, c1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def _sorted(self, found):
+        entries = self._entries
+        return sorted(found.values(), key=lambda e: entries[id(e)][2])
+
+    def query_rect(self, rect):
+        """Return alive entities whose rect overlaps *rect*, in sync order."""
+        found = self._candidates(rect.left, rect.top, rect.right, rect.bottom)
+        hits = {k: e for k, e in found.items() if e.alive and rect.colliderect(e.rect)}
+        return self._sorted(hits)
+
+    def query_radius(self, x, y, radius):
+        """Return alive entities whose rect intersects the circle at (x, y), in sync order."""
+        found = self._candidates(x - radius, y - radius, x + radius + 1, y + radius + 1)
+        r2 = radius * radius
+        hits = {}
+        for key, entity in found.items():
+            if not entity.alive:
+                continue
+            r = entity.rect
+            # Distance from the circle center to the closest point of the rect
+            dx = x - max(r.left, min(x, r.right))
+            dy = y - max(r.top, min(y, r.bottom))
+            if dx * dx + dy * dy <= r2:
+                hits[key] = entity
+        return self._sorted(hits)
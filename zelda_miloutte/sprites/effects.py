@@ -3,18 +3,22 @@
 import pygame
 
 
+# Alpha step used to quantize pulsing overlay tints so they can be cached
+OVERLAY_ALPHA_STEP = 8
+
+# Shared sprite variants: (surface, variant, arg) -> variant surface
+_variant_cache = {}
+# Shared frame-set variants: (id(frames), variant, arg) -> (frames, variant frames)
+_frames_variant_cache = {}
+
+
 def flash_white(surface):
     """Return a copy of *surface* with all opaque pixels set to white."""
     white = surface.copy()
     white.fill((255, 255, 255, 0), special_flags=pygame.BLEND_RGBA_MAX)
-    # Now set RGB to white while preserving alpha
+    # Keep white (with original alpha) where the mask is set, clear elsewhere
     mask = pygame.mask.from_surface(surface)
-    white_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    for x in range(surface.get_width()):
-        for y in range(surface.get_height()):
-            if mask.get_at((x, y)):
-                white_surf.set_at((x, y), (255, 255, 255, surface.get_at((x, y))[3]))
-    return white_surf
+    return mask.to_surface(setsurface=white, unsetcolor=(0, 0, 0, 0))
 
 
 def tint_surface(surface, tint_color):
@@ -26,6 +30,69 @@ def tint_surface(surface, tint_color):
     return tinted
 
 
+def overlay_surface(surface, color):
+    """Return a copy of *surface* with an RGBA *color* alpha-blended on top."""
+    tinted = surface.copy()
+    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    overlay.fill(color)
+    tinted.blit(overlay, (0, 0))
+    return tinted
+
+
+_VARIANT_BUILDERS = {
+    "white": lambda surface, arg: flash_white(surface),
+    "tint": tint_surface,
+    "overlay": overlay_surface,
+}
+
+
+def get_variant(surface, variant, arg=None):
+    """Return a cached *variant* of *surface*, building it on first use.
+
+    Variants: "white" (damage flash), "tint" (multiply by RGB *arg*) and
+    "overlay" (alpha-blend RGBA *arg* on top).
+    """
+    key = (surface, variant, arg)
+    result = _variant_cache.get(key)
+    if result is None:
+        result = _VARIANT_BUILDERS[variant](surface, arg)
+        _variant_cache[key] = result
+    return result
+
+
+def get_frame_variants(frames, variant, arg=None):
+    """Return a {direction: [surfaces]} dict of *variant* frames for *frames*.
+
+    The result is shared by every caller passing the same frames dict, so
+    only the first enemy of a kind pays for building it.
+    """
+    key = (id(frames), variant, arg)
+    entry = _frames_variant_cache.get(key)
+    if entry is not None and entry[0] is frames:
+        return entry[1]
+    result = {
+        d: [get_variant(f, variant, arg) for f in frame_list]
+        for d, frame_list in frames.items()
+    }
+    _frames_variant_cache[key] = (frames, result)
+    return result
+
+
+def get_white_frames(frames):
+    """Return the shared white-flash frames for an animation frames dict."""
+    return get_frame_variants(frames, "white")
+
+
+def get_overlay_frame(surface, color, alpha):
+    """Return *surface* with a pulsing RGB *color* overlay at *alpha*.
+
+    The alpha is quantized to OVERLAY_ALPHA_STEP so a pulse reuses a small
+    set of cached surfaces instead of allocating new ones every frame.
+    """
+    alpha = max(0, min(255, int(alpha) // OVERLAY_ALPHA_STEP * OVERLAY_ALPHA_STEP))
+    return get_variant(surface, "overlay", (*color[:3], alpha))
+
+
 def scale_shrink(surface, progress):
     """Return *surface* scaled down by *progress* (0.0=full, 1.0=gone).
 
@@ -4,6 +4,7 @@ import random
 import pygame
 
 from .state import State
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, GOLD
 from ..sounds import get_sound_manager
 
@@ -420,11 +421,7 @@ class CinematicState(State):
             fade_alpha = int(255 * (1.0 - remaining / self._fade_duration))
 
         if fade_alpha > 0:
-            fade_alpha = max(0, min(255, fade_alpha))
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.fill(BLACK)
-            overlay.set_alpha(fade_alpha)
-            surface.blit(overlay, (0, 0))
+            overlays.draw_fill(surface, BLACK, fade_alpha)
 
         # Skip hint
         self._draw_skip_hint(surface)
@@ -4,6 +4,7 @@ import math
 import random
 import pygame
 from .state import State
+from .. import overlays
 from ..raycaster import Raycaster, FOV
 from ..settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, GOLD, BLACK,
@@ -644,16 +645,12 @@ class Dungeon3DState(State):
 
         # Damage flash overlay
         if self.damage_flash > 0:
-            flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            alpha = int(self.damage_flash * 120)
-            flash_surf.fill((200, 0, 0, alpha))
-            surface.blit(flash_surf, (0, 0))
+            overlays.draw_fill(surface, (200, 0, 0), self.damage_flash * 120)
 
         # Invincibility blink indicator
         if self.invincible and int(self.blink_timer * 10) % 2 == 0:
-            indicator = pygame.Surface((SCREEN_WIDTH, 4), pygame.SRCALPHA)
-            indicator.fill((255, 255, 255, 80))
-            surface.blit(indicator, (0, SCREEN_HEIGHT // 2 - 2))
+            overlays.draw_fill(surface, (255, 255, 255), 80,
+                               (0, SCREEN_HEIGHT // 2 - 2, SCREEN_WIDTH, 4))
 
         # HUD
         self._draw_hud(surface)
@@ -693,10 +690,7 @@ class Dungeon3DState(State):
         color = (200, 200, 220)
         pygame.draw.line(surface, color, (cx, cy), (end_x, end_y), 4)
         # Sword glow
-        glow_color = (255, 255, 180, int(100 * (1 - t)))
-        glow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.line(glow_surf, glow_color, (cx, cy), (end_x, end_y), 8)
-        surface.blit(glow_surf, (0, 0))
+        overlays.draw_line(surface, (255, 255, 180), 100 * (1 - t), (cx, cy), (end_x, end_y), 8)
 
         # Handle
         handle_end_x = cx + int(math.cos(rad) * (-20))
@@ -706,9 +700,7 @@ class Dungeon3DState(State):
     def _draw_hud(self, surface):
         """Draw hearts, keys, and controls info."""
         # Background bar
-        hud_bg = pygame.Surface((SCREEN_WIDTH, 40), pygame.SRCALPHA)
-        hud_bg.fill((0, 0, 0, 160))
-        surface.blit(hud_bg, (0, 0))
+        overlays.draw_fill(surface, (0, 0, 0), 160, (0, 0, SCREEN_WIDTH, 40))
 
         # Hearts
         x = 8
@@ -792,10 +784,7 @@ class Dungeon3DState(State):
 
     def _draw_victory(self, surface):
         """Draw victory overlay."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        alpha = min(180, int(self.victory_timer / 3.0 * 180))
-        overlay.fill((0, 0, 0, alpha))
-        surface.blit(overlay, (0, 0))
+        overlays.draw_fill(surface, (0, 0, 0), min(180, int(self.victory_timer / 3.0 * 180)))
 
         text = self.large_font.render("Victory!", True, GOLD)
         surface.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2 - 30))
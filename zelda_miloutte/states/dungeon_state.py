@@ -1,5 +1,6 @@
 import pygame
-from .gameplay_state import GameplayState
+from .gameplay_state import GameplayState, count_on_screen
+from .. import overlays, text_cache
 from ..entities.player import Player
 from ..entities.enemy import Enemy
 from ..entities.boss import Boss
@@ -14,6 +15,7 @@ from ..settings import (
 )
 from ..particles import ParticleSystem
 from ..sounds import get_sound_manager
+from ..profiler import profiler
 
 
 class DungeonState(GameplayState):
@@ -198,7 +200,6 @@ class DungeonState(GameplayState):
         self.victory = False
         self.victory_timer = 0.0
         self.victory_duration = 3.0
-        self.victory_font = None
 
         self.particles = ParticleSystem()
         self.projectiles = []
@@ -655,65 +656,68 @@ class DungeonState(GameplayState):
 
     def draw(self, surface):
         # Draw tilemap, chests, items, enemies, player, particles
-        self.tilemap.draw(surface, self.camera)
-
-        # Draw puzzles (before enemies so they appear under entities)
-        self._draw_puzzles(surface)
-
-        for chest in self.chests:
-            chest.draw(surface, self.camera)
-        for item in self.items:
-            item.draw(surface, self.camera)
-        for enemy in self.enemies:
-            enemy.draw(surface, self.camera)
-
-        # Draw boss (DungeonState-specific)
-        if self.boss.alive or self.boss.dying:
-            self.boss.draw(surface, self.camera)
-
-        # Draw meteor warnings (Inferno Drake)
-        if hasattr(self.boss, 'pending_meteors'):
-            for meteor in self.boss.pending_meteors:
-                if not meteor['exploded']:
-                    screen_x = int(meteor['x'] - self.camera.x)
-                    screen_y = int(meteor['y'] - self.camera.y)
-                    # Warning circle (orange)
-                    radius = 30
-                    if meteor['timer'] > 0:
-                        # Pulsing warning
-                        pulse = int(abs(meteor['timer'] * 10 % 1.0 - 0.5) * 100) + 150
-                        color = (255, pulse, 0, 180)
-                        temp_surf = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
-                        pygame.draw.circle(temp_surf, color, (radius + 5, radius + 5), radius, 3)
-                        surface.blit(temp_surf, (screen_x - radius - 5, screen_y - radius - 5))
-
-        # Draw player and particles
-        self.player.draw(surface, self.camera)
-        self.particles.draw(surface, self.camera)
+        with profiler.scope("draw.tilemap"):
+            self.tilemap.draw(surface, self.camera)
+
+        with profiler.scope("draw.entities"):
+            # Draw puzzles (before enemies so they appear under entities)
+            self._draw_puzzles(surface)
+
+            for chest in self.chests:
+                chest.draw(surface, self.camera)
+            for item in self.items:
+                item.draw(surface, self.camera)
+            for enemy in self.enemies:
+                enemy.draw(surface, self.camera)
+
+            # Draw boss (DungeonState-specific)
+            if self.boss.alive or self.boss.dying:
+                self.boss.draw(surface, self.camera)
+
+            # Draw meteor warnings (Inferno Drake)
+            if hasattr(self.boss, 'pending_meteors'):
+                for meteor in self.boss.pending_meteors:
+                    if not meteor['exploded']:
+                        screen_x = int(meteor['x'] - self.camera.x)
+                        screen_y = int(meteor['y'] - self.camera.y)
+                        # Warning circle (orange)
+                        radius = 30
+                        if meteor['timer'] > 0:
+                            # Pulsing warning
+                            pulse = int(abs(meteor['timer'] * 10 % 1.0 - 0.5) * 100) + 150
+                            color = (255, pulse, 0, 180)
+                            temp_surf = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
+                            pygame.draw.circle(temp_surf, color, (radius + 5, radius + 5), radius, 3)
+                            surface.blit(temp_surf, (screen_x - radius - 5, screen_y - radius - 5))
+
+            # Draw player
+            self.player.draw(surface, self.camera)
+            if profiler.enabled:
+                profiler.count("entities_drawn", count_on_screen(
+                    self.camera, self.chests, self.items, self.enemies,
+                    (self.boss, self.player) if self.boss.alive or self.boss.dying else (self.player,)))
+        with profiler.scope("draw.particles"):
+            self.particles.draw(surface, self.camera)
         # Floating texts
         for ft in self.floating_texts:
             ft.draw(surface, self.camera)
 
         # Draw HUD with boss health bar (DungeonState-specific)
-        self.hud.draw(surface, self.player, self.boss if self.boss.alive else None)
+        with profiler.scope("draw.hud"):
+            self.hud.draw(surface, self.player, self.boss if self.boss.alive else None)
 
         # Draw minimap
         self._draw_minimap(surface)
 
         # Victory overlay (DungeonState-specific)
         if self.victory:
-            if self.victory_font is None:
-                self.victory_font = pygame.font.Font(None, 48)
             # Dark overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
             alpha = min(180, int(self.victory_timer / self.victory_duration * 180))
-            overlay.fill((0, 0, 0, alpha))
-            surface.blit(overlay, (0, 0))
+            overlays.draw_fill(surface, (0, 0, 0), alpha)
             # Victory text
-            text = self.victory_font.render("Victory!", True, GOLD)
+            text = text_cache.render("Victory!", 48, GOLD)
             tx = (SCREEN_WIDTH - text.get_width()) // 2
             ty = SCREEN_HEIGHT // 2 - 20
             surface.blit(text, (tx, ty))
-            sub_font = pygame.font.Font(None, 28)
-            sub = sub_font.render(self.victory_text, True, WHITE)
+            sub = text_cache.render(self.victory_text, 28, WHITE)
             surface.blit(sub, ((SCREEN_WIDTH - sub.get_width()) // 2, ty + 50))
@@ -9,6 +9,7 @@ import math
 import pygame
 
 from .state import State
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GOLD
 from ..data.fish import pick_random_fish
 from ..sprites.fish_sprites import get_fish_sprite
@@ -396,9 +397,7 @@ class FishingState(State):
             self.game.states[-2].draw(surface)
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 40, 120))
-        surface.blit(overlay, (0, 0))
+        overlays.draw_fill(surface, (0, 0, 40), 120)
 
         # Draw phase-specific UI
         if self.phase == PHASE_CAST:
@@ -483,9 +482,7 @@ class FishingState(State):
         """Draw bite indicator with ! alert."""
         # Flash effect
         flash_alpha = int(abs(math.sin(self.bite_timer * 8)) * 60)
-        flash = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        flash.fill((255, 255, 100, flash_alpha))
-        surface.blit(flash, (0, 0))
+        overlays.draw_fill(surface, (255, 255, 100), flash_alpha)
 
         # Big ! indicator
         alert = self.title_font.render("!", True, (255, 50, 50))
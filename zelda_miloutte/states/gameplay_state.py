@@ -1,12 +1,22 @@
 import random
 import pygame
 from .state import State
+from .. import overlays, text_cache
 from ..settings import RED, SCREEN_WIDTH, SCREEN_HEIGHT, COMBO_HIT3_KNOCKBACK_MULT, PARRY_STUN_DURATION
 from ..entities.item import Item
 from ..entities.gold import Gold
 from ..world.tile import TileType
 from ..ui.textbox import TextBox
 from ..ui.shop_ui import ShopUI
+from ..spatial_hash import SpatialHash
+from ..profiler import profiler, profiled
+from ..lighting import CAMPFIRE_LIGHT, TORCH_LIGHT
+
+
+def count_on_screen(camera, *groups):
+    """Number of entities in *groups* whose rect overlaps the camera's view."""
+    view = pygame.Rect(int(camera.x), int(camera.y), SCREEN_WIDTH, SCREEN_HEIGHT)
+    return sum(1 for group in groups for entity in group if view.colliderect(entity.rect))
 
 
 class GameplayState(State):
@@ -38,6 +48,11 @@ class GameplayState(State):
         self.campfires = []
         self.gold_pickups = []
 
+        # Spatial indexes for collision queries, synced from the entity lists
+        self._enemy_grid = SpatialHash()
+        self._item_grid = SpatialHash()
+        self._gold_grid = SpatialHash()
+
         # Hit stop (freeze-frame on impactful hits)
         self.hitstop_timer = 0.0
         self.shop_ui = ShopUI()
@@ -55,6 +70,9 @@ class GameplayState(State):
         self.crystal_switches = []
         self.torches = []
 
+        # Weather (set by subclasses for outdoor areas)
+        self.weather = None
+
         # Minimap (shared across gameplay states)
         from ..ui.minimap import Minimap
         self.minimap = Minimap()
@@ -63,6 +81,7 @@ class GameplayState(State):
         from ..ui.dialogue_box import DialogueBox
         self.dialogue_box = DialogueBox()
 
+    @profiled("update.movement")
     def _update_movement(self, dt):
         """Handle player input and movement with tile collision."""
         player = self.player
@@ -70,6 +89,8 @@ class GameplayState(State):
 
         # Pass companion to player for speed bonus calculation
         player.apply_input(input_h, self.companion)
+        if self.weather is not None:
+            player.vx, player.vy = self.weather.get_movement_modifier(player.vx, player.vy)
 
         # Move with tile collision (axis-separated)
         player.move_x(dt)
@@ -101,8 +122,10 @@ class GameplayState(State):
         if input_h.use_ability and player.active_ability is not None:
             player.active_ability.use(player, self.enemies, self.projectiles, self.particles, self.camera)
 
+    @profiled("update.enemies")
     def _update_enemies(self, dt):
         """Update all enemies and collect projectiles from archers, vine snappers, and magma golems. Collect fire trails from fire imps."""
+        profiler.count("enemies", len(self.enemies))
         from ..entities.archer import Archer
         from ..entities.vine_snapper import VineSnapper
         from ..entities.shadow_stalker import ShadowStalker
@@ -175,6 +198,7 @@ class GameplayState(State):
             return True
         return False
 
+    @profiled("update.combat")
     def _update_combat(self, dt):
         """Handle sword vs enemies collision with particles, knockback, and camera shake."""
         player = self.player
@@ -183,13 +207,15 @@ class GameplayState(State):
         # Critical hit system: 10% chance for 2x damage
         is_crit = random.random() < 0.10
 
+        self._enemy_grid.sync(self.enemies)
+
         if player.attacking and player.sword_rect:
             # Combo knockback: stronger on 3rd hit
             knockback_strength = 200
             if player.combo_count == 2:
                 knockback_strength = int(200 * COMBO_HIT3_KNOCKBACK_MULT)
-            for enemy in self.enemies:
-                if enemy.alive and player.sword_rect.colliderect(enemy.rect):
+            for enemy in self._enemy_grid.query_rect(player.sword_rect):
+                if enemy.alive:
                     actual_damage = damage
                     hit_crit = is_crit
                     if hit_crit:
@@ -228,7 +254,7 @@ class GameplayState(State):
         # Charged spin attack AoE vs enemies (hit each enemy only once per spin)
         if player.charge_attacking and player.charge_attack_rect:
             charge_dmg = player.charge_attack_damage
-            for enemy in self.enemies:
+            for enemy in self._enemy_grid.query_rect(player.charge_attack_rect):
                 if enemy.alive and id(enemy) not in player.charge_hit_enemies:
                     if player.charge_attack_rect.colliderect(enemy.rect):
                         enemy.take_damage(charge_dmg)
@@ -334,9 +360,9 @@ class GameplayState(State):
         # Store puzzle door configuration for later use
         self._puzzle_doors = spawn_dict.get("puzzle_doors", {})
 
-        # Store original map data for barrier restoration when crystal switches toggle
-        import copy
-        self._original_map_data = copy.deepcopy(self.tilemap.data)
+        # Index barrier positions once so crystal switch toggles only touch barriers
+        self._barrier_index = self.tilemap.find_tiles(
+            (TileType.BARRIER_RED, TileType.BARRIER_BLUE))
 
     def _check_push_block_interaction(self):
         """Check if player is pushing into a push block."""
@@ -367,29 +393,18 @@ class GameplayState(State):
         from ..sounds import get_sound_manager
         from ..world.tile import TileType
         get_sound_manager().play_door_open()
-        orig = getattr(self, '_original_map_data', None)
-        for ri in range(self.tilemap.rows):
-            for ci in range(self.tilemap.cols):
-                t = self.tilemap.tiles[ri][ci]
-                if t == TileType.BARRIER_RED and switch.state:
-                    self.tilemap.tiles[ri][ci] = TileType.FLOOR
-                    self.tilemap.data[ri][ci] = TileType.FLOOR.value
-                elif t == TileType.BARRIER_BLUE and not switch.state:
-                    self.tilemap.tiles[ri][ci] = TileType.FLOOR
-                    self.tilemap.data[ri][ci] = TileType.FLOOR.value
-                elif t == TileType.FLOOR and orig:
-                    ov = orig[ri][ci]
-                    if ov == TileType.BARRIER_RED.value and not switch.state:
-                        self.tilemap.tiles[ri][ci] = TileType.BARRIER_RED
-                        self.tilemap.data[ri][ci] = TileType.BARRIER_RED.value
-                    elif ov == TileType.BARRIER_BLUE.value and switch.state:
-                        self.tilemap.tiles[ri][ci] = TileType.BARRIER_BLUE
-                        self.tilemap.data[ri][ci] = TileType.BARRIER_BLUE.value
-        from ..sprites.tile_sprites import get_tile_surface_variant
-        for ri in range(self.tilemap.rows):
-            for ci in range(self.tilemap.cols):
-                self.tilemap._tile_surface_grid[ri][ci] = get_tile_surface_variant(
-                    self.tilemap.data[ri][ci], ci, ri)
+        barriers = getattr(self, '_barrier_index', {})
+        # Red barriers drop while the switch is on, blue barriers while it is off
+        red_tile = TileType.FLOOR if switch.state else TileType.BARRIER_RED
+        blue_tile = TileType.BARRIER_BLUE if switch.state else TileType.FLOOR
+        tiles = self.tilemap.tiles
+        changes = []
+        for barrier, target in ((TileType.BARRIER_RED, red_tile),
+                                (TileType.BARRIER_BLUE, blue_tile)):
+            for col, row in barriers.get(barrier, ()):
+                if tiles[row][col] in (barrier, TileType.FLOOR):
+                    changes.append((col, row, target))
+        self.tilemap.set_tiles(changes)
 
     def _on_pressure_plate_activated(self, plate):
         """Check if all linked plates pressed and trigger target."""
@@ -413,16 +428,12 @@ class GameplayState(State):
     def _trigger_puzzle_target(self, target_id):
         """Trigger puzzle target by ID - converts tagged tiles to floor."""
         from ..sounds import get_sound_manager
-        from ..sprites.tile_sprites import get_tile_surface_variant
         from ..world.tile import TileType
         get_sound_manager().play_door_open()
         doors = getattr(self, '_puzzle_doors', {})
         if target_id in doors:
-            for (col, row) in doors[target_id]:
-                self.tilemap.tiles[row][col] = TileType.FLOOR
-                self.tilemap.data[row][col] = TileType.FLOOR.value
-                self.tilemap._tile_surface_grid[row][col] = get_tile_surface_variant(
-                    TileType.FLOOR.value, col, row)
+            self.tilemap.set_tiles(
+                [(col, row, TileType.FLOOR) for (col, row) in doors[target_id]])
             self.camera.shake(3, 0.3)
 
     def _draw_puzzles(self, surface):
@@ -439,7 +450,8 @@ class GameplayState(State):
     def _update_enemy_collision(self):
         """Handle enemy vs player damage with particles, knockback, and camera shake."""
         player = self.player
-        for enemy in self.enemies:
+        self._enemy_grid.sync(self.enemies)
+        for enemy in self._enemy_grid.query_rect(player.rect):
             if enemy.alive and player.collides_with(enemy):
                 # Check for parry: player is attacking and within parry window
                 if player.parry_window_timer > 0 and not player.parried_successfully:
@@ -491,7 +503,10 @@ class GameplayState(State):
     def _separate_player_from_enemies(self):
         """Push player out of any overlapping enemy rects."""
         player = self.player
-        for enemy in self.enemies:
+        # Each push moves the player by less than its own size, so enemies it
+        # can be pushed into lie within this inflated search box
+        search = player.rect.inflate(player.width * 4, player.height * 4)
+        for enemy in self._enemy_grid.query_rect(search):
             if not enemy.alive:
                 continue
             prect = player.rect
@@ -518,6 +533,7 @@ class GameplayState(State):
                 else:
                     player.y += overlap_y
 
+    @profiled("update.items")
     def _update_items(self, dt):
         """Update items and gold pickups, handle player pickup."""
         player = self.player
@@ -525,14 +541,16 @@ class GameplayState(State):
             item.update(dt)
 
         # Player vs items
-        for item in self.items:
+        self._item_grid.sync(self.items)
+        for item in self._item_grid.query_rect(player.rect):
             if item.alive and player.collides_with(item):
                 item.pickup(player)
 
         # Gold pickups
         for gold in self.gold_pickups:
             gold.update(dt)
-        for gold in self.gold_pickups:
+        self._gold_grid.sync(self.gold_pickups)
+        for gold in self._gold_grid.query_rect(player.rect):
             if gold.alive and player.collides_with(gold):
                 from ..ui.floating_text import FloatingText
                 amount = gold.amount
@@ -543,12 +561,15 @@ class GameplayState(State):
                 ))
         self.gold_pickups = [g for g in self.gold_pickups if g.alive]
 
+    @profiled("update.projectiles")
     def _update_projectiles(self, dt):
         """Update projectiles and handle collisions."""
+        profiler.count("projectiles", len(self.projectiles))
         player = self.player
         for projectile in self.projectiles:
             projectile.update(dt, self.tilemap)
 
+        self._enemy_grid.sync(self.enemies)
         for projectile in self.projectiles:
             if not projectile.alive:
                 continue
@@ -564,8 +585,8 @@ class GameplayState(State):
 
             # Deflected projectile vs enemies
             if projectile.deflected and projectile.owner == "player":
-                for enemy in self.enemies:
-                    if enemy.alive and projectile.rect.colliderect(enemy.rect):
+                for enemy in self._enemy_grid.query_rect(projectile.rect):
+                    if enemy.alive:
                         enemy.take_damage(projectile.damage * 2)  # bonus damage on deflect
                         enemy.apply_knockback(
                             projectile.center_x - projectile.vx * 0.1,
@@ -734,9 +755,11 @@ class GameplayState(State):
         self.camera.follow(self.player)
         self.camera.update_shake(dt)
 
+    @profiled("update.particles")
     def _update_particles(self, dt):
         """Update particle system."""
         self.particles.update(dt)
+        profiler.count("particles", self.particles.count)
 
     def _check_npc_interaction(self):
         """Check if player is interacting with an NPC."""
@@ -873,6 +896,7 @@ class GameplayState(State):
         if self.game.input.toggle_minimap:
             self.minimap.toggle()
 
+    @profiled("draw.minimap")
     def _draw_minimap(self, surface):
         """Draw the minimap overlay."""
         area_id = getattr(self, 'area_id', 'dungeon')
@@ -950,13 +974,31 @@ class GameplayState(State):
                 if npc._original_dialogue_state:
                     npc.dialogue_state = npc._original_dialogue_state
 
+    @profiled("draw.day_night")
     def _draw_day_night_overlay(self, surface):
         """Draw the day/night cycle overlay after all game entities but before HUD."""
         time_sys = self.game.time_system
         player_screen_x = self.player.center_x - self.camera.x
         player_screen_y = self.player.center_y - self.camera.y
         has_lantern = getattr(self.player, 'has_lantern', False)
-        time_sys.draw_overlay(surface, player_screen_x, player_screen_y, has_lantern)
+        lights = self._night_lights() if time_sys.is_night else ()
+        time_sys.draw_overlay(surface, player_screen_x, player_screen_y, has_lantern, lights)
+
+    def _night_lights(self):
+        """Screen-space (x, y, radius, glow color) of the lights besides the player."""
+        cam_x, cam_y = self.camera.x, self.camera.y
+        lights = []
+        for campfire in self.campfires:
+            if campfire.alive:
+                lights.append((campfire.center_x - cam_x, campfire.center_y - cam_y,
+                               *CAMPFIRE_LIGHT))
+        for torch in self.torches:
+            if torch.lit:
+                lights.append((torch.center_x - cam_x, torch.center_y - cam_y, *TORCH_LIGHT))
+        for proj in self.projectiles:
+            if proj.alive and proj.light is not None:
+                lights.append((proj.center_x - cam_x, proj.center_y - cam_y, *proj.light))
+        return lights
 
     def _draw_time_hud(self, surface):
         """Draw the time-of-day HUD element (sun/moon icon + clock)."""
@@ -976,8 +1018,7 @@ class GameplayState(State):
         icon_x = SCREEN_WIDTH - icon.get_width() - 8
         icon_y = 8
         surface.blit(icon, (icon_x, icon_y))
-        font = pygame.font.Font(None, 18)
-        time_text = font.render(time_sys.time_string, True, (200, 200, 200))
+        time_text = text_cache.render(time_sys.time_string, 18, (200, 200, 200))
         tx = SCREEN_WIDTH - time_text.get_width() - 12
         ty = icon_y + icon.get_height() + 2
         surface.blit(time_text, (tx, ty))
@@ -1055,9 +1096,8 @@ class GameplayState(State):
                 self.textbox._revealed_chars = len(self.textbox.text)
                 self.textbox._fully_revealed = True
 
-    def _draw_world(self, surface):
-        """Draw the world in standard order: tilemap, chests, items, signs, fire trails, enemies, projectiles, player, particles, HUD, textbox."""
-        self.tilemap.draw(surface, self.camera)
+    def _draw_entities(self, surface):
+        """Draw world objects and characters between the tilemap and particles."""
         for chest in self.chests:
             chest.draw(surface, self.camera)
         if hasattr(self, 'signs'):
@@ -1090,33 +1130,41 @@ class GameplayState(State):
         for ability in self.player.abilities:
             if ability.active:
                 ability.draw(surface, self.camera, self.player)
-        self.particles.draw(surface, self.camera)
+        if profiler.enabled:
+            drawn = count_on_screen(self.camera, self.chests, self.npcs, self.campfires,
+                                    self.items, self.gold_pickups, self.enemies,
+                                    self.projectiles, (self.player,))
+            if self.companion is not None:
+                drawn += 1
+            profiler.count("entities_drawn", drawn)
+
+    def _draw_world(self, surface):
+        """Draw the world in standard order: tilemap, chests, items, signs, fire trails, enemies, projectiles, player, particles, HUD, textbox."""
+        with profiler.scope("draw.tilemap"):
+            self.tilemap.draw(surface, self.camera)
+        with profiler.scope("draw.entities"):
+            self._draw_entities(surface)
+        with profiler.scope("draw.particles"):
+            self.particles.draw(surface, self.camera)
+        if self.weather is not None:
+            with profiler.scope("draw.weather"):
+                self.weather.draw(surface, self.camera)
         # Day/night overlay (drawn after entities, before HUD)
         self._draw_day_night_overlay(surface)
         # Floating texts (world-space)
         for ft in self.floating_texts:
             ft.draw(surface, self.camera)
-        self.hud.draw(surface, self.player)
-        # Time of day HUD
-        self._draw_time_hud(surface)
+        with profiler.scope("draw.hud"):
+            self.hud.draw(surface, self.player)
+            # Time of day HUD
+            self._draw_time_hud(surface)
         # Damage vignette overlay
         if self._damage_vignette_timer > 0:
             vignette_alpha = int(80 * (self._damage_vignette_timer / 0.3))
-            vig_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            # Red edges only — draw rectangles on edges
-            edge = 40
-            for i in range(edge):
-                a = int(vignette_alpha * (1 - i / edge))
-                vig_surf.fill((200, 0, 0, a), (0, i, SCREEN_WIDTH, 1))
-                vig_surf.fill((200, 0, 0, a), (0, SCREEN_HEIGHT - 1 - i, SCREEN_WIDTH, 1))
-                vig_surf.fill((200, 0, 0, a), (i, 0, 1, SCREEN_HEIGHT))
-                vig_surf.fill((200, 0, 0, a), (SCREEN_WIDTH - 1 - i, 0, 1, SCREEN_HEIGHT))
-            surface.blit(vig_surf, (0, 0))
+            overlays.draw_vignette(surface, (200, 0, 0), vignette_alpha)
         # Screen flash (boss phase change)
         if self._screen_flash_alpha > 0:
-            flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, int(self._screen_flash_alpha)))
-            surface.blit(flash_surf, (0, 0))
+            overlays.draw_fill(surface, (255, 255, 255), self._screen_flash_alpha)
         # Quest notification popup
         if self._quest_notification and self._quest_notification_timer > 0:
             self._draw_quest_notification(surface)
@@ -1151,9 +1199,6 @@ class GameplayState(State):
         if not self._achievement_popups:
             return
         from ..sprites.achievement_sprites import get_achievement_icon
-        font = pygame.font.Font(None, 24)
-        small_font = pygame.font.Font(None, 18)
-
         for i, (ach, timer) in enumerate(self._achievement_popups):
             # Calculate slide animation
             total_time = 3.0
@@ -1184,15 +1229,12 @@ class GameplayState(State):
             surface.blit(icon, (x + 6, y + (popup_h - 16) // 2))
 
             # Text
-            title = font.render(f"Achievement: {ach.name}", True, (255, 220, 50))
-            surface.blit(title, (x + 28, y + 4))
-            desc = small_font.render(ach.description, True, (200, 200, 200))
-            surface.blit(desc, (x + 28, y + 22))
+            text_cache.draw(surface, f"Achievement: {ach.name}", 24, (255, 220, 50), (x + 28, y + 4))
+            text_cache.draw(surface, ach.description, 18, (200, 200, 200), (x + 28, y + 22))
 
     def _draw_quest_notification(self, surface):
         """Draw floating quest notification banner."""
-        font = pygame.font.Font(None, 32)
-        text_surf = font.render(self._quest_notification, True, (255, 220, 50))
+        text_surf = text_cache.render(self._quest_notification, 32, (255, 220, 50))
         # Fade based on timer
         if self._quest_notification_timer > 2.0:
             alpha = int(255 * (2.5 - self._quest_notification_timer) / 0.5)
@@ -1201,12 +1243,10 @@ class GameplayState(State):
         else:
             alpha = 255
         alpha = max(0, min(255, alpha))
-        text_surf.set_alpha(alpha)
         # Draw centered near top
         x = (SCREEN_WIDTH - text_surf.get_width()) // 2
         y = 50
         # Background bar
-        bg = pygame.Surface((text_surf.get_width() + 20, text_surf.get_height() + 10), pygame.SRCALPHA)
-        bg.fill((0, 0, 0, int(alpha * 0.6)))
-        surface.blit(bg, (x - 10, y - 5))
-        surface.blit(text_surf, (x, y))
+        overlays.draw_fill(surface, (0, 0, 0), alpha * 0.6,
+                           (x - 10, y - 5, text_surf.get_width() + 20, text_surf.get_height() + 10))
+        text_cache.draw(surface, self._quest_notification, 32, (255, 220, 50), (x, y), alpha)
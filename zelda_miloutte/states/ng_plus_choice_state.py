@@ -73,6 +73,7 @@ class NGPlusChoiceState(State):
 
         def do_ng_plus():
             from .play_state import PlayState
+            self.game.forget_areas()
             play = PlayState(self.game, area_id="overworld", load_data=ng_data)
             # Restore unlocked abilities
             for ability_name in unlocked:
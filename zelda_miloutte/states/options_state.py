@@ -2,6 +2,7 @@
 
 import pygame
 from .state import State
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY, BLACK
 from ..sounds import get_sound_manager
 from ..user_settings import load_settings, save_settings
@@ -101,9 +102,7 @@ class OptionsState(State):
         if self.from_pause and len(self.game.states) >= 2:
             # Draw the state below us (could be pause which draws gameplay)
             self.game.states[-2].draw(surface)
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            surface.blit(overlay, (0, 0))
+            overlays.draw_fill(surface, (0, 0, 0), 180)
         else:
             surface.fill((20, 30, 20))
 
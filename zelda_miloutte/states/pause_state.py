@@ -1,6 +1,7 @@
 import time
 import pygame
 from .state import State
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY, GREEN
 
 
@@ -128,9 +129,7 @@ class PauseState(State):
             self.game.states[-2].draw(surface)
 
         # Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        surface.blit(overlay, (0, 0))
+        overlays.draw_fill(surface, (0, 0, 0), 160)
 
         # Title
         title = self.title_font.render("PAUSED", True, WHITE)
@@ -6,21 +6,52 @@ from ..world.tilemap import TileMap
 from ..world.maps import AREAS, DUNGEON2, DUNGEON2_SPAWNS
 from ..world.tile import TileType
 from ..hud import HUD
+from .. import text_cache
 from ..settings import (
     TILE_SIZE, BOSS2_HP, BOSS2_SPEED, BOSS2_CHASE_SPEED, BOSS2_CHARGE_SPEED, BOSS2_DAMAGE, ICE_BLUE, WHITE,
+    AREA_ENEMY_RESPAWN,
 )
 from ..sounds import get_sound_manager
 from ..particles import ParticleSystem
+from ..profiler import profiler
 
 
 class PlayState(GameplayState):
-    def __init__(self, game, area_id="overworld", load_data=None):
+    def __init__(self, game, area_id="overworld", load_data=None, deferred=False):
+        """Build the area *area_id*.
+
+        With *deferred*, construction is left to build_step() so the area
+        can be preloaded a slice at a time (see AreaPreloader).
+        """
         super().__init__(game)
         self.area_id = area_id
-
+        self.visited = False
+        self._build = self._build_steps(load_data)
+        if not deferred:
+            self.finish_build()
+
+    @property
+    def built(self):
+        return self._build is None
+
+    def build_step(self):
+        """Run one slice of a deferred build; return True once the area is built."""
+        if self._build is not None:
+            try:
+                next(self._build)
+            except StopIteration:
+                self._build = None
+        return self._build is None
+
+    def finish_build(self):
+        while not self.build_step():
+            pass
+
+    def _build_steps(self, load_data):
         # Load map and spawns from area registry
-        area_data = AREAS[area_id]
-        self.tilemap = TileMap(area_data["map"])
+        area_data = AREAS[self.area_id]
+        self.tilemap = TileMap(area_data["map"], deferred=True)
+        yield from self.tilemap.build_steps()
         spawn = area_data["spawns"]["player"]
         self.player = Player(spawn[0] * TILE_SIZE, spawn[1] * TILE_SIZE)
         self.camera = Camera(self.tilemap.pixel_width, self.tilemap.pixel_height)
@@ -30,6 +61,7 @@ class PlayState(GameplayState):
         self.projectiles = []
         self.hud = HUD()
         self.particles = ParticleSystem()
+        self.weather = self.game.weather
 
         # World map
         from ..ui.world_map import WorldMap
@@ -38,9 +70,13 @@ class PlayState(GameplayState):
         # Area name banner
         self.area_banner_timer = 2.0  # Show for 2 seconds
         self.area_name = area_data["name"]
+        yield
 
-        # Initialize enemies, items, chests, signs, and NPCs
-        self._spawn_enemies()
+        # Initialize enemies (one per step: their sprite frames are generated
+        # on first use), items, chests, signs, and NPCs
+        for enemy in self._iter_enemies():
+            self.enemies.append(enemy)
+            yield
         self._spawn_items()
         self._spawn_chests()
         self._spawn_signs()
@@ -53,48 +89,82 @@ class PlayState(GameplayState):
 
         # Restore player stats from save data
         if load_data is not None:
-            pdata = load_data.get("player", {})
-            self.player.hp = pdata.get("hp", self.player.hp)
-            self.player.max_hp = pdata.get("max_hp", self.player.max_hp)
-            self.player.mp = pdata.get("mp", self.player.mp)
-            self.player.max_mp = pdata.get("max_mp", self.player.max_mp)
-            self.player.keys = pdata.get("keys", self.player.keys)
-            self.player.level = pdata.get("level", 1)
-            self.player.xp = pdata.get("xp", 0)
-            self.player.xp_to_next = pdata.get("xp_to_next", 100)
-            self.player.base_attack = pdata.get("base_attack", 0)
-            self.player.base_defense = pdata.get("base_defense", 0)
-            self.player.gold = pdata.get("gold", 0)
-            # Restore inventory
-            if "inventory" in pdata:
-                from ..data.inventory import Inventory
-                self.player.inventory = Inventory.from_dict(pdata["inventory"])
-            # Restore unlocked abilities
-            if "unlocked_abilities" in pdata:
-                self.player.unlocked_abilities = pdata["unlocked_abilities"]
-                # Recreate ability instances from unlocked names
-                from ..abilities import create_ability
-                self.player.abilities = []
-                for ability_name in self.player.unlocked_abilities:
-                    ability = create_ability(ability_name)
-                    if ability is not None:
-                        self.player.abilities.append(ability)
-            # Restore minimap visited tiles
-            visited = load_data.get("visited_tiles")
-            if visited:
-                self.minimap.load_save_data(visited)
-            # Restore companion
-            if "companion" in load_data:
-                from ..entities.companion import create_companion
-                companion_data = load_data["companion"]
-                companion_type = companion_data.get("type", "cat")
-                self.companion = create_companion(companion_type, self.player.x - 30, self.player.y)
-                self.companion.pet_cooldown = companion_data.get("pet_cooldown", 0.0)
+            self._apply_load_data(load_data)
+
+    def _apply_load_data(self, load_data):
+        """Restore player stats, minimap and companion from save/transition data."""
+        pdata = load_data.get("player", {})
+        self.player.hp = pdata.get("hp", self.player.hp)
+        self.player.max_hp = pdata.get("max_hp", self.player.max_hp)
+        self.player.mp = pdata.get("mp", self.player.mp)
+        self.player.max_mp = pdata.get("max_mp", self.player.max_mp)
+        self.player.keys = pdata.get("keys", self.player.keys)
+        self.player.level = pdata.get("level", 1)
+        self.player.xp = pdata.get("xp", 0)
+        self.player.xp_to_next = pdata.get("xp_to_next", 100)
+        self.player.base_attack = pdata.get("base_attack", 0)
+        self.player.base_defense = pdata.get("base_defense", 0)
+        self.player.gold = pdata.get("gold", 0)
+        # Restore inventory
+        if "inventory" in pdata:
+            from ..data.inventory import Inventory
+            self.player.inventory = Inventory.from_dict(pdata["inventory"])
+        # Restore unlocked abilities
+        if "unlocked_abilities" in pdata:
+            self.player.unlocked_abilities = pdata["unlocked_abilities"]
+            # Recreate ability instances from unlocked names
+            from ..abilities import create_ability
+            self.player.abilities = []
+            for ability_name in self.player.unlocked_abilities:
+                ability = create_ability(ability_name)
+                if ability is not None:
+                    self.player.abilities.append(ability)
+        # Restore minimap visited tiles
+        visited = load_data.get("visited_tiles")
+        if visited:
+            self.minimap.load_save_data(visited)
+        # Restore companion
+        if "companion" in load_data:
+            from ..entities.companion import create_companion
+            companion_data = load_data["companion"]
+            companion_type = companion_data.get("type", "cat")
+            self.companion = create_companion(companion_type, self.player.x - 30, self.player.y)
+            self.companion.pet_cooldown = companion_data.get("pet_cooldown", 0.0)
+
+    def resume(self, load_data):
+        """Re-enter this suspended area with the arriving player's data.
+
+        The tilemap, items, chests and NPCs are kept as the player left
+        them. The player is rebuilt from *load_data* like a fresh area, and
+        enemies follow AREA_ENEMY_RESPAWN (a preloaded area that was never
+        entered keeps the enemies it was built with).
+        """
+        spawn = AREAS[self.area_id]["spawns"]["player"]
+        self.player = Player(spawn[0] * TILE_SIZE, spawn[1] * TILE_SIZE)
+        self.companion = None
+        self._apply_load_data(load_data)
+        if AREA_ENEMY_RESPAWN == "reentry" and self.visited:
+            self._spawn_enemies()
+        # Drop effects still in flight when the area was left
+        self.projectiles = []
+        self.floating_texts = []
+        self.particles.clear()
+        self.hitstop_timer = 0.0
+        self._damage_vignette_timer = 0.0
+        self._screen_flash_alpha = 0
+        self.area_banner_timer = 2.0
 
     def enter(self):
         """Called when entering this state."""
+        self.visited = True
         area_data = AREAS[self.area_id]
-        get_sound_manager().play_music(area_data["music"])
+        self.weather.set_area(self.area_id)
+        sm = get_sound_manager()
+        sm.play_music(area_data["music"])
+        # Warm up the tracks of the areas the player can walk into next,
+        # then the dungeon boss theme
+        sm.prefetch_music([AREAS[conn["area"]]["music"]
+                           for conn in area_data["connections"].values()] + ['boss'])
         # Track area visits for quest objectives
         self.game.world_state["current_area"] = self.area_id
         self.game.quest_manager.update_objective("visit", self.area_id)
@@ -106,6 +176,10 @@ class PlayState(GameplayState):
         self.fire_trails = []
 
     def _spawn_enemies(self):
+        self.enemies = list(self._iter_enemies())
+
+    def _iter_enemies(self):
+        """Yield the area's enemies from its spawn data, NG+ scaled."""
         from ..entities.enemy import Enemy
         from ..entities.archer import Archer
         from ..entities.shadow_stalker import ShadowStalker
@@ -117,7 +191,6 @@ class PlayState(GameplayState):
         from ..entities.ice_wraith import IceWraith
         from ..entities.frost_golem import FrostGolem
         from ..ng_plus import scale_enemy_stats
-        self.enemies = []
         area_spawns = AREAS[self.area_id]["spawns"]
         for edata in area_spawns.get("enemies", []):
             # Check enemy type
@@ -164,7 +237,7 @@ class PlayState(GameplayState):
                     )
                     e.chase_speed = scaled_chase
 
-            self.enemies.append(e)
+            yield e
 
     def _spawn_items(self):
         from ..entities.item import Item
@@ -276,40 +349,11 @@ class PlayState(GameplayState):
         player_tile_x = int(player.center_x / TILE_SIZE)
         player_tile_y = int(player.center_y / TILE_SIZE)
 
-        # Store player stats
-        player_data = {
-            "hp": player.hp,
-            "max_hp": player.max_hp,
-            "mp": player.mp,
-            "max_mp": player.max_mp,
-            "keys": player.keys,
-            "level": player.level,
-            "xp": player.xp,
-            "xp_to_next": player.xp_to_next,
-            "base_attack": player.base_attack,
-            "base_defense": player.base_defense,
-            "gold": player.gold,
-            "inventory": player.inventory.to_dict(),
-            "unlocked_abilities": player.unlocked_abilities,
-        }
-
-        # Carry minimap visited tiles across transitions
-        minimap_data = self.minimap.get_save_data()
-
-        # Carry companion across transitions
-        companion_data = None
-        if self.companion is not None:
-            companion_data = self.companion.to_dict()
+        # Carry player stats, minimap visited tiles and companion across
+        load_data, minimap_data = self._carry_over_data()
 
         def do_transition():
-            # Create new PlayState for target area
-            load_data = {"player": player_data}
-            if companion_data is not None:
-                load_data["companion"] = companion_data
-            new_state = PlayState(self.game, area_id=target_area, load_data=load_data)
-
-            # Carry minimap data
-            new_state.minimap.load_save_data(minimap_data)
+            new_state = self._area_state(target_area, load_data, minimap_data)
 
             # Position player on the correct edge of the new area
             target_map = AREAS[target_area]["map"]
@@ -329,10 +373,48 @@ class PlayState(GameplayState):
                 new_state.player.y = (map_height - 2) * TILE_SIZE
                 new_state.player.x = player_tile_x * TILE_SIZE
 
-            self.game.change_state(new_state)
+            self._switch_to(new_state)
 
         self.game.transition_to(do_transition)
 
+    def _carry_over_data(self):
+        """Return (load_data, minimap_data) the next area is built or resumed with."""
+        player = self.player
+        load_data = {"player": {
+            "hp": player.hp,
+            "max_hp": player.max_hp,
+            "mp": player.mp,
+            "max_mp": player.max_mp,
+            "keys": player.keys,
+            "level": player.level,
+            "xp": player.xp,
+            "xp_to_next": player.xp_to_next,
+            "base_attack": player.base_attack,
+            "base_defense": player.base_defense,
+            "gold": player.gold,
+            "inventory": player.inventory.to_dict(),
+            "unlocked_abilities": player.unlocked_abilities,
+        }}
+        if self.companion is not None:
+            load_data["companion"] = self.companion.to_dict()
+        return load_data, self.minimap.get_save_data()
+
+    def _area_state(self, area_id, load_data, minimap_data):
+        """Resume *area_id* from the area cache, or build it if it is not cached."""
+        self.game.preloader.finish(area_id)
+        state = self.game.area_cache.resume(area_id)
+        if state is None:
+            state = PlayState(self.game, area_id=area_id, load_data=load_data)
+        else:
+            state.resume(load_data)
+        state.minimap.load_save_data(minimap_data)
+        return state
+
+    def _switch_to(self, new_state):
+        """Replace this area with *new_state*, suspending this one in the area cache."""
+        self.game.change_state(new_state)
+        self.game.area_cache.suspend(self)
+
     def handle_event(self, event):
         # Shop UI intercepts all events when active
         if self.shop_ui.active:
@@ -394,6 +476,8 @@ class PlayState(GameplayState):
 
         # Update time system (overworld only, not paused during menus/dialogue)
         self.game.time_system.update(dt)
+        with profiler.scope("update.weather"):
+            self.weather.update(dt, self.player, self.enemies, self.tilemap)
 
         # Day/night gameplay effects
         self._update_night_enemies()
@@ -672,38 +756,12 @@ class PlayState(GameplayState):
         # Close world map and travel
         self.world_map.close()
 
-        # Store player stats
-        player_data = {
-            "hp": self.player.hp,
-            "max_hp": self.player.max_hp,
-            "mp": self.player.mp,
-            "max_mp": self.player.max_mp,
-            "keys": self.player.keys,
-            "level": self.player.level,
-            "xp": self.player.xp,
-            "xp_to_next": self.player.xp_to_next,
-            "base_attack": self.player.base_attack,
-            "base_defense": self.player.base_defense,
-            "gold": self.player.gold,
-            "inventory": self.player.inventory.to_dict(),
-            "unlocked_abilities": self.player.unlocked_abilities,
-        }
-
-        # Carry minimap visited tiles
-        minimap_data = self.minimap.get_save_data()
-
-        # Carry companion across fast travel
-        companion_data = None
-        if self.companion is not None:
-            companion_data = self.companion.to_dict()
+        # Carry player stats, minimap visited tiles and companion
+        load_data, minimap_data = self._carry_over_data()
 
         def do_fast_travel():
-            load_data = {"player": player_data}
-            if companion_data is not None:
-                load_data["companion"] = companion_data
-            new_state = PlayState(self.game, area_id=target_area, load_data=load_data)
-            new_state.minimap.load_save_data(minimap_data)
-            self.game.change_state(new_state)
+            new_state = self._area_state(target_area, load_data, minimap_data)
+            self._switch_to(new_state)
 
         self.game.transition_to(do_fast_travel)
 
@@ -719,13 +777,6 @@ class PlayState(GameplayState):
 
         alpha = max(0, min(255, alpha))
 
-        # Create text surface
-        font = pygame.font.Font(None, 48)
-        text_surf = font.render(self.area_name, True, WHITE)
-
-        # Apply alpha
-        text_surf.set_alpha(alpha)
-
         # Draw centered
-        rect = text_surf.get_rect(center=(surface.get_width() // 2, 100))
-        surface.blit(text_surf, rect)
+        text_cache.draw(surface, self.area_name, 48, WHITE,
+                        (surface.get_width() // 2, 100), alpha, center=True)
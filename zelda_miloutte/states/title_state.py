@@ -134,7 +134,10 @@ class TitleState(State):
         self.saves = {}
 
     def enter(self):
-        get_sound_manager().play_music('title')
+        sm = get_sound_manager()
+        sm.play_music('title')
+        # A new game starts in the overworld
+        sm.prefetch_music(['overworld'])
         self.saves = self.game.save_manager.list_saves()
 
     def _init_fonts(self):
@@ -161,6 +164,7 @@ class TitleState(State):
             "story_progress": 0,
         }
         self.game.save_data = {}
+        self.game.forget_areas()
         play = PlayState(self.game)
         self.game.change_state(play)
 
@@ -177,6 +181,7 @@ class TitleState(State):
         }
 
         from .play_state import PlayState
+        self.game.forget_areas()
         play = PlayState(self.game, load_data=data)
         self.game.change_state(play)
 
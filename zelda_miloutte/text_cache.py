@@ -0,0 +1,134 @@
+"""Shared fonts, an LRU cache of rendered strings, and glyph atlases.
+
+Fonts are created once per size and shared. render() returns the cached
+surface for a (text, size, color, antialias) key, rendering it only on a
+miss; the least recently used entries are dropped beyond TEXT_CACHE_SIZE.
+Cached surfaces are shared, so callers must not draw on them and should
+use draw() when they need a fade: it applies alpha to the shared surface
+just for that blit.
+
+Rapidly changing numbers (damage, cooldown timers) would churn the cache
+with one-off strings, so they can be drawn from a GlyphAtlas instead: every
+glyph of a small character set is rendered once into a single surface,
+and a string is drawn as one blit per character, each placed at the
+running sum of the previous glyphs' widths.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from .settings import TEXT_CACHE_SIZE
+
+# Characters in the default glyph atlas (numbers and their decorations)
+ATLAS_CHARS = "0123456789+-.,:/%!xsG "
+
+_fonts = {}
+_cache = OrderedDict()
+_atlases = {}
+stats = {"hits": 0, "misses": 0}
+
+
+def get_font(size):
+    """Return the shared default font at *size* points."""
+    font = _fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
+
+def render(text, size, color, antialias=True):
+    """Return the cached rendering of *text* (do not modify it)."""
+    key = (text, size, tuple(color), antialias)
+    surf = _cache.get(key)
+    if surf is None:
+        stats["misses"] += 1
+        surf = get_font(size).render(text, antialias, color)
+        _cache[key] = surf
+        if len(_cache) > TEXT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        stats["hits"] += 1
+        _cache.move_to_end(key)
+        if surf.get_alpha() != 255:
+            surf.set_alpha(255)
+    return surf
+
+
+def draw(surface, text, size, color, pos, alpha=255, center=False):
+    """Blit cached *text* at *pos* (its centre if *center*) and return its rect."""
+    surf = render(text, size, color)
+    if alpha < 255:
+        if alpha <= 0:
+            return pygame.Rect(pos, (0, 0))
+        surf.set_alpha(alpha)
+    rect = surf.get_rect(center=pos) if center else surf.get_rect(topleft=pos)
+    surface.blit(surf, rect)
+    return rect
+
+
+class GlyphAtlas:
+    """Glyphs of *chars* at one size and color, packed in a single surface."""
+
+    def __init__(self, size, color, chars=ATLAS_CHARS, antialias=True):
+        font = get_font(size)
+        glyphs = [(ch, font.render(ch, antialias, color)) for ch in chars]
+        self.height = font.get_height()
+        self.surface = pygame.Surface((sum(g.get_width() for _, g in glyphs), self.height),
+                                      pygame.SRCALPHA)
+        # Transparent pixels carry the glyph color so edges don't darken
+        self.surface.fill((*color[:3], 0))
+        # Each glyph's area in the atlas; its width is the glyph's advance
+        self._rects = {}
+        x = 0
+        for ch, glyph in glyphs:
+            self.surface.blit(glyph, (x, 0))
+            self._rects[ch] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+    def supports(self, text):
+        """True when every character of *text* is in the atlas."""
+        rects = self._rects
+        return all(ch in rects for ch in text)
+
+    def size(self, text):
+        """Return the (width, height) *text* occupies."""
+        rects = self._rects
+        return sum(rects[ch].width for ch in text), self.height
+
+    def draw(self, surface, text, pos, alpha=255, center=False):
+        """Blit *text* glyph by glyph at *pos* and return its rect."""
+        rect = pygame.Rect(pos, self.size(text))
+        if center:
+            rect.center = pos
+        if alpha <= 0:
+            return rect
+        atlas = self.surface
+        if atlas.get_alpha() != alpha:
+            atlas.set_alpha(alpha)
+        x, y = rect.topleft
+        blits = []
+        for ch in text:
+            area = self._rects[ch]
+            blits.append((atlas, (x, y), area))
+            x += area.width
+        surface.blits(blits, False)
+        return rect
+
+
+def get_atlas(size, color, chars=ATLAS_CHARS):
+    """Return the shared glyph atlas for (size, color, chars)."""
+    key = (size, tuple(color), chars)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(size, color, chars)
+        _atlases[key] = atlas
+    return atlas
+
+
+def clear_cache():
+    """Drop every cached rendering and atlas (fonts are kept)."""
+    _cache.clear()
+    _atlases.clear()
+    stats["hits"] = stats["misses"] = 0
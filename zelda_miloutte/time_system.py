@@ -13,6 +13,7 @@ import math
 import random
 import pygame
 from .settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from .lighting import composite_lights
 
 
 # Phase constants
@@ -37,10 +38,27 @@ NIGHT_COLOR = (10, 10, 60, 120)
 # Light radius
 LIGHT_RADIUS_DEFAULT = 100
 LIGHT_RADIUS_LANTERN = 200
+LANTERN_GLOW_COLOR = (255, 180, 80)
 
 # Star count for night sky
 STAR_COUNT = 60
 
+# Twinkle alpha steps of the cached 2px star sprites
+STAR_ALPHA_STEP = 8
+_star_cache = {}
+
+
+def _get_star_surface(size, alpha):
+    """Return the cached star disc of *size* at *alpha* (quantized)."""
+    alpha -= alpha % STAR_ALPHA_STEP
+    key = (size, alpha)
+    surf = _star_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), (size, size), size)
+        _star_cache[key] = surf
+    return surf
+
 
 class TimeSystem:
     """Manages the in-game time of day and generates visual overlays."""
@@ -164,7 +182,8 @@ class TimeSystem:
 
     # ── Drawing ──────────────────────────────────────────────────
 
-    def draw_overlay(self, surface, player_screen_x, player_screen_y, has_lantern=False):
+    def draw_overlay(self, surface, player_screen_x, player_screen_y, has_lantern=False,
+                     lights=()):
         """Draw the day/night overlay onto the given surface.
 
         Args:
@@ -172,6 +191,8 @@ class TimeSystem:
             player_screen_x: Player center X in screen space.
             player_screen_y: Player center Y in screen space.
             has_lantern: Whether the player has a lantern.
+            lights: Extra night lights as (screen_x, screen_y, radius,
+                glow_color) tuples (campfires, torches, fire projectiles).
         """
         color = self._get_overlay_color()
 
@@ -179,11 +200,9 @@ class TimeSystem:
         if color[3] <= 0:
             return
 
-        self._overlay.fill((0, 0, 0, 0))
-
         if self.is_night:
             self._draw_night_overlay(
-                self._overlay, player_screen_x, player_screen_y, has_lantern, color
+                self._overlay, player_screen_x, player_screen_y, has_lantern, color, lights
             )
         else:
             # Simple tinted overlay for dawn/dusk
@@ -191,62 +210,15 @@ class TimeSystem:
 
         surface.blit(self._overlay, (0, 0))
 
-    def _draw_night_overlay(self, overlay, px, py, has_lantern, color):
-        """Draw night overlay with light circle around player and stars."""
-        # Fill with dark night color
-        overlay.fill(color)
-
-        # Draw light radius around player by punching a gradient hole
-        radius = LIGHT_RADIUS_LANTERN if has_lantern else LIGHT_RADIUS_DEFAULT
-        light_color = (255, 200, 100) if has_lantern else (200, 200, 220)
-
-        # Create a radial gradient light mask
-        light_size = radius * 2
-        light_surf = pygame.Surface((light_size, light_size), pygame.SRCALPHA)
-
-        # Draw concentric circles from outside in, decreasing alpha to create gradient
-        steps = 20
-        for i in range(steps):
-            t = i / steps  # 0 = outermost, 1 = center
-            r = int(radius * (1.0 - t))
-            if r <= 0:
-                continue
-            # Alpha: full at edge (overlay alpha), zero at center
-            a = int(color[3] * (1.0 - t * t))  # Quadratic falloff for softer light
-            # Erase overlay pixels by blitting with special blend
-            pygame.draw.circle(
-                light_surf, (0, 0, 0, a), (radius, radius), r
-            )
-
-        # We need to subtract light from the overlay.
-        # Strategy: fill overlay, then use a per-pixel alpha surface to cut a hole.
-        # Rebuild overlay with light hole:
+    def _draw_night_overlay(self, overlay, px, py, has_lantern, color, lights=()):
+        """Draw night overlay with light around the player and other sources, and stars."""
+        # Fill with dark night color, then cut every light out of it
         overlay.fill(color)
-
-        # Create light mask: full alpha = dark, zero alpha where light is
-        for i in range(steps, 0, -1):
-            t = i / steps
-            r = int(radius * t)
-            if r <= 0:
-                continue
-            # Closer to center = less darkness
-            alpha_factor = t * t  # Quadratic: dark at edge, clear at center
-            clear_alpha = int(color[3] * (1.0 - alpha_factor))
-            circle_color = (color[0], color[1], color[2], clear_alpha)
-            pygame.draw.circle(overlay, circle_color, (int(px), int(py)), r)
-
-        # Warm glow effect for lantern
         if has_lantern:
-            glow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            glow_radius = radius + 20
-            for i in range(5):
-                t = i / 5
-                r = int(glow_radius * (1.0 - t))
-                a = int(15 * (1.0 - t))
-                pygame.draw.circle(
-                    glow_surf, (255, 180, 80, a), (int(px), int(py)), r
-                )
-            overlay.blit(glow_surf, (0, 0))
+            player_light = (px, py, LIGHT_RADIUS_LANTERN, LANTERN_GLOW_COLOR)
+        else:
+            player_light = (px, py, LIGHT_RADIUS_DEFAULT, None)
+        composite_lights(overlay, [player_light, *lights])
 
         # Draw twinkling stars
         self._draw_stars(overlay)
@@ -268,11 +240,7 @@ class TimeSystem:
             if size == 1:
                 overlay.set_at((sx, sy), (255, 255, 255, alpha))
             else:
-                star_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    star_surf, (255, 255, 255, alpha), (size, size), size
-                )
-                overlay.blit(star_surf, (sx - size, sy - size))
+                overlay.blit(_get_star_surface(size, alpha), (sx - size, sy - size))
 
     # ── Serialization ────────────────────────────────────────────
 
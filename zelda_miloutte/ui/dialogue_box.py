@@ -1,7 +1,9 @@
 """Enhanced dialogue box with NPC names, sequential messages, and choices."""
 
 import pygame
-from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY
+from .. import overlays, text_cache
+from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY, BLACK
+from .text_layout import get_layout
 
 
 class DialogueBox:
@@ -39,6 +41,7 @@ class DialogueBox:
         # Fonts (lazy-init to avoid requiring pygame.font before display exists)
         self._font = None
         self._name_font = None
+        self._name_surface = None
 
     @property
     def font(self):
@@ -65,6 +68,7 @@ class DialogueBox:
         """
         self.active = True
         self.npc_name = npc_name
+        self._name_surface = None
         self.messages = messages if isinstance(messages, list) else [messages]
         self.current_index = 0
         self.choices = choices if choices else []
@@ -156,16 +160,15 @@ class DialogueBox:
             return
 
         # Semi-transparent dark background
-        bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 200))
-        surface.blit(bg_surface, (self.x, self.y))
+        overlays.draw_fill(surface, BLACK, 200, (self.x, self.y, self.width, self.height))
 
         # White border
         pygame.draw.rect(surface, WHITE, (self.x, self.y, self.width, self.height), 2)
 
         # Draw NPC name in gold at top-left
-        name_surface = self.name_font.render(self.npc_name, True, GOLD)
-        surface.blit(name_surface, (self.x + self.padding, self.y + self.padding))
+        if self._name_surface is None:
+            self._name_surface = self.name_font.render(self.npc_name, True, GOLD)
+        surface.blit(self._name_surface, (self.x + self.padding, self.y + self.padding))
 
         # Calculate starting Y position for message text (below name)
         name_height = self.name_font.get_height()
@@ -176,13 +179,13 @@ class DialogueBox:
             self._draw_choices(surface, text_y)
         else:
             # Draw current message with word-wrapping
-            revealed_text = self._get_current_message()[:int(self._revealed_chars)]
             self._draw_wrapped_text(
                 surface,
-                revealed_text,
+                self._get_current_message(),
                 self.x + self.padding,
                 text_y,
-                self.width - 2 * self.padding
+                self.width - 2 * self.padding,
+                int(self._revealed_chars)
             )
 
         # Draw blinking indicator at bottom-right when ready to advance
@@ -219,38 +222,19 @@ class DialogueBox:
             return self.messages[self.current_index]
         return ""
 
-    def _draw_wrapped_text(self, surface, text, x, y, max_width):
+    def _draw_wrapped_text(self, surface, text, x, y, max_width, revealed=None):
         """Draw text with word wrapping.
 
+        The layout is cached, so this is one blit per visible line.
+
         Args:
             surface: The pygame surface to draw on
-            text: The text to draw
+            text: The full text (wrapped as a whole so words don't jump lines)
             x, y: Position to start drawing
             max_width: Maximum width before wrapping
+            revealed: Number of characters shown (typewriter); all if None
         """
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + word + " " if current_line else word + " "
-            test_surface = self.font.render(test_line, True, WHITE)
-
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.rstrip())
-                current_line = word + " "
-
-        if current_line:
-            lines.append(current_line.rstrip())
-
-        # Draw each line
-        line_height = self.font.get_height()
-        for i, line in enumerate(lines):
-            text_surface = self.font.render(line, True, WHITE)
-            surface.blit(text_surface, (x, y + i * line_height))
+        get_layout(text, self.font, max_width, WHITE).draw(surface, x, y, revealed)
 
     def _draw_choices(self, surface, start_y):
         """Draw the choice selection menu.
@@ -268,9 +252,7 @@ class DialogueBox:
 
             # Draw selection arrow for current choice
             if i == self.choice_index:
-                arrow_surface = self.font.render(">", True, GOLD)
-                surface.blit(arrow_surface, (x - 16, start_y + i * line_height))
+                text_cache.draw(surface, ">", 24, GOLD, (x - 16, start_y + i * line_height))
 
             # Draw choice text
-            choice_surface = self.font.render(choice, True, color)
-            surface.blit(choice_surface, (x, start_y + i * line_height))
+            text_cache.draw(surface, choice, 24, color, (x, start_y + i * line_height))
@@ -1,6 +1,10 @@
-"""Floating text that rises and fades out - used for XP gains, level ups, etc."""
+"""Floating text that rises and fades out - used for XP gains, level ups, etc.
 
-import pygame
+Numbers are drawn from a shared glyph atlas, other labels from the text
+cache, so dozens of damage numbers never render text per frame.
+"""
+
+from .. import text_cache
 
 
 class FloatingText:
@@ -16,7 +20,8 @@ class FloatingText:
         self.timer = 0.0
         self.alive = True
         self.rise_speed = 40.0  # pixels per second
-        self._font = None
+        atlas = text_cache.get_atlas(size, color)
+        self._atlas = atlas if atlas.supports(text) else None
 
     def update(self, dt):
         self.timer += dt
@@ -27,14 +32,15 @@ class FloatingText:
     def draw(self, surface, camera):
         if not self.alive:
             return
-        if self._font is None:
-            self._font = pygame.font.Font(None, self.size)
-
         alpha = max(0, int(255 * (1.0 - self.timer / self.duration)))
         sx = int(self.x - camera.x)
         sy = int(self.y - camera.y)
 
-        text_surf = self._font.render(self.text, True, self.color)
-        text_surf.set_alpha(alpha)
         # Center horizontally
-        surface.blit(text_surf, (sx - text_surf.get_width() // 2, sy))
+        if self._atlas is not None:
+            w = self._atlas.size(self.text)[0]
+            self._atlas.draw(surface, self.text, (sx - w // 2, sy), alpha)
+        else:
+            text_surf = text_cache.render(self.text, self.size, self.color)
+            text_cache.draw(surface, self.text, self.size, self.color,
+                            (sx - text_surf.get_width() // 2, sy), alpha)
@@ -1,6 +1,7 @@
 """Inventory overlay UI with grid-based item display and equipment slots."""
 
 import pygame
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY
 from ..data.inventory import EQUIP_SLOTS, get_item
 from ..sprites.item_sprites import get_inventory_icon
@@ -170,9 +171,7 @@ class InventoryUI:
         self._init_fonts()
 
         # Dim background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        overlays.draw_fill(surface, (0, 0, 0), 180)
 
         # Panel background
         panel = pygame.Surface((_PANEL_W, _PANEL_H), pygame.SRCALPHA)
@@ -1,4 +1,15 @@
-"""Minimap overlay showing current area tile layout, entities, and fog of war."""
+"""Minimap overlay showing current area tile layout, entities, and fog of war.
+
+Visited tiles are kept per area in a VisitedMap: one byte per tile in a
+bytearray, row-major. Revealing around the player returns exactly the
+cells that were newly visited, and only those cells are repainted on the
+minimap's persistent surface, where the tile colors and the fog were
+composited once when the area was first drawn. Each frame blits that
+surface and draws the entity dots and border on top.
+
+Save data stores each area as its size plus run lengths of alternating
+unvisited/visited tiles instead of a list of coordinate pairs.
+"""
 
 import pygame
 from ..settings import SCREEN_WIDTH, TILE_SIZE
@@ -36,6 +47,92 @@ TILE_COLORS = {
 }
 
 
+class VisitedMap:
+    """Visited flags for one area's tiles, one byte per tile (row-major)."""
+
+    __slots__ = ("cols", "rows", "bits", "count")
+
+    def __init__(self, cols, rows, bits=None):
+        self.cols = cols
+        self.rows = rows
+        self.bits = bits if bits is not None else bytearray(cols * rows)
+        self.count = self.bits.count(1)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, cell):
+        col, row = cell
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.bits[row * self.cols + col] == 1
+        return False
+
+    def cells(self):
+        """Yield the (col, row) of every visited tile."""
+        bits = self.bits
+        cols = self.cols
+        i = bits.find(1)
+        while i != -1:
+            yield i % cols, i // cols
+            i = bits.find(1, i + 1)
+
+    def reveal_rect(self, col0, row0, col1, row1):
+        """Mark the tiles in [col0, col1) x [row0, row1) visited.
+
+        Returns the list of (col, row) that were not visited before.
+        """
+        col0, row0 = max(0, col0), max(0, row0)
+        col1, row1 = min(self.cols, col1), min(self.rows, row1)
+        if col0 >= col1:
+            return []
+        bits = self.bits
+        width = col1 - col0
+        new_cells = []
+        for row in range(row0, row1):
+            base = row * self.cols
+            start, end = base + col0, base + col1
+            if bits.count(0, start, end) == 0:
+                continue
+            i = bits.find(0, start, end)
+            while i != -1:
+                new_cells.append((i - base, row))
+                i = bits.find(0, i + 1, end)
+            bits[start:end] = b"\x01" * width
+        self.count += len(new_cells)
+        return new_cells
+
+    def encode(self):
+        """Return JSON-friendly save data: size plus alternating run lengths.
+
+        Runs start with unvisited tiles (so the first run may be 0).
+        """
+        bits = self.bits
+        n = len(bits)
+        runs = []
+        i = 0
+        value = 0
+        while i < n:
+            j = bits.find(1 - value, i)
+            if j == -1:
+                j = n
+            runs.append(j - i)
+            i = j
+            value = 1 - value
+        return {"cols": self.cols, "rows": self.rows, "runs": runs}
+
+    @classmethod
+    def decode(cls, data):
+        """Rebuild a VisitedMap from encode() output."""
+        bits = bytearray()
+        value = 0
+        for run in data["runs"]:
+            bits += bytes([value]) * run
+            value = 1 - value
+        size = data["cols"] * data["rows"]
+        bits = bits[:size] + bytearray(max(0, size - len(bits)))
+        return cls(data["cols"], data["rows"], bits)
+
+
 class Minimap:
     """Small map overlay in the top-right corner of the HUD."""
 
@@ -43,47 +140,51 @@ class Minimap:
         self.visible = True
         self._blink_timer = 0.0
         self._player_visible = True
-        # Visited tiles: dict of area_id -> set of (col, row)
+        # Visited tiles: dict of area_id -> VisitedMap
         self.visited_tiles = {}
+        # Legacy save data (lists of [col, row]) for areas not entered yet
+        self._legacy_tiles = {}
         # Reveal radius around the player (in tiles)
         self._reveal_radius = 5
-        # Cached surfaces
+        # Persistent composite of tile colors and fog for the cached area
         self._cached_area_id = None
-        self._cached_tile_surface = None
-        self._cached_fog_surface = None
-        self._cached_visited_count = 0
+        self._cached_surface = None
         self._cached_scale = 1
-        self._cached_map_size = (0, 0)
+        self._cached_tilemap = None
 
     def toggle(self):
         """Toggle minimap visibility."""
         self.visible = not self.visible
 
+    def _visited_map(self, area_id, tilemap):
+        """Return the VisitedMap of *area_id*, sized to *tilemap*."""
+        visited = self.visited_tiles.get(area_id)
+        if visited is None or (visited.cols, visited.rows) != (tilemap.cols, tilemap.rows):
+            fresh = VisitedMap(tilemap.cols, tilemap.rows)
+            old_cells = visited.cells() if visited is not None else ()
+            for col, row in list(old_cells) + self._legacy_tiles.pop(area_id, []):
+                fresh.reveal_rect(col, row, col + 1, row + 1)
+            visited = self.visited_tiles[area_id] = fresh
+        return visited
+
     def reveal_tiles(self, area_id, player_x, player_y, tilemap):
-        """Reveal tiles around the player's position."""
-        if area_id not in self.visited_tiles:
-            self.visited_tiles[area_id] = set()
+        """Reveal tiles around the player's position.
 
-        visited = self.visited_tiles[area_id]
-        old_count = len(visited)
+        Returns the list of newly revealed (col, row) cells.
+        """
+        visited = self._visited_map(area_id, tilemap)
         player_col = int(player_x) // TILE_SIZE
         player_row = int(player_y) // TILE_SIZE
         r = self._reveal_radius
+        new_cells = visited.reveal_rect(player_col - r, player_row - r,
+                                        player_col + r + 1, player_row + r + 1)
 
-        for row in range(max(0, player_row - r), min(tilemap.rows, player_row + r + 1)):
-            for col in range(max(0, player_col - r), min(tilemap.cols, player_col + r + 1)):
-                visited.add((col, row))
-
-        # Invalidate cache if area changed or new tiles revealed
-        if self._cached_area_id != area_id:
+        if self._cached_area_id != area_id or self._cached_tilemap is not tilemap:
             self._cached_area_id = area_id
-            self._cached_tile_surface = None
-            self._cached_fog_surface = None
-            self._cached_visited_count = len(visited)
-        elif len(visited) != old_count:
-            # New tiles revealed, fog cache is stale
-            self._cached_fog_surface = None
-            self._cached_visited_count = len(visited)
+            self._cached_surface = None
+        elif new_cells and self._cached_surface is not None:
+            self._patch(new_cells, tilemap)
+        return new_cells
 
     def update(self, dt):
         """Update blink timer for player dot."""
@@ -92,12 +193,46 @@ class Minimap:
             self._blink_timer = 0.0
             self._player_visible = not self._player_visible
 
+    def _cell_rect(self, col, row):
+        scale = self._cached_scale
+        size = int(scale) if scale >= 2 else 1
+        return (int(col * scale) + 2, int(row * scale) + 2, size, size)
+
+    def _patch(self, cells, tilemap):
+        """Repaint newly revealed *cells* with their tile colors."""
+        surf = self._cached_surface
+        data = tilemap.data
+        for col, row in cells:
+            color = TILE_COLORS.get(data[row][col], (60, 60, 60))
+            surf.fill(color, self._cell_rect(col, row))
+
+    def _build_surface(self, tilemap, visited, scale):
+        """Composite the tile colors and fog of the whole area once."""
+        self._cached_scale = scale
+        self._cached_tilemap = tilemap
+        map_pixel_w = int(tilemap.cols * scale)
+        map_pixel_h = int(tilemap.rows * scale)
+        surf = pygame.Surface((map_pixel_w + 4, map_pixel_h + 4), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, MINIMAP_BG_ALPHA))
+        bits = visited.bits
+        cols = tilemap.cols
+        for row in range(tilemap.rows):
+            tile_row = tilemap.data[row]
+            base = row * cols
+            for col in range(cols):
+                if bits[base + col]:
+                    color = TILE_COLORS.get(tile_row[col], (60, 60, 60))
+                else:
+                    color = MINIMAP_FOG_COLOR
+                surf.fill(color, self._cell_rect(col, row))
+        self._cached_surface = surf
+
     def draw(self, surface, tilemap, player, enemies, chests, npcs, area_id):
         """Draw the minimap on the given surface."""
         if not self.visible:
             return
 
-        visited = self.visited_tiles.get(area_id, set())
+        visited = self._visited_map(area_id, tilemap)
 
         # Calculate scale: fit map into MINIMAP_WIDTH x MINIMAP_HEIGHT
         # Each tile = 1 pixel minimum, scale up if map is small
@@ -106,52 +241,27 @@ class Minimap:
         scale = min(scale_x, scale_y)
         scale = max(1, scale)  # At least 1 pixel per tile
 
-        map_pixel_w = int(tilemap.cols * scale)
-        map_pixel_h = int(tilemap.rows * scale)
-        map_size = (map_pixel_w, map_pixel_h)
-
-        # ── STATIC LAYER: Base tiles (cached, drawn once per area) ──
-        if self._cached_tile_surface is None or self._cached_scale != scale or self._cached_map_size != map_size:
-            # Pre-render all tiles to a cached surface
-            self._cached_tile_surface = pygame.Surface((map_pixel_w + 4, map_pixel_h + 4), pygame.SRCALPHA)
-            self._cached_tile_surface.fill((0, 0, 0, MINIMAP_BG_ALPHA))
-
-            for row in range(tilemap.rows):
-                for col in range(tilemap.cols):
-                    tile_val = tilemap.data[row][col]
-                    color = TILE_COLORS.get(tile_val, (60, 60, 60))
-                    px = int(col * scale) + 2
-                    py = int(row * scale) + 2
-                    if scale >= 2:
-                        pygame.draw.rect(self._cached_tile_surface, color, (px, py, int(scale), int(scale)))
-                    else:
-                        self._cached_tile_surface.set_at((px, py), (*color, 255))
-
-            self._cached_scale = scale
-            self._cached_map_size = map_size
-
-        # ── FOG OF WAR LAYER: Cached, updated only when new tiles revealed ──
-        if self._cached_fog_surface is None:
-            self._cached_fog_surface = pygame.Surface((map_pixel_w + 4, map_pixel_h + 4), pygame.SRCALPHA)
-            self._cached_fog_surface.fill((0, 0, 0, 0))  # Transparent base
-
-            # Draw fog over unvisited tiles
-            for row in range(tilemap.rows):
-                for col in range(tilemap.cols):
-                    if (col, row) not in visited:
-                        px = int(col * scale) + 2
-                        py = int(row * scale) + 2
-                        if scale >= 2:
-                            pygame.draw.rect(self._cached_fog_surface, MINIMAP_FOG_COLOR,
-                                           (px, py, int(scale), int(scale)))
-                        else:
-                            self._cached_fog_surface.set_at((px, py), (*MINIMAP_FOG_COLOR, 255))
-
-        # ── COMPOSITE: Combine static layers ──
-        minimap_surf = self._cached_tile_surface.copy()
-        minimap_surf.blit(self._cached_fog_surface, (0, 0))
-
-        # ── DYNAMIC LAYER: Entities (drawn every frame) ──
+        # ── STATIC LAYER: tiles + fog, patched as tiles are revealed ──
+        if (self._cached_surface is None or self._cached_area_id != area_id
+                or self._cached_scale != scale or self._cached_tilemap is not tilemap):
+            self._cached_area_id = area_id
+            self._build_surface(tilemap, visited, scale)
+        base = self._cached_surface
+        map_w, map_h = base.get_size()
+
+        # Position in top-right corner, below HUD
+        dest_x = SCREEN_WIDTH - map_w - MINIMAP_MARGIN
+        dest_y = 44  # Below the HUD bar (HUD_HEIGHT = 40 + small gap)
+        surface.blit(base, (dest_x, dest_y))
+
+        # ── DYNAMIC LAYER: Entities (drawn every frame, on top) ──
+        ox, oy = dest_x + 2, dest_y + 2
+        old_clip = surface.get_clip()
+        surface.set_clip(pygame.Rect(dest_x, dest_y, map_w, map_h).clip(old_clip))
+
+        def dot(col, row, color, size):
+            pygame.draw.rect(surface, color,
+                             (ox + int(col * scale), oy + int(row * scale), size, size))
 
         # Draw chests (yellow dots, only if visited and not opened)
         for chest in chests:
@@ -160,22 +270,14 @@ class Minimap:
             cx = int(chest.center_x / TILE_SIZE)
             cy = int(chest.center_y / TILE_SIZE)
             if (cx, cy) in visited:
-                px = int(cx * scale) + 2
-                py = int(cy * scale) + 2
-                dot_size = max(2, int(scale))
-                pygame.draw.rect(minimap_surf, (255, 215, 0, 255),
-                                 (px, py, dot_size, dot_size))
+                dot(cx, cy, (255, 215, 0), max(2, int(scale)))
 
         # Draw NPCs (blue dots)
         for npc in npcs:
             nx = int(npc.center_x / TILE_SIZE)
             ny = int(npc.center_y / TILE_SIZE)
             if (nx, ny) in visited:
-                px = int(nx * scale) + 2
-                py = int(ny * scale) + 2
-                dot_size = max(2, int(scale))
-                pygame.draw.rect(minimap_surf, (60, 140, 255, 255),
-                                 (px, py, dot_size, dot_size))
+                dot(nx, ny, (60, 140, 255), max(2, int(scale)))
 
         # Draw enemies (red dots)
         for enemy in enemies:
@@ -184,42 +286,38 @@ class Minimap:
             ex = int(enemy.center_x / TILE_SIZE)
             ey = int(enemy.center_y / TILE_SIZE)
             if (ex, ey) in visited:
-                px = int(ex * scale) + 2
-                py = int(ey * scale) + 2
-                dot_size = max(1, int(scale) - 1)
-                pygame.draw.rect(minimap_surf, (220, 40, 40, 255),
-                                 (px, py, dot_size, dot_size))
+                dot(ex, ey, (220, 40, 40), max(1, int(scale) - 1))
 
         # Draw player (white blinking dot)
         if self._player_visible:
-            player_col = int(player.center_x / TILE_SIZE)
-            player_row = int(player.center_y / TILE_SIZE)
-            px = int(player_col * scale) + 2
-            py = int(player_row * scale) + 2
-            dot_size = max(2, int(scale) + 1)
-            pygame.draw.rect(minimap_surf, (255, 255, 255, 255),
-                             (px, py, dot_size, dot_size))
+            dot(int(player.center_x / TILE_SIZE), int(player.center_y / TILE_SIZE),
+                (255, 255, 255), max(2, int(scale) + 1))
 
         # Draw border
-        pygame.draw.rect(minimap_surf, MINIMAP_BORDER_COLOR,
-                         (0, 0, map_pixel_w + 4, map_pixel_h + 4), 1)
-
-        # Position in top-right corner, below HUD
-        dest_x = SCREEN_WIDTH - map_pixel_w - 4 - MINIMAP_MARGIN
-        dest_y = 44  # Below the HUD bar (HUD_HEIGHT = 40 + small gap)
-        surface.blit(minimap_surf, (dest_x, dest_y))
+        pygame.draw.rect(surface, MINIMAP_BORDER_COLOR, (dest_x, dest_y, map_w, map_h), 1)
+        surface.set_clip(old_clip)
 
     def get_save_data(self):
-        """Return visited tiles data for saving."""
-        result = {}
-        for area_id, tiles in self.visited_tiles.items():
-            result[area_id] = list(tiles)
+        """Return visited tiles data for saving (run-length encoded per area)."""
+        result = {area_id: [list(t) for t in tiles]
+                  for area_id, tiles in self._legacy_tiles.items()}
+        for area_id, visited in self.visited_tiles.items():
+            result[area_id] = visited.encode()
         return result
 
     def load_save_data(self, data):
-        """Load visited tiles from save data."""
+        """Load visited tiles from save data.
+
+        Accepts the run-length format and the older lists of [col, row]
+        pairs, which are converted when their area is next entered.
+        """
         if data is None:
             return
         self.visited_tiles = {}
-        for area_id, tile_list in data.items():
-            self.visited_tiles[area_id] = set(tuple(t) for t in tile_list)
+        self._legacy_tiles = {}
+        self._cached_surface = None
+        for area_id, area_data in data.items():
+            if isinstance(area_data, dict):
+                self.visited_tiles[area_id] = VisitedMap.decode(area_data)
+            else:
+                self._legacy_tiles[area_id] = [tuple(t) for t in area_data]
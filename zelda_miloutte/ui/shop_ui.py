@@ -1,9 +1,11 @@
 """Shop buy/sell interface opened when interacting with merchant NPCs."""
 
 import pygame
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY, BLACK
 from ..data.inventory import get_item, ITEMS, CATEGORY_EQUIPMENT
 from ..data.shops import get_shop
+from .text_layout import get_layout
 
 
 # ── Layout constants ─────────────────────────────────────────────────
@@ -213,9 +215,7 @@ class ShopUI:
         self._ensure_fonts()
 
         # Full-screen dim overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill(_BG_COLOR)
-        surface.blit(overlay, (0, 0))
+        overlays.draw_fill(surface, _BG_COLOR[:3], _BG_COLOR[3])
 
         # Calculate layout
         total_w = SCREEN_WIDTH - _MARGIN * 2
@@ -375,26 +375,8 @@ class ShopUI:
         surface.blit(gold_big, (left_x, footer_y))
 
     def _draw_wrapped(self, surface, text, x, y, max_width, font, color):
-        """Draw word-wrapped text."""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-        for word in words:
-            test_line = current_line + word + " " if current_line else word + " "
-            test_w = font.size(test_line)[0]
-            if test_w <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.rstrip())
-                current_line = word + " "
-        if current_line:
-            lines.append(current_line.rstrip())
-
-        line_h = font.get_height()
-        for i, line in enumerate(lines):
-            surf = font.render(line, True, color)
-            surface.blit(surf, (x, y + i * line_h))
+        """Draw word-wrapped text (layout cached per text/font/width/color)."""
+        get_layout(text, font, max_width, color).draw(surface, x, y)
 
     def _draw_effect_summary(self, surface, item_def, x, y):
         """Draw a short summary of the item's effect."""
@@ -0,0 +1,108 @@
+"""Cached word-wrap layout for dialogue and description text.
+
+wrap_lines() breaks text into lines that fit a width, measuring each word
+once with Font.size (no surfaces are rendered to measure). A TextLayout
+holds the lines of one (text, font, width, color) and renders each line
+surface the first time it is drawn; get_layout() keeps recent layouts in
+an LRU cache, so text that stays on screen is laid out and rendered once
+and then costs one blit per line.
+
+A typewriter reveal is a clip of the pre-rendered lines: the text is
+wrapped in full up front, so words never jump lines as they appear.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from ..settings import LAYOUT_CACHE_SIZE
+
+_layouts = OrderedDict()
+
+
+def wrap_lines(text, font, max_width):
+    """Return [(start, line)] for *text* wrapped to *max_width* pixels.
+
+    *start* is the index of the line's first character in *text*. Lines
+    break at single spaces; a word wider than *max_width* gets a line of
+    its own.
+    """
+    space_w = font.size(" ")[0]
+    lines = []
+    start = 0
+    words = []
+    width = 0
+    pos = 0
+    for word in text.split(" "):
+        word_w = font.size(word)[0]
+        # The trailing space counts towards the width, as when the line grows
+        if words and width + word_w + space_w > max_width:
+            lines.append((start, " ".join(words)))
+            start = pos
+            words = []
+            width = 0
+        words.append(word)
+        width += word_w + space_w
+        pos += len(word) + 1
+    if words:
+        lines.append((start, " ".join(words)))
+    return lines
+
+
+class TextLayout:
+    """The wrapped lines of one text, each rendered once on first draw."""
+
+    def __init__(self, text, font, max_width, color):
+        self.text = text
+        self.font = font
+        self.color = color
+        self.lines = wrap_lines(text, font, max_width)
+        self.line_height = font.get_height()
+        self._surfaces = [None] * len(self.lines)
+
+    @property
+    def height(self):
+        """Total height of the laid-out text in pixels."""
+        return len(self.lines) * self.line_height
+
+    def _line_surface(self, i):
+        surf = self._surfaces[i]
+        if surf is None:
+            surf = self.font.render(self.lines[i][1], True, self.color)
+            self._surfaces[i] = surf
+        return surf
+
+    def draw(self, surface, x, y, revealed=None):
+        """Blit the lines at (x, y), showing only the first *revealed* chars."""
+        if revealed is None:
+            revealed = len(self.text)
+        for i, (start, line) in enumerate(self.lines):
+            shown = revealed - start
+            if shown <= 0:
+                break
+            surf = self._line_surface(i)
+            ly = y + i * self.line_height
+            if shown >= len(line):
+                surface.blit(surf, (x, ly))
+            else:
+                clip_w = self.font.size(line[:shown])[0]
+                surface.blit(surf, (x, ly), pygame.Rect(0, 0, clip_w, self.line_height))
+
+
+def get_layout(text, font, max_width, color):
+    """Return the cached TextLayout for (text, font, max_width, color)."""
+    key = (text, font, max_width, tuple(color))
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = TextLayout(text, font, max_width, color)
+        _layouts[key] = layout
+        if len(_layouts) > LAYOUT_CACHE_SIZE:
+            _layouts.popitem(last=False)
+    else:
+        _layouts.move_to_end(key)
+    return layout
+
+
+def clear_cache():
+    """Drop every cached layout."""
+    _layouts.clear()
@@ -1,7 +1,9 @@
 """Classic Zelda-style textbox for displaying dialogue."""
 
 import pygame
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK
+from .text_layout import get_layout
 
 
 class TextBox:
@@ -91,17 +93,14 @@ class TextBox:
             return
 
         # Semi-transparent dark background
-        bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 200))
-        surface.blit(bg_surface, (self.x, self.y))
+        overlays.draw_fill(surface, BLACK, 200, (self.x, self.y, self.width, self.height))
 
         # White border
         pygame.draw.rect(surface, WHITE, (self.x, self.y, self.width, self.height), 2)
 
         # Render text (word-wrapped)
-        revealed_text = self.text[:int(self._revealed_chars)]
-        self._draw_wrapped_text(surface, revealed_text, self.x + self.padding, self.y + self.padding,
-                               self.width - 2 * self.padding)
+        self._draw_wrapped_text(surface, self.text, self.x + self.padding, self.y + self.padding,
+                               self.width - 2 * self.padding, int(self._revealed_chars))
 
         # Draw blinking indicator (triangle/arrow) at bottom-right when done
         if self._fully_revealed and self._show_arrow:
@@ -115,35 +114,16 @@ class TextBox:
             ]
             pygame.draw.polygon(surface, WHITE, points)
 
-    def _draw_wrapped_text(self, surface, text, x, y, max_width):
+    def _draw_wrapped_text(self, surface, text, x, y, max_width, revealed=None):
         """Draw text with word wrapping.
 
+        The layout is cached, so this is one blit per visible line.
+
         Args:
             surface: The pygame surface to draw on
-            text: The text to draw
+            text: The full text (wrapped as a whole so words don't jump lines)
             x, y: Position to start drawing
             max_width: Maximum width before wrapping
+            revealed: Number of characters shown (typewriter); all if None
         """
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + word + " " if current_line else word + " "
-            test_surface = self.font.render(test_line, True, WHITE)
-
-            if test_surface.get_width() <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.rstrip())
-                current_line = word + " "
-
-        if current_line:
-            lines.append(current_line.rstrip())
-
-        # Draw each line
-        line_height = self.font.get_height()
-        for i, line in enumerate(lines):
-            text_surface = self.font.render(line, True, WHITE)
-            surface.blit(text_surface, (x, y + i * line_height))
+        get_layout(text, self.font, max_width, WHITE).draw(surface, x, y, revealed)
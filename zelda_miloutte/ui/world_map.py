@@ -1,6 +1,7 @@
 """Full-screen world map overlay showing area nodes, connections, and progress."""
 
 import pygame
+from .. import overlays
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, GOLD, GRAY, BLACK
 from ..world.maps import AREAS
 
@@ -125,9 +126,7 @@ class WorldMap:
         self._ensure_fonts()
 
         # Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        surface.blit(overlay, (0, 0))
+        overlays.draw_fill(surface, (0, 0, 0), 200)
 
         # Title
         title = self._title_font.render("WORLD MAP", True, WHITE)
@@ -3,6 +3,12 @@
 Weather types: CLEAR, RAIN, STORM, FOG, SANDSTORM, ASH_FALL, BLIZZARD.
 Area-specific pools determine which weather can occur in each region.
 Weather transitions gradually over 30 seconds.
+
+Particles live in a fixed-capacity ParticleSystem pool in screen space and
+are drawn as cached sprites in one batch. Solid tints and the lightning
+flash come from the shared overlays cache; the fog overlay is cached and
+only rebuilt when the weather intensity changes, its clear circle a
+precomputed mask from the lighting module.
 """
 
 import random
@@ -10,7 +16,10 @@ import math
 import pygame
 from enum import Enum
 
+from . import overlays
 from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from .particles import ParticleSystem, get_particle_sprite, ALPHA_STEP
+from .lighting import get_light_mask
 
 
 class WeatherType(Enum):
@@ -29,6 +38,7 @@ AREA_WEATHER_POOLS = {
     "forest": [WeatherType.CLEAR, WeatherType.RAIN, WeatherType.STORM, WeatherType.FOG],
     "desert": [WeatherType.CLEAR, WeatherType.SANDSTORM],
     "volcano": [WeatherType.CLEAR, WeatherType.ASH_FALL],
+    "frozen_peaks": [WeatherType.CLEAR, WeatherType.BLIZZARD],
     "ice": [WeatherType.CLEAR, WeatherType.BLIZZARD],
 }
 
@@ -42,32 +52,70 @@ TRANSITION_DURATION = 30.0
 MIN_CHANGE_INTERVAL = 180.0
 MAX_CHANGE_INTERVAL = 480.0
 
+# Fixed capacity of the weather particle pool; spawns beyond it are dropped
+WEATHER_MAX_PARTICLES = 1024
+
+# Fog clear radius is quantized to this step so its mask can be cached
+FOG_RADIUS_STEP = 4
+
+# Particle palettes (a few fixed shades keep the sprite cache small)
+RAIN_COLORS = [(100, 130, blue) for blue in range(150, 221, 10)]
+SPLASH_COLOR = (140, 160, 200)
+SAND_COLORS = [(r, g, b) for r, g, b in
+               ((180, 150, 80), (190, 160, 95), (200, 165, 100), (210, 175, 110),
+                (220, 180, 120), (195, 150, 90), (215, 170, 105), (185, 165, 115))]
+EMBER_COLORS = [(255, g, b) for g, b in ((100, 20), (130, 40), (160, 50), (180, 60))]
+ASH_COLORS = [(g, g - 10, g - 20) for g in range(120, 181, 15)]
+SNOW_COLORS = [(w - t, w - t // 2, w) for w in (200, 225, 255) for t in (0, 15, 30)]
+
+# Streak length of falling rain and blizzard snow (pixels along x, y)
+RAIN_STREAK = (1, 12)
+SNOW_STREAK = (3, 5)
+
+_streak_cache = {}
+_bolt_cache = {}
+
+
+class _ScreenSpace:
+    """Camera stand-in: weather particles already live in screen space."""
+    x = 0
+    y = 0
+
+
+_SCREEN = _ScreenSpace()
+
 
-class WeatherParticle:
-    """A single weather particle with screen-space position."""
+def _get_streak(size, color, alpha, streak):
+    key = (size, color, alpha, streak)
+    surf = _streak_cache.get(key)
+    if surf is None:
+        dx, dy = streak
+        surf = pygame.Surface((dx + size, dy + size), pygame.SRCALPHA)
+        pygame.draw.line(surf, (*color, alpha), (0, 0), (dx, dy), size)
+        _streak_cache[key] = surf
+    return surf
 
-    __slots__ = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'size', 'color', 'alive')
 
-    def __init__(self, x, y, vx, vy, color, lifetime, size):
-        self.x = float(x)
-        self.y = float(y)
-        self.vx = float(vx)
-        self.vy = float(vy)
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.alive = True
+def get_rain_sprite(size, color, alpha):
+    """Cached 1px rain streak sprite (sprite_fn for ParticleSystem.draw)."""
+    return _get_streak(1, color, alpha, RAIN_STREAK)
 
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.alive = False
-        # Kill if off screen
-        if self.x < -20 or self.x > SCREEN_WIDTH + 20 or self.y > SCREEN_HEIGHT + 20:
-            self.alive = False
+
+def get_snow_sprite(size, color, alpha):
+    """Cached blizzard streak sprite, *size* pixels wide."""
+    return _get_streak(size, color, alpha, SNOW_STREAK)
+
+
+def get_bolt_surface(alpha):
+    """Cached lightning strike flash at *alpha* (quantized)."""
+    alpha -= alpha % ALPHA_STEP
+    surf = _bolt_cache.get(alpha)
+    if surf is None:
+        surf = pygame.Surface((80, 80), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 255, 200, alpha), (40, 40), 30)
+        pygame.draw.circle(surf, (255, 255, 255, min(255, alpha + 50)), (40, 40), 15)
+        _bolt_cache[alpha] = surf
+    return surf
 
 
 class WeatherManager:
@@ -86,8 +134,8 @@ class WeatherManager:
         # Current area
         self._area_id = "overworld"
 
-        # Weather particles (screen-space)
-        self._particles = []
+        # Weather particles (screen-space, fixed-size pool)
+        self._particles = ParticleSystem(WEATHER_MAX_PARTICLES)
 
         # Spawn timers
         self._spawn_timer = 0.0
@@ -110,9 +158,10 @@ class WeatherManager:
         self.wind_dx = 1.0
         self.wind_dy = 0.0
 
-        # Fog overlay surface (cached)
+        # Cached fog overlay (per-pixel alpha, rebuilt when its
+        # (alpha, clear radius) key changes); solid tints use overlays
         self._fog_surface = None
-        self._fog_needs_update = True
+        self._fog_key = None
 
         # Paused flag (indoors/dungeons)
         self.paused = False
@@ -224,15 +273,9 @@ class WeatherManager:
         if self._strike_flash_timer > 0:
             self._strike_flash_timer -= dt
 
-        # Mark fog as needing update
-        if self.current_weather == WeatherType.FOG:
-            self._fog_needs_update = True
-
     def _update_particles(self, dt):
         """Update all weather particles."""
-        for p in self._particles:
-            p.update(dt)
-        self._particles = [p for p in self._particles if p.alive]
+        self._particles.update(dt)
 
     def _spawn_particles(self, dt):
         """Spawn weather-specific particles."""
@@ -259,88 +302,75 @@ class WeatherManager:
         # Spawn rate scales with intensity
         count_per_sec = int(200 * self.intensity)
         count = max(1, int(count_per_sec * dt))
-
-        for _ in range(count):
-            x = random.uniform(-20, SCREEN_WIDTH + 20)
-            y = random.uniform(-40, -5)
-            vx = random.uniform(30, 60)  # Slight diagonal
-            vy = random.uniform(500, 700)
-            # Blue-ish rain colors
-            blue = random.randint(150, 220)
-            color = (100, 130, blue)
-            lifetime = random.uniform(0.5, 0.9)
-            size = random.uniform(1, 2)
-            self._particles.append(WeatherParticle(x, y, vx, vy, color, lifetime, size))
+        uniform = random.uniform
+        self._particles.emit_points(
+            [uniform(-20, SCREEN_WIDTH + 20) for _ in range(count)],
+            [uniform(-40, -5) for _ in range(count)],
+            [uniform(30, 60) for _ in range(count)],   # Slight diagonal
+            [uniform(500, 700) for _ in range(count)],
+            [uniform(0.5, 0.9) for _ in range(count)],
+            [1] * count,
+            [random.choice(RAIN_COLORS) for _ in range(count)],
+        )
 
         # Splash particles on ground (less frequent)
         if random.random() < 0.3 * self.intensity * dt * 60:
-            sx = random.uniform(0, SCREEN_WIDTH)
-            sy = SCREEN_HEIGHT - random.uniform(0, 40)
-            for _ in range(random.randint(2, 4)):
-                svx = random.uniform(-30, 30)
-                svy = random.uniform(-60, -20)
-                self._particles.append(
-                    WeatherParticle(sx, sy, svx, svy, (140, 160, 200), 0.2, 1)
-                )
+            sx = uniform(0, SCREEN_WIDTH)
+            sy = SCREEN_HEIGHT - uniform(0, 40)
+            n = random.randint(2, 4)
+            self._particles.emit_points(
+                [sx] * n, [sy] * n,
+                [uniform(-30, 30) for _ in range(n)],
+                [uniform(-60, -20) for _ in range(n)],
+                [0.2] * n, [1] * n, [SPLASH_COLOR] * n,
+            )
 
     def _spawn_sandstorm(self, dt):
         """Spawn horizontal sand particles."""
         count_per_sec = int(120 * self.intensity)
         count = max(1, int(count_per_sec * dt))
-
-        for _ in range(count):
-            x = random.uniform(-30, -5)
-            y = random.uniform(0, SCREEN_HEIGHT)
-            vx = random.uniform(200, 400) * self.intensity
-            vy = random.uniform(-20, 20)
-            # Tan/brown sand colors
-            r = random.randint(180, 220)
-            g = random.randint(150, 180)
-            b = random.randint(80, 120)
-            color = (r, g, b)
-            lifetime = random.uniform(1.5, 3.0)
-            size = random.uniform(1, 3)
-            self._particles.append(WeatherParticle(x, y, vx, vy, color, lifetime, size))
+        uniform = random.uniform
+        self._particles.emit_points(
+            [uniform(-30, -5) for _ in range(count)],
+            [uniform(0, SCREEN_HEIGHT) for _ in range(count)],
+            [uniform(200, 400) * self.intensity for _ in range(count)],
+            [uniform(-20, 20) for _ in range(count)],
+            [uniform(1.5, 3.0) for _ in range(count)],
+            [uniform(1, 3) for _ in range(count)],
+            [random.choice(SAND_COLORS) for _ in range(count)],   # Tan/brown sand
+        )
 
     def _spawn_ash(self, dt):
         """Spawn slow-falling ash/ember particles."""
         count_per_sec = int(30 * self.intensity)
         count = max(1, int(count_per_sec * dt))
-
-        for _ in range(count):
-            x = random.uniform(0, SCREEN_WIDTH)
-            y = random.uniform(-20, -5)
-            vx = random.uniform(-15, 15)
-            vy = random.uniform(30, 80)
-            # Grey/orange ash colors
-            if random.random() < 0.3:
-                # Ember (warm)
-                color = (255, random.randint(100, 180), random.randint(20, 60))
-            else:
-                # Ash (grey)
-                g = random.randint(120, 180)
-                color = (g, g - 10, g - 20)
-            lifetime = random.uniform(3.0, 6.0)
-            size = random.uniform(1, 3)
-            self._particles.append(WeatherParticle(x, y, vx, vy, color, lifetime, size))
+        uniform = random.uniform
+        self._particles.emit_points(
+            [uniform(0, SCREEN_WIDTH) for _ in range(count)],
+            [uniform(-20, -5) for _ in range(count)],
+            [uniform(-15, 15) for _ in range(count)],
+            [uniform(30, 80) for _ in range(count)],
+            [uniform(3.0, 6.0) for _ in range(count)],
+            [uniform(1, 3) for _ in range(count)],
+            # Warm embers and grey ash
+            [random.choice(EMBER_COLORS if random.random() < 0.3 else ASH_COLORS)
+             for _ in range(count)],
+        )
 
     def _spawn_blizzard(self, dt):
         """Spawn fast diagonal snow/ice particles."""
         count_per_sec = int(150 * self.intensity)
         count = max(1, int(count_per_sec * dt))
-
-        for _ in range(count):
-            x = random.uniform(-30, SCREEN_WIDTH + 30)
-            y = random.uniform(-30, -5)
-            vx = random.uniform(80, 200) * self.intensity
-            vy = random.uniform(200, 400)
-            # White/light blue snow
-            white = random.randint(200, 255)
-            blue_tint = random.randint(0, 30)
-            color = (white - blue_tint, white - blue_tint // 2, white)
-            lifetime = random.uniform(1.0, 2.5)
-            size = random.uniform(1, 3)
-            self._particles.append(WeatherParticle(x, y, vx, vy, color, lifetime, size))
+        uniform = random.uniform
+        self._particles.emit_points(
+            [uniform(-30, SCREEN_WIDTH + 30) for _ in range(count)],
+            [uniform(-30, -5) for _ in range(count)],
+            [uniform(80, 200) * self.intensity for _ in range(count)],
+            [uniform(200, 400) for _ in range(count)],
+            [uniform(1.0, 2.5) for _ in range(count)],
+            [uniform(1, 3) for _ in range(count)],
+            [random.choice(SNOW_COLORS) for _ in range(count)],   # White/light blue
+        )
 
     def _update_lightning(self, dt, player, enemies, tilemap):
         """Update lightning flash and strike logic for storms."""
@@ -476,14 +506,15 @@ class WeatherManager:
         weather = self.current_weather
 
         # Draw weather particles
+        particles = self._particles
         if weather in (WeatherType.RAIN, WeatherType.STORM):
-            self._draw_rain(surface)
+            particles.draw(surface, _SCREEN, get_rain_sprite, 0.7 * self.intensity)
         elif weather == WeatherType.SANDSTORM:
-            self._draw_sandstorm(surface)
+            particles.draw(surface, _SCREEN)
         elif weather == WeatherType.ASH_FALL:
-            self._draw_ash(surface)
+            particles.draw(surface, _SCREEN, get_particle_sprite, 0.8 * self.intensity)
         elif weather == WeatherType.BLIZZARD:
-            self._draw_blizzard(surface)
+            particles.draw(surface, _SCREEN, get_snow_sprite)
 
         # Draw fog overlay
         if weather == WeatherType.FOG:
@@ -491,110 +522,41 @@ class WeatherManager:
 
         # Draw sandstorm/blizzard visibility overlay
         if weather == WeatherType.SANDSTORM:
-            self._draw_sandstorm_overlay(surface)
+            overlays.draw_fill(surface, (210, 180, 120), int(60 * self.intensity))
         elif weather == WeatherType.BLIZZARD:
-            self._draw_blizzard_overlay(surface)
+            overlays.draw_fill(surface, (220, 225, 240), int(80 * self.intensity))
 
         # Draw lightning flash (STORM)
         if self._lightning_flash_alpha > 0:
-            flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, int(self._lightning_flash_alpha)))
-            surface.blit(flash_surf, (0, 0))
+            overlays.draw_fill(surface, (255, 255, 255), int(self._lightning_flash_alpha))
 
         # Draw lightning strike indicator
         if self._strike_flash_timer > 0 and self._strike_pos and camera:
             sx = int(self._strike_pos[0] - camera.x)
             sy = int(self._strike_pos[1] - camera.y)
-            # Draw a bright bolt-like effect
-            bolt_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
             alpha = int(255 * (self._strike_flash_timer / 0.3))
-            pygame.draw.circle(bolt_surf, (255, 255, 200, alpha), (40, 40), 30)
-            pygame.draw.circle(bolt_surf, (255, 255, 255, min(255, alpha + 50)), (40, 40), 15)
-            surface.blit(bolt_surf, (sx - 40, sy - 40))
-
-    def _draw_rain(self, surface):
-        """Draw rain streaks as thin angled lines."""
-        for p in self._particles:
-            # Rain streaks are thin lines
-            end_x = p.x + p.vx * 0.02
-            end_y = p.y + p.vy * 0.02
-            alpha = int(180 * (p.lifetime / p.max_lifetime) * self.intensity)
-            alpha = max(0, min(255, alpha))
-            # Use a temporary surface for alpha
-            # For performance, draw directly without alpha for most rain
-            color = (*p.color[:3],)
-            pygame.draw.line(surface, color,
-                             (int(p.x), int(p.y)),
-                             (int(end_x), int(end_y)), 1)
-
-    def _draw_sandstorm(self, surface):
-        """Draw sandstorm particles as small circles."""
-        for p in self._particles:
-            alpha = p.lifetime / p.max_lifetime
-            size = max(1, int(p.size * alpha))
-            # Draw as small rect for performance
-            pygame.draw.circle(surface, p.color,
-                               (int(p.x), int(p.y)), size)
-
-    def _draw_ash(self, surface):
-        """Draw ash particles as small glowing dots."""
-        for p in self._particles:
-            alpha = p.lifetime / p.max_lifetime
-            size = max(1, int(p.size * alpha))
-            temp = pygame.Surface((size * 2 + 2, size * 2 + 2), pygame.SRCALPHA)
-            a = int(200 * alpha * self.intensity)
-            pygame.draw.circle(temp, (*p.color, a), (size + 1, size + 1), size)
-            surface.blit(temp, (int(p.x) - size - 1, int(p.y) - size - 1))
-
-    def _draw_blizzard(self, surface):
-        """Draw blizzard particles as white streaks."""
-        for p in self._particles:
-            end_x = p.x + p.vx * 0.015
-            end_y = p.y + p.vy * 0.015
-            pygame.draw.line(surface, p.color,
-                             (int(p.x), int(p.y)),
-                             (int(end_x), int(end_y)), max(1, int(p.size)))
+            surface.blit(get_bolt_surface(alpha), (sx - 40, sy - 40))
 
     def _draw_fog(self, surface, camera):
         """Draw fog overlay with reduced visibility around player."""
-        fog = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         fog_alpha = int(160 * self.intensity)
-        fog.fill((200, 200, 210, fog_alpha))
-
-        if camera:
-            # Create a clear circle around the screen center (player)
-            center_x = SCREEN_WIDTH // 2
-            center_y = SCREEN_HEIGHT // 2
-            clear_radius = int(150 * (1.0 - self.intensity * 0.3))
-            fade_radius = clear_radius + 80
-
-            # Draw concentric circles of decreasing alpha to create gradient
-            for r in range(fade_radius, clear_radius, -4):
-                t = (r - clear_radius) / (fade_radius - clear_radius)
-                circle_alpha = int(fog_alpha * (1.0 - t))
-                pygame.draw.circle(fog, (200, 200, 210, circle_alpha),
-                                   (center_x, center_y), r)
-
-            # Clear inner circle
-            pygame.draw.circle(fog, (0, 0, 0, 0), (center_x, center_y), clear_radius)
-
-        surface.blit(fog, (0, 0))
-
-    def _draw_sandstorm_overlay(self, surface):
-        """Draw semi-transparent tan overlay for sandstorm reduced visibility."""
-        overlay_alpha = int(60 * self.intensity)
-        if overlay_alpha > 0:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((210, 180, 120, overlay_alpha))
-            surface.blit(overlay, (0, 0))
-
-    def _draw_blizzard_overlay(self, surface):
-        """Draw semi-transparent white overlay for blizzard reduced visibility."""
-        overlay_alpha = int(80 * self.intensity)
-        if overlay_alpha > 0:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((220, 225, 240, overlay_alpha))
-            surface.blit(overlay, (0, 0))
+        clear_radius = int(150 * (1.0 - self.intensity * 0.3))
+        clear_radius -= clear_radius % FOG_RADIUS_STEP
+        key = (fog_alpha, clear_radius if camera else None)
+        if key != self._fog_key:
+            if self._fog_surface is None:
+                self._fog_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            fog = self._fog_surface
+            fog.fill((200, 200, 210, fog_alpha))
+            if camera:
+                # Clear circle around the screen center (player), fading out
+                # linearly over 80px
+                fade_radius = clear_radius + 80
+                mask = get_light_mask(fade_radius, 1.0, inner=clear_radius)
+                fog.blit(mask, (SCREEN_WIDTH // 2 - fade_radius, SCREEN_HEIGHT // 2 - fade_radius),
+                         special_flags=pygame.BLEND_RGBA_MULT)
+            self._fog_key = key
+        surface.blit(self._fog_surface, (0, 0))
 
     def get_weather_dialogue(self):
         """Return a weather-related dialogue line for NPCs.
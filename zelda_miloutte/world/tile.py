@@ -44,11 +44,7 @@ class TileType(Enum):
 
     @property
     def solid(self):
-        return self in (
-            TileType.WALL, TileType.TREE, TileType.ROCK, TileType.WATER, TileType.PIT,
-            TileType.BARRIER_RED, TileType.BARRIER_BLUE, TileType.FROZEN_WALL,
-            TileType.CRACKED_WALL,
-        )
+        return self in SOLID_TILES
 
     @property
     def color(self):
@@ -84,3 +80,14 @@ class TileType(Enum):
             TileType.WATERFALL: WATER_BLUE,
             TileType.DUNGEON_3D_ENTRANCE: (160, 80, 200),
         }[self]
+
+
+# Tiles that block movement
+SOLID_TILES = frozenset((
+    TileType.WALL, TileType.TREE, TileType.ROCK, TileType.WATER, TileType.PIT,
+    TileType.BARRIER_RED, TileType.BARRIER_BLUE, TileType.FROZEN_WALL,
+    TileType.CRACKED_WALL,
+))
+
+# Tiles that enemies should avoid (hazards they are aware of)
+HAZARD_TILES = frozenset((TileType.WATER, TileType.LAVA, TileType.SPIKES, TileType.PIT))
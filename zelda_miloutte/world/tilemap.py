@@ -1,32 +1,69 @@
 import pygame
 from ..settings import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
-from .tile import TileType
+from .tile import TileType, SOLID_TILES, HAZARD_TILES
 from ..sprites.tile_sprites import get_tile_surface, get_tile_surface_variant
+from ..profiler import profiler
+
+# Tiles per side of a pre-rendered chunk surface
+CHUNK_SIZE = 8
+CHUNK_PX = CHUNK_SIZE * TILE_SIZE
 
 
 class TileMap:
-    def __init__(self, map_data):
+    def __init__(self, map_data, deferred=False):
+        """Build the map from *map_data* (rows of tile values).
+
+        With *deferred*, only the dimensions are set up and the grids are
+        filled by iterating build_steps(), one row per step, so an area can
+        be preloaded in small slices.
+        """
         self.data = map_data
         self.rows = len(map_data)
         self.cols = len(map_data[0]) if self.rows > 0 else 0
         self.pixel_width = self.cols * TILE_SIZE
         self.pixel_height = self.rows * TILE_SIZE
 
-        # Pre-build tile type grid
+        # Tile type grid and its per-position variant surfaces
         self.tiles = []
-        for row in map_data:
-            tile_row = []
-            for val in row:
-                tile_row.append(TileType(val))
+        self._tile_surface_grid = []
+
+        # Flat row-major flag grids (index = row * cols + col), kept in sync
+        # by set_tiles, for the collision and pathfinding hot paths
+        n = self.rows * self.cols
+        self.solid_grid = bytearray(n)
+        self.hazard_grid = bytearray(n)
+        self.walkable_grid = bytearray(n)  # neither solid nor a hazard (enemies)
+
+        # Baked chunk surfaces keyed by (chunk_col, chunk_row), built on first draw
+        self._chunk_cache = {}
+
+        # Bumped whenever tiles change so derived data (flow fields) can go stale
+        self.revision = 0
+
+        if not deferred:
+            for _ in self.build_steps():
+                pass
+
+    def build_steps(self):
+        """Fill the tile, flag and surface grids, yielding after each row."""
+        cols = self.cols
+        for r in range(len(self.tiles), self.rows):
+            row = self.data[r]
+            tile_row = [TileType(val) for val in row]
+            for c, tile in enumerate(tile_row):
+                self._update_flags(r * cols + c, tile)
             self.tiles.append(tile_row)
+            self._tile_surface_grid.append(
+                [get_tile_surface_variant(val, c, r) for c, val in enumerate(row)])
+            yield
 
-        # Pre-build tile variant surfaces per position
-        self._tile_surface_grid = []
-        for r, row in enumerate(map_data):
-            surf_row = []
-            for c, val in enumerate(row):
-                surf_row.append(get_tile_surface_variant(val, c, r))
-            self._tile_surface_grid.append(surf_row)
+    def bake_steps(self):
+        """Bake every chunk not built yet, yielding after each one."""
+        for chunk_row in range((self.rows + CHUNK_SIZE - 1) // CHUNK_SIZE):
+            for chunk_col in range((self.cols + CHUNK_SIZE - 1) // CHUNK_SIZE):
+                if (chunk_col, chunk_row) not in self._chunk_cache:
+                    self._build_chunk(chunk_col, chunk_row)
+                    yield
 
     def get_tile(self, col, row):
         if 0 <= row < self.rows and 0 <= col < self.cols:
@@ -40,8 +77,83 @@ class TileMap:
             return self.tiles[row][col]
         return None
 
+    def _update_flags(self, index, tile):
+        solid = tile in SOLID_TILES
+        hazard = tile in HAZARD_TILES
+        self.solid_grid[index] = solid
+        self.hazard_grid[index] = hazard
+        self.walkable_grid[index] = not (solid or hazard)
+
     def is_solid(self, col, row):
-        return self.get_tile(col, row).solid
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.solid_grid[row * self.cols + col] == 1
+        return True  # Out of bounds is solid
+
+    def is_hazard(self, col, row):
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.hazard_grid[row * self.cols + col] == 1
+        return False
+
+    def is_walkable(self, col, row):
+        """True if an enemy may step on (col, row): in bounds, not solid, not a hazard."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.walkable_grid[row * self.cols + col] == 1
+        return False
+
+    def set_tile(self, col, row, tile_type):
+        """Change the tile at (col, row)."""
+        self.set_tiles([(col, row, tile_type)])
+
+    def set_tiles(self, changes):
+        """Apply a batch of (col, row, tile_type) changes.
+
+        Only the changed cells are re-rendered: each one is patched in place
+        inside its baked chunk (chunks not yet built pick it up when built).
+        Returns the list of (col, row) cells that actually changed.
+        """
+        changed = []
+        for col, row, tile_type in changes:
+            if self.tiles[row][col] == tile_type:
+                continue
+            self.tiles[row][col] = tile_type
+            self.data[row][col] = tile_type.value
+            self._update_flags(row * self.cols + col, tile_type)
+            tile_surf = get_tile_surface_variant(tile_type.value, col, row)
+            self._tile_surface_grid[row][col] = tile_surf
+            chunk = self._chunk_cache.get((col // CHUNK_SIZE, row // CHUNK_SIZE))
+            if chunk is not None:
+                pos = ((col % CHUNK_SIZE) * TILE_SIZE, (row % CHUNK_SIZE) * TILE_SIZE)
+                chunk.fill((0, 0, 0, 0), (pos, (TILE_SIZE, TILE_SIZE)))
+                chunk.blit(tile_surf, pos)
+            changed.append((col, row))
+        if changed:
+            self.revision += 1
+        return changed
+
+    def find_tiles(self, tile_types):
+        """Return {tile_type: [(col, row), ...]} for every cell of the given types."""
+        found = {tile_type: [] for tile_type in tile_types}
+        for row, tile_row in enumerate(self.tiles):
+            for col, tile in enumerate(tile_row):
+                if tile in found:
+                    found[tile].append((col, row))
+        return found
+
+    def _build_chunk(self, chunk_col, chunk_row):
+        """Bake the tiles of one chunk into a single surface."""
+        start_col = chunk_col * CHUNK_SIZE
+        start_row = chunk_row * CHUNK_SIZE
+        end_col = min(self.cols, start_col + CHUNK_SIZE)
+        end_row = min(self.rows, start_row + CHUNK_SIZE)
+        surf = pygame.Surface(((end_col - start_col) * TILE_SIZE,
+                               (end_row - start_row) * TILE_SIZE), pygame.SRCALPHA)
+        for row in range(start_row, end_row):
+            surf_row = self._tile_surface_grid[row]
+            y = (row - start_row) * TILE_SIZE
+            for col in range(start_col, end_col):
+                surf.blit(surf_row[col], ((col - start_col) * TILE_SIZE, y))
+        self._chunk_cache[(chunk_col, chunk_row)] = surf
+        return surf
 
     def resolve_collision_x(self, entity):
         rect = entity.rect
@@ -51,9 +163,10 @@ class TileMap:
         top_row = rect.top // TILE_SIZE
         bottom_row = rect.bottom // TILE_SIZE
 
+        is_solid = self.is_solid
         for row in range(top_row, bottom_row + 1):
             for col in range(left_col, right_col + 1):
-                if self.is_solid(col, row):
+                if is_solid(col, row):
                     tile_rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE,
                                             TILE_SIZE, TILE_SIZE)
                     if rect.colliderect(tile_rect):
@@ -70,9 +183,10 @@ class TileMap:
         top_row = rect.top // TILE_SIZE
         bottom_row = rect.bottom // TILE_SIZE
 
+        is_solid = self.is_solid
         for row in range(top_row, bottom_row + 1):
             for col in range(left_col, right_col + 1):
-                if self.is_solid(col, row):
+                if is_solid(col, row):
                     tile_rect = pygame.Rect(col * TILE_SIZE, row * TILE_SIZE,
                                             TILE_SIZE, TILE_SIZE)
                     if rect.colliderect(tile_rect):
@@ -83,14 +197,20 @@ class TileMap:
                         rect = entity.rect
 
     def draw(self, surface, camera):
-        # Only draw visible tiles
-        start_col = max(0, int(camera.x) // TILE_SIZE)
-        end_col = min(self.cols, (int(camera.x) + SCREEN_WIDTH) // TILE_SIZE + 2)
-        start_row = max(0, int(camera.y) // TILE_SIZE)
-        end_row = min(self.rows, (int(camera.y) + SCREEN_HEIGHT) // TILE_SIZE + 2)
+        # Only draw chunks that intersect the screen
+        cam_x = int(camera.x)
+        cam_y = int(camera.y)
+        start_cc = max(0, cam_x // CHUNK_PX)
+        end_cc = min((self.cols - 1) // CHUNK_SIZE, (cam_x + SCREEN_WIDTH) // CHUNK_PX)
+        start_cr = max(0, cam_y // CHUNK_PX)
+        end_cr = min((self.rows - 1) // CHUNK_SIZE, (cam_y + SCREEN_HEIGHT) // CHUNK_PX)
 
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                x = col * TILE_SIZE - int(camera.x)
-                y = row * TILE_SIZE - int(camera.y)
-                surface.blit(self._tile_surface_grid[row][col], (x, y))
+        cache = self._chunk_cache
+        for chunk_row in range(start_cr, end_cr + 1):
+            y = chunk_row * CHUNK_PX - cam_y
+            for chunk_col in range(start_cc, end_cc + 1):
+                chunk = cache.get((chunk_col, chunk_row))
+                if chunk is None:
+                    chunk = self._build_chunk(chunk_col, chunk_row)
+                surface.blit(chunk, (chunk_col * CHUNK_PX - cam_x, y))
+        profiler.count("blits", max(0, end_cr - start_cr + 1) * max(0, end_cc - start_cc + 1))